@@ -13,7 +13,8 @@ import sys
 import json
 import re
 import base64
-import time
+import random
+import asyncio
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
@@ -25,6 +26,7 @@ except ImportError:
     HAS_ANTHROPIC = False
 
 from framework_loader import Framework, FrameworkItem
+from rate_limiter import get_rate_limiter
 
 sys.stdout.reconfigure(line_buffering=True)
 
@@ -43,6 +45,10 @@ class ClaudeAnalyzer:
     # 모델 설정
     DEFAULT_MODEL = "claude-3-5-haiku-20241022"
     
+    # 일시적 오류(5xx/529 과부하/연결 오류) 재시도 대기: 2초부터 2배씩, 최대 60초
+    TRANSIENT_RETRY_BASE = 2.0
+    TRANSIENT_RETRY_MAX = 60.0
+    
     # 분석 결과 템플릿 (확장 버전)
     RESULT_TEMPLATE = {
         "level": 0,  # 0: 언급없음, 1: 정성적, 2: 정량적
@@ -70,6 +76,18 @@ class ClaudeAnalyzer:
         self.model_name = model_name or self.DEFAULT_MODEL
         self.client = None
         self.last_analysis_method = None  # 마지막 분석 방식 기록
+        self.rate_limiter = get_rate_limiter(self.model_name)
+        self._system_blocks: Dict[str, List[Dict[str, Any]]] = {}  # Framework 버전별 시스템 프롬프트
+        
+        # 실행 단위 토큰 사용량 / 프롬프트 캐시 통계
+        self.usage = {
+            'requests': 0,
+            'cache_hits': 0,
+            'input_tokens': 0,
+            'output_tokens': 0,
+            'cache_creation_input_tokens': 0,
+            'cache_read_input_tokens': 0,
+        }
         
         if not HAS_ANTHROPIC:
             log("[ERROR] anthropic 패키지가 설치되지 않았습니다.")
@@ -87,7 +105,8 @@ class ClaudeAnalyzer:
             key_prefix = self.api_key[:8] if len(self.api_key) > 8 else "???"
             log(f"Claude API 키 확인: {key_prefix}...")
             
-            self.client = anthropic.Anthropic(api_key=self.api_key)
+            # 재시도/대기는 _request에서 rate_limiter와 함께 관리하므로 SDK 자체 재시도는 끔
+            self.client = anthropic.AsyncAnthropic(api_key=self.api_key, max_retries=0)
             log(f"Claude 클라이언트 초기화 완료: {self.model_name}")
         except Exception as e:
             log(f"[ERROR] Claude 클라이언트 초기화 실패: {e}")
@@ -162,6 +181,52 @@ class ClaudeAnalyzer:
         
         return prompt
     
+    def _get_system_blocks(self, framework: Framework) -> List[Dict[str, Any]]:
+        """
+        캐시 가능한 시스템 프롬프트 블록 (Framework 버전별로 한 번만 생성)
+        
+        시스템 프롬프트는 모든 공시에 동일하므로 cache_control 지점을 두어
+        두 번째 요청부터는 캐시된 prefix로 처리되게 함.
+        
+        Args:
+            framework: 분석 프레임워크
+            
+        Returns:
+            messages.create의 system 파라미터
+        """
+        key = framework.version or f"id:{id(framework)}"
+        if key not in self._system_blocks:
+            self._system_blocks[key] = [
+                {
+                    "type": "text",
+                    "text": self._build_system_prompt(framework),
+                    "cache_control": {"type": "ephemeral"}
+                }
+            ]
+        return self._system_blocks[key]
+    
+    def _record_usage(self, response):
+        """응답의 usage를 실행 통계에 누적"""
+        usage = getattr(response, 'usage', None)
+        if usage is None:
+            return
+        
+        self.usage['requests'] += 1
+        for field in ('input_tokens', 'output_tokens', 'cache_creation_input_tokens', 'cache_read_input_tokens'):
+            self.usage[field] += getattr(usage, field, None) or 0
+        
+        cache_read = getattr(usage, 'cache_read_input_tokens', None) or 0
+        if cache_read:
+            self.usage['cache_hits'] += 1
+        log(f"    → 토큰: 입력 {usage.input_tokens:,}, 출력 {usage.output_tokens:,}, 캐시 읽기 {cache_read:,}")
+    
+    def usage_summary(self) -> str:
+        """토큰 사용량 / 프롬프트 캐시 요약 문자열"""
+        u = self.usage
+        return (f"요청 {u['requests']}건 (캐시 적중 {u['cache_hits']}건), "
+                f"입력 {u['input_tokens']:,} + 캐시 생성 {u['cache_creation_input_tokens']:,} "
+                f"+ 캐시 읽기 {u['cache_read_input_tokens']:,}, 출력 {u['output_tokens']:,} 토큰")
+    
     def _build_user_prompt(self, pdf_text: str, company_name: str, framework: Framework) -> str:
         """
         사용자 프롬프트 생성
@@ -321,21 +386,23 @@ class ClaudeAnalyzer:
         
         return prompt
     
-    def analyze(
+    async def analyze(
         self, 
         pdf_bytes: Optional[bytes] = None,
         pdf_text: Optional[str] = None,
         company_name: str = "Unknown",
-        framework: Optional[Framework] = None
+        framework: Optional[Framework] = None,
+        estimated_tokens: int = 0
     ) -> Optional[Dict[str, Any]]:
         """
-        밸류업 공시 분석
+        밸류업 공시 분석 (여러 건을 동시에 호출해도 rate_limiter가 한도 내로 조절)
         
         Args:
             pdf_bytes: PDF 바이너리 데이터 (선택)
             pdf_text: PDF 추출 텍스트 (선택)
             company_name: 회사명
             framework: 분석 프레임워크
+            estimated_tokens: 예상 입력 토큰 수 (토큰 버킷 예약용)
             
         Returns:
             분석 결과 딕셔너리 또는 None
@@ -353,17 +420,18 @@ class ClaudeAnalyzer:
             return None
         
         result = None
+        method = None
         
         # 1. PDF 직접 전달 우선 시도 (Claude의 문서 이해 기능 활용)
         if pdf_bytes:
             log(f"  [방식1] PDF 직접 전달 시도 ({len(pdf_bytes):,} bytes)...")
             sys.stdout.flush()
             
-            result = self._analyze_with_pdf(pdf_bytes, company_name, framework, max_retries=3)
+            result = await self._analyze_with_pdf(pdf_bytes, company_name, framework, estimated_tokens, max_retries=3)
             sys.stdout.flush()
             
             if result:
-                self.last_analysis_method = "PDF_DIRECT"
+                method = "PDF_DIRECT"
                 log("  ✓ PDF 직접 전달 성공!")
                 sys.stdout.flush()
             else:
@@ -375,11 +443,11 @@ class ClaudeAnalyzer:
             log(f"  [방식2] 텍스트 전달 시도 ({len(pdf_text):,} 글자)...")
             sys.stdout.flush()
             
-            result = self._analyze_with_text(pdf_text, company_name, framework, max_retries=3)
+            result = await self._analyze_with_text(pdf_text, company_name, framework, estimated_tokens, max_retries=3)
             sys.stdout.flush()
             
             if result:
-                self.last_analysis_method = "TEXT_FALLBACK"
+                method = "TEXT_FALLBACK"
                 log("  ✓ 텍스트 전달 성공!")
                 sys.stdout.flush()
             else:
@@ -388,6 +456,7 @@ class ClaudeAnalyzer:
         
         # 결과 통계 출력
         if result:
+            self.last_analysis_method = method
             items_mentioned = sum(
                 1 for item_id, data in result.get('analysis_items', {}).items()
                 if data.get('level', 0) > 0
@@ -397,145 +466,134 @@ class ClaudeAnalyzer:
                 if item.is_core and result.get('analysis_items', {}).get(item.item_id, {}).get('level', 0) > 0
             )
             
-            log(f"  분석 완료 [{self.last_analysis_method}]: "
+            log(f"  분석 완료 [{method}]: "
                 f"{items_mentioned}개 항목 언급, {core_mentioned}개 Core 항목")
             sys.stdout.flush()
         
         return result
     
-    def _analyze_with_text(
+    async def _analyze_with_text(
         self, 
         pdf_text: str, 
         company_name: str, 
         framework: Framework,
+        estimated_tokens: int = 0,
         max_retries: int = 3
     ) -> Optional[Dict[str, Any]]:
         """
-        텍스트로 분석 (Retry 로직 포함)
+        텍스트로 분석
         
         Args:
             pdf_text: PDF 추출 텍스트
             company_name: 회사명
             framework: 분석 프레임워크
+            estimated_tokens: 예상 입력 토큰 수
             max_retries: 최대 재시도 횟수
             
         Returns:
             분석 결과 또는 None
         """
-        system_prompt = self._build_system_prompt(framework)
+        system_blocks = self._get_system_blocks(framework)
         user_prompt = self._build_user_prompt(pdf_text, company_name, framework)
         
         log(f"    → 프롬프트 길이: {len(user_prompt):,}자")
         
-        for attempt in range(max_retries):
-            try:
-                log(f"    → Claude API 호출 중... (시도 {attempt + 1}/{max_retries})")
-                
-                response = self.client.messages.create(
-                    model=self.model_name,
-                    max_tokens=8192,
-                    system=system_prompt,
-                    messages=[
-                        {"role": "user", "content": user_prompt}
-                    ]
-                )
-                
-                if not response or not response.content:
-                    log("    → Claude 응답이 비어있습니다.")
-                    return None
-                
-                response_text = response.content[0].text
-                log(f"    → 응답 수신 완료: {len(response_text):,}자")
-                
-                return self._parse_response(response_text)
-                
-            except anthropic.RateLimitError as e:
-                error_str = str(e)
-                # 오류 상세 메시지 출력 (처음 1회만)
-                if attempt == 0:
-                    log(f"    → Rate Limit 오류 상세: {error_str[:300]}...")
-                
-                wait_time = self._parse_retry_delay(error_str)
-                
-                if attempt < max_retries - 1:
-                    log(f"    → Rate Limit 발생, {wait_time}초 대기 후 재시도...")
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    log(f"    → Rate Limit: 최대 재시도 횟수({max_retries}) 초과")
-                    return None
-                    
-            except anthropic.APIError as e:
-                log(f"    → Claude API 오류: {type(e).__name__}: {e}")
-                return None
-                
-            except Exception as e:
-                log(f"    → 텍스트 분석 오류: {type(e).__name__}: {e}")
-                import traceback
-                log(f"    → 스택 트레이스: {traceback.format_exc()[:500]}")
-                return None
-        
-        return None
+        return await self._request(
+            system_blocks, user_prompt, estimated_tokens, max_retries, error_label="텍스트 분석 오류"
+        )
     
-    def _analyze_with_pdf(
+    async def _analyze_with_pdf(
         self, 
         pdf_bytes: bytes, 
         company_name: str, 
         framework: Framework,
+        estimated_tokens: int = 0,
         max_retries: int = 3
     ) -> Optional[Dict[str, Any]]:
         """
-        PDF 직접 전달로 분석 (Retry 로직 포함)
+        PDF 직접 전달로 분석
         
         Args:
             pdf_bytes: PDF 바이너리 데이터
             company_name: 회사명
             framework: 분석 프레임워크
+            estimated_tokens: 예상 입력 토큰 수
             max_retries: 최대 재시도 횟수
             
         Returns:
             분석 결과 또는 None
         """
-        system_prompt = self._build_system_prompt(framework)
+        system_blocks = self._get_system_blocks(framework)
         user_prompt = self._build_user_prompt_for_pdf(company_name, framework)
         
         # PDF를 base64로 인코딩
         log("    → PDF Base64 인코딩 중...")
         pdf_base64 = base64.standard_b64encode(pdf_bytes).decode('utf-8')
         
+        content = [
+            {
+                "type": "document",
+                "source": {
+                    "type": "base64",
+                    "media_type": "application/pdf",
+                    "data": pdf_base64
+                }
+            },
+            {
+                "type": "text",
+                "text": user_prompt
+            }
+        ]
+        
+        return await self._request(
+            system_blocks, content, estimated_tokens, max_retries, error_label="PDF 직접 전달 오류"
+        )
+    
+    async def _request(
+        self,
+        system_blocks: List[Dict[str, Any]],
+        content: Any,
+        estimated_tokens: int,
+        max_retries: int,
+        error_label: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Claude API 호출 (rate_limiter 슬롯 안에서 호출)
+        
+        - 429: Retry-After만큼 같은 모델의 모든 요청을 보류 후 재시도
+        - 529(과부하): 지수 백오프만큼 같은 모델의 모든 요청을 보류 후 재시도
+        - 그 외 5xx/연결 오류: 이 요청만 지수 백오프 후 재시도
+        - 4xx 등 나머지 오류: 재시도 없이 실패
+        
+        Args:
+            system_blocks: 시스템 프롬프트 블록 (cache_control 포함)
+            content: 사용자 메시지 content (문자열 또는 블록 리스트)
+            estimated_tokens: 예상 입력 토큰 수
+            max_retries: 최대 재시도 횟수
+            error_label: 일반 오류 로그 접두어
+            
+        Returns:
+            분석 결과 또는 None
+        """
         for attempt in range(max_retries):
             try:
-                log(f"    → Claude API 호출 중... (시도 {attempt + 1}/{max_retries})")
-                
-                response = self.client.messages.create(
-                    model=self.model_name,
-                    max_tokens=8192,
-                    system=system_prompt,
-                    messages=[
-                        {
-                            "role": "user",
-                            "content": [
-                                {
-                                    "type": "document",
-                                    "source": {
-                                        "type": "base64",
-                                        "media_type": "application/pdf",
-                                        "data": pdf_base64
-                                    }
-                                },
-                                {
-                                    "type": "text",
-                                    "text": user_prompt
-                                }
-                            ]
-                        }
-                    ]
-                )
+                async with self.rate_limiter.slot(estimated_tokens):
+                    log(f"    → Claude API 호출 중... (시도 {attempt + 1}/{max_retries})")
+                    
+                    response = await self.client.messages.create(
+                        model=self.model_name,
+                        max_tokens=8192,
+                        system=system_blocks,
+                        messages=[
+                            {"role": "user", "content": content}
+                        ]
+                    )
                 
                 if not response or not response.content:
                     log("    → Claude 응답이 비어있습니다.")
                     return None
                 
+                self._record_usage(response)
                 response_text = response.content[0].text
                 log(f"    → 응답 수신 완료: {len(response_text):,}자")
                 
@@ -543,31 +601,70 @@ class ClaudeAnalyzer:
                 
             except anthropic.RateLimitError as e:
                 error_str = str(e)
+                # 오류 상세 메시지 출력 (처음 1회만)
                 if attempt == 0:
                     log(f"    → Rate Limit 오류 상세: {error_str[:300]}...")
                 
+                # Retry-After 헤더가 있으면 우선 사용
+                response = getattr(e, 'response', None)
+                retry_after = response.headers.get('retry-after') if response is not None else None
+                if retry_after:
+                    error_str = f"retry-after: {retry_after}"
+                
                 wait_time = self._parse_retry_delay(error_str)
+                self.rate_limiter.backoff(wait_time)
                 
                 if attempt < max_retries - 1:
                     log(f"    → Rate Limit 발생, {wait_time}초 대기 후 재시도...")
-                    time.sleep(wait_time)
                     continue
                 else:
                     log(f"    → Rate Limit: 최대 재시도 횟수({max_retries}) 초과")
                     return None
                     
+            except (anthropic.APIStatusError, anthropic.APIConnectionError) as e:
+                status = getattr(e, 'status_code', None)
+                if status is not None and status < 500:
+                    log(f"    → Claude API 오류: {type(e).__name__}: {e}")
+                    return None
+                
+                if attempt >= max_retries - 1:
+                    log(f"    → Claude API 일시적 오류: 최대 재시도 횟수({max_retries}) 초과 ({type(e).__name__}: {e})")
+                    return None
+                
+                wait_time = self._transient_delay(attempt)
+                log(f"    → Claude API 일시적 오류 ({status or type(e).__name__}), {wait_time:.1f}초 후 재시도...")
+                if status == 529:
+                    # 과부하는 다른 동시 요청도 같이 실패하므로 모델 단위로 보류
+                    self.rate_limiter.backoff(wait_time)
+                else:
+                    await asyncio.sleep(wait_time)
+                continue
+                
             except anthropic.APIError as e:
                 log(f"    → Claude API 오류: {type(e).__name__}: {e}")
                 return None
                 
             except Exception as e:
-                log(f"    → PDF 직접 전달 오류: {type(e).__name__}: {e}")
+                log(f"    → {error_label}: {type(e).__name__}: {e}")
                 import traceback
                 log(f"    → 스택 트레이스: {traceback.format_exc()[:500]}")
                 return None
         
         return None
     
+    def _transient_delay(self, attempt: int) -> float:
+        """
+        일시적 오류 재시도 대기 시간 (지수 백오프 + 지터)
+        
+        Args:
+            attempt: 실패한 시도 번호 (0부터)
+            
+        Returns:
+            대기 시간 (초)
+        """
+        delay = min(self.TRANSIENT_RETRY_BASE * (2 ** attempt), self.TRANSIENT_RETRY_MAX)
+        return delay * random.uniform(0.8, 1.2)
+    
     def _parse_retry_delay(self, error_str: str) -> int:
         """
         오류 메시지에서 retryDelay 파싱
@@ -736,11 +833,11 @@ def main():
     또한 자사주 매입을 통해 주주환원을 강화하겠습니다.
     """
     
-    result = analyzer.analyze(
+    result = asyncio.run(analyzer.analyze(
         pdf_text=test_text,
         company_name="테스트기업",
         framework=framework
-    )
+    ))
     
     if result:
         log("분석 성공!")
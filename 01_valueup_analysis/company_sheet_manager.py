@@ -41,6 +41,13 @@ except ImportError:
 # Framework 참조 (영역, 카테고리 정보 조회용)
 from framework_loader import Framework
 
+# Drive 경로 인덱스 (01_valueup_monitor/drive_index.py 공유)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '01_valueup_monitor'))
+try:
+    from drive_index import DriveIndex, FOLDER_MIME, SPREADSHEET_MIME
+except ImportError:
+    DriveIndex = None
+
 sys.stdout.reconfigure(line_buffering=True)
 
 
@@ -72,7 +79,9 @@ class CompanySheetManager:
         credentials_json: Optional[str] = None, 
         archive_folder_id: Optional[str] = None,
         # 프레임워크 (영역, 카테고리 정보 조회용)
-        framework: Optional[Framework] = None
+        framework: Optional[Framework] = None,
+        # Drive 경로 인덱스
+        index: Optional['DriveIndex'] = None
     ):
         """
         초기화
@@ -84,6 +93,7 @@ class CompanySheetManager:
             credentials_json: 서비스 계정 JSON 문자열 (폴더/파일 검색용)
             archive_folder_id: 01_Valueup_archive 폴더 ID
             framework: Framework 객체 (영역, 카테고리 정보 조회용)
+            index: Drive 경로 인덱스 (기본: VALUEUP_DRIVE_INDEX=false가 아니면 자동 생성)
         """
         # OAuth2 인증 정보
         self.refresh_token = refresh_token or os.environ.get('GDRIVE_REFRESH_TOKEN')
@@ -100,8 +110,23 @@ class CompanySheetManager:
         self.auth_method = None  # 인증 방식
         self._storage_quota_exceeded = False  # 저장 공간 부족 플래그
         self.framework = framework  # 프레임워크 (영역, 카테고리 정보)
+        self._oauth_email = None  # OAuth2 계정 이메일 (캐시)
+        
+        self.index = index
+        if (self.index is None and DriveIndex is not None
+                and os.environ.get('VALUEUP_DRIVE_INDEX', 'true').lower() != 'false'):
+            try:
+                self.index = DriveIndex()
+            except Exception as e:
+                log(f"[WARN] Drive 인덱스 초기화 실패 (원격 검색만 사용): {e}")
         
         self._init_clients()
+        
+        # 지난 실행 이후 Drive 변경분 반영 (삭제/이름 변경된 시트는 인덱스에서 제외)
+        if self.index and self.drive_service:
+            applied = self.index.refresh(self.drive_service, account='OAuth2')
+            if applied:
+                log(f"Drive 인덱스: 변경분 {applied}건 반영")
     
     def set_framework(self, framework: Framework):
         """프레임워크 설정 (나중에 설정 가능)"""
@@ -180,6 +205,13 @@ class CompanySheetManager:
         if not self.drive_service:
             return None
         
+        # 로컬 인덱스 (Owner 확인을 통과한 폴더만 기록됨)
+        if self.index:
+            folder_id = self.index.find(self.ANALYSIS_FOLDER_NAME, self.archive_folder_id, FOLDER_MIME)
+            if folder_id:
+                self.analysis_folder_id = folder_id
+                return self.analysis_folder_id
+        
         try:
             # 1. OAuth2 계정으로 폴더 검색 (내가 Owner인 폴더)
             oauth_email = self._get_oauth_email()
@@ -210,6 +242,7 @@ class CompanySheetManager:
                 if oauth_email and oauth_email in owner_emails:
                     # OAuth2 계정이 Owner - 정상
                     self.analysis_folder_id = folder_id
+                    self._record_index(folder_id, self.ANALYSIS_FOLDER_NAME, self.archive_folder_id, FOLDER_MIME)
                     log(f"기존 {self.ANALYSIS_FOLDER_NAME} 폴더 발견 (Owner: {oauth_email})")
                     return self.analysis_folder_id
                 else:
@@ -234,6 +267,7 @@ class CompanySheetManager:
                 if oauth_email and oauth_email in owner_emails:
                     # OAuth 계정이 owner → drive.file scope 때문에 검색 못한 것뿐, 사용 가능
                     self.analysis_folder_id = sa_folder_id
+                    self._record_index(sa_folder_id, self.ANALYSIS_FOLDER_NAME, self.archive_folder_id, FOLDER_MIME)
                     log(f"기존 {self.ANALYSIS_FOLDER_NAME} 폴더 발견 (Owner: {oauth_email})")
                     return self.analysis_folder_id
                 else:
@@ -261,6 +295,7 @@ class CompanySheetManager:
             ).execute()
             
             self.analysis_folder_id = folder['id']
+            self._record_index(folder['id'], self.ANALYSIS_FOLDER_NAME, self.archive_folder_id, FOLDER_MIME)
             log(f"{self.ANALYSIS_FOLDER_NAME} 폴더 생성 완료 (Owner: {oauth_email})")
             return self.analysis_folder_id
             
@@ -310,19 +345,28 @@ class CompanySheetManager:
             log(f"[WARN] 서비스 계정 폴더 검색 실패: {e}")
             return None
     
+    def _record_index(self, file_id: str, name: str, parent_id: str, mime_type: str):
+        """Owner 확인을 마친 폴더/스프레드시트를 로컬 인덱스에 기록"""
+        if self.index:
+            self.index.record(file_id, name, parent_id, mime_type)
+    
     def _get_oauth_email(self) -> Optional[str]:
         """
-        OAuth2 계정의 이메일 주소 가져오기
+        OAuth2 계정의 이메일 주소 가져오기 (첫 조회 후 캐시)
         
         Returns:
             이메일 주소 또는 None
         """
+        if self._oauth_email:
+            return self._oauth_email
+        
         if not self.drive_service:
             return None
         
         try:
             about = self.drive_service.about().get(fields='user').execute()
-            return about.get('user', {}).get('emailAddress')
+            self._oauth_email = about.get('user', {}).get('emailAddress')
+            return self._oauth_email
         except Exception as e:
             log(f"[WARN] OAuth2 이메일 조회 실패: {e}")
             return None
@@ -349,6 +393,13 @@ class CompanySheetManager:
         # 파일명 형식: "기업명_종목코드" (종목코드 6자리 유지)
         stock_code_6 = str(stock_code).zfill(6)
         file_name = f"{company_name}_{stock_code_6}"
+        
+        # 로컬 인덱스 우선 (Drive 검색 생략)
+        if self.index:
+            spreadsheet_id = self.index.find(file_name, folder_id, SPREADSHEET_MIME)
+            if spreadsheet_id:
+                return spreadsheet_id
+        
         oauth_email = self._get_oauth_email()
         
         try:
@@ -369,6 +420,7 @@ class CompanySheetManager:
             files = results.get('files', [])
             
             if files:
+                self._record_index(files[0]['id'], file_name, folder_id, SPREADSHEET_MIME)
                 return files[0]['id']
             
             # 2. OAuth2로 못 찾았으면 서비스 계정으로 재검색 (drive.file scope 제한 우회)
@@ -383,6 +435,7 @@ class CompanySheetManager:
                 if oauth_email and oauth_email in owner_emails:
                     # OAuth 계정이 owner → drive.file scope 때문에 검색 못한 것뿐, 사용 가능
                     log(f"기존 스프레드시트 발견: {file_name} (Owner: {oauth_email})")
+                    self._record_index(sa_file_id, file_name, folder_id, SPREADSHEET_MIME)
                     return sa_file_id
                 else:
                     # 서비스 계정 등 다른 계정이 owner → 에러
@@ -482,6 +535,7 @@ class CompanySheetManager:
             ).execute()
             
             spreadsheet_id = file['id']
+            self._record_index(spreadsheet_id, file_name, folder_id, SPREADSHEET_MIME)
             log(f"스프레드시트 생성: {file_name} ({spreadsheet_id})")
             
             # 2. 시트 구조 초기화
@@ -630,6 +684,7 @@ class CompanySheetManager:
         if self._storage_quota_exceeded:
             raise RuntimeError("Drive 저장 공간 부족 - 기업별 시트 생성 불가")
         
+        spreadsheet_id = None
         try:
             # 1. 기존 스프레드시트 검색
             spreadsheet_id = self._find_company_spreadsheet(company_name, stock_code)
@@ -654,6 +709,9 @@ class CompanySheetManager:
             raise  # RuntimeError는 그대로 전파
         except Exception as e:
             log(f"[ERROR] 스프레드시트 열기 실패: {e}")
+            # 인덱스의 ID가 더 이상 유효하지 않을 수 있으므로 다음 실행에서 다시 검색
+            if self.index and spreadsheet_id:
+                self.index.forget(spreadsheet_id)
             return None
     
     def get_company_sheet_url(self, company_name: str, stock_code: str) -> Optional[str]:
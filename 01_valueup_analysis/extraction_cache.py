@@ -0,0 +1,114 @@
+"""
+PDF 텍스트 추출 결과 캐시
+PDF 내용(SHA-256) + 추출기 버전 기준으로 페이지 텍스트, 테이블, 페이지 수, 예상 토큰 수 저장
+
+프롬프트/프레임워크가 바뀌어 재분석하더라도 같은 PDF는 다시 파싱하지 않음.
+추출 로직이 바뀌면 pdf_extractor.EXTRACTOR_VERSION을 올려 캐시를 무효화.
+
+환경변수:
+- VALUEUP_EXTRACTION_CACHE: SQLite 파일 경로 (기본: .valueup_state/extraction.sqlite3)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+DEFAULT_PATH = os.path.join(
+    os.environ.get(
+        'VALUEUP_STATE_DIR',
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.valueup_state')
+    ),
+    'extraction.sqlite3'
+)
+
+
+def log(message: str):
+    """타임스탬프와 함께 로그 출력"""
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    print(f"[{timestamp}] {message}", flush=True)
+
+
+class ExtractionCache:
+    """PDF 추출 결과 캐시 (SQLite, zlib 압축 JSON)"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS extractions (
+            digest TEXT NOT NULL,
+            version TEXT NOT NULL,
+            payload BLOB NOT NULL,
+            created REAL NOT NULL,
+            PRIMARY KEY (digest, version)
+        );
+    """
+
+    def __init__(self, version: str, path: Optional[str] = None):
+        """
+        초기화
+
+        Args:
+            version: 추출기 버전 (다른 버전의 결과는 삭제)
+            path: SQLite 파일 경로
+        """
+        self.version = version
+        self.path = path or os.environ.get('VALUEUP_EXTRACTION_CACHE') or DEFAULT_PATH
+        if self.path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.executescript(self.SCHEMA)
+        with self.conn:
+            removed = self.conn.execute(
+                "DELETE FROM extractions WHERE version != ?", (version,)
+            ).rowcount
+        if removed:
+            log(f"  추출 캐시: 이전 버전 결과 {removed}건 삭제")
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, digest: str) -> Optional[Dict[str, Any]]:
+        """
+        추출 결과 조회
+
+        Args:
+            digest: PDF SHA-256
+
+        Returns:
+            {'page_texts', 'tables', 'page_count', 'estimated_tokens', 'library'} 또는 None
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT payload FROM extractions WHERE digest = ? AND version = ?",
+                (digest, self.version)
+            ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return json.loads(zlib.decompress(row[0]).decode('utf-8'))
+
+    def put(self, digest: str, record: Dict[str, Any]):
+        """
+        추출 결과 저장
+
+        Args:
+            digest: PDF SHA-256
+            record: 추출 결과 딕셔너리 (JSON 직렬화 가능)
+        """
+        payload = zlib.compress(json.dumps(record, ensure_ascii=False).encode('utf-8'))
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO extractions (digest, version, payload, created) VALUES (?, ?, ?, ?)",
+                (digest, self.version, payload, time.time())
+            )
+
+    def summary(self) -> str:
+        """적중률 요약 문자열"""
+        return f"적중 {self.hits}건, 미스 {self.misses}건"
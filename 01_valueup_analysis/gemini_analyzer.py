@@ -12,6 +12,7 @@ import os
 import sys
 import json
 import re
+import asyncio
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
@@ -24,6 +25,7 @@ except ImportError:
     HAS_GENAI = False
 
 from framework_loader import Framework, FrameworkItem
+from rate_limiter import get_rate_limiter
 
 sys.stdout.reconfigure(line_buffering=True)
 
@@ -63,6 +65,7 @@ class GeminiAnalyzer:
         self.model_name = model_name or self.DEFAULT_MODEL
         self.client = None
         self.last_analysis_method = None  # 마지막 분석 방식 기록
+        self.rate_limiter = get_rate_limiter(self.model_name)
         
         if not HAS_GENAI:
             log("[ERROR] google-genai 패키지가 설치되지 않았습니다.")
@@ -252,12 +255,13 @@ class GeminiAnalyzer:
         
         return prompt
     
-    def analyze(
+    async def analyze(
         self, 
         company_name: str, 
         framework: Framework,
         pdf_bytes: Optional[bytes] = None,
-        pdf_text: Optional[str] = None
+        pdf_text: Optional[str] = None,
+        estimated_tokens: int = 0
     ) -> Optional[Dict[str, Any]]:
         """
         밸류업 PDF 분석
@@ -271,6 +275,7 @@ class GeminiAnalyzer:
             framework: 분석 프레임워크
             pdf_bytes: PDF 바이너리 데이터 (Optional)
             pdf_text: PDF 추출 텍스트 (Optional, fallback용)
+            estimated_tokens: 예상 입력 토큰 수 (토큰 버킷 예약용)
             
         Returns:
             분석 결과 딕셔너리 또는 None
@@ -289,17 +294,18 @@ class GeminiAnalyzer:
             return None
         
         result = None
+        method = None
         
         # 1. PDF 직접 전달 우선 시도 (Gemini의 멀티모달 기능 활용)
         if pdf_bytes:
             log(f"  [방식1] PDF 직접 전달 시도 ({len(pdf_bytes):,} bytes)...")
             sys.stdout.flush()
             
-            result = self._analyze_with_pdf(pdf_bytes, company_name, framework, max_retries=2)
+            result = await self._analyze_with_pdf(pdf_bytes, company_name, framework, estimated_tokens, max_retries=2)
             sys.stdout.flush()
             
             if result:
-                self.last_analysis_method = "PDF_DIRECT"
+                method = "PDF_DIRECT"
                 log("  ✓ PDF 직접 전달 성공!")
                 sys.stdout.flush()
             else:
@@ -311,11 +317,11 @@ class GeminiAnalyzer:
             log(f"  [방식2] 텍스트 전달 시도 ({len(pdf_text):,} 글자)...")
             sys.stdout.flush()
             
-            result = self._analyze_with_text(pdf_text, company_name, framework, max_retries=2)
+            result = await self._analyze_with_text(pdf_text, company_name, framework, estimated_tokens, max_retries=2)
             sys.stdout.flush()
             
             if result:
-                self.last_analysis_method = "TEXT_FALLBACK"
+                method = "TEXT_FALLBACK"
                 log("  ✓ 텍스트 전달 성공!")
                 sys.stdout.flush()
             else:
@@ -324,6 +330,7 @@ class GeminiAnalyzer:
         
         # 결과 통계 출력
         if result:
+            self.last_analysis_method = method
             items_mentioned = sum(
                 1 for item_id, data in result.get('analysis_items', {}).items()
                 if data.get('level', 0) > 0
@@ -333,33 +340,33 @@ class GeminiAnalyzer:
                 if result.get('analysis_items', {}).get(item.item_id, {}).get('level', 0) > 0
             )
             
-            log(f"  분석 완료 [{self.last_analysis_method}]: "
+            log(f"  분석 완료 [{method}]: "
                 f"{items_mentioned}개 항목 언급, {core_mentioned}개 Core 항목")
             sys.stdout.flush()
         
         return result
     
-    def _analyze_with_pdf(
+    async def _analyze_with_pdf(
         self, 
         pdf_bytes: bytes, 
         company_name: str, 
         framework: Framework,
+        estimated_tokens: int = 0,
         max_retries: int = 3
     ) -> Optional[Dict[str, Any]]:
         """
-        PDF 직접 전달로 분석 (Retry 로직 포함)
+        PDF 직접 전달로 분석
         
         Args:
             pdf_bytes: PDF 바이너리 데이터
             company_name: 회사명
             framework: 분석 프레임워크
+            estimated_tokens: 예상 입력 토큰 수
             max_retries: 최대 재시도 횟수
             
         Returns:
             분석 결과 또는 None
         """
-        import time
-        
         # 시스템 프롬프트
         system_prompt = self._build_system_prompt(framework)
         
@@ -376,61 +383,9 @@ class GeminiAnalyzer:
         # 전체 프롬프트 = 시스템 + PDF + 사용자 질문
         full_prompt = f"{system_prompt}\n\n---\n\n{user_prompt}"
         
-        for attempt in range(max_retries):
-            try:
-                # API 호출 (PDF + 텍스트)
-                log(f"    → Gemini API 호출 중... (시도 {attempt + 1}/{max_retries})")
-                response = self.client.models.generate_content(
-                    model=self.model_name,
-                    contents=[pdf_part, full_prompt],
-                    config=types.GenerateContentConfig(
-                        temperature=0.1,
-                        top_p=0.95,
-                        top_k=40,
-                        max_output_tokens=8192,
-                        response_mime_type="application/json"
-                    )
-                )
-                
-                if not response:
-                    log("    → Gemini 응답 객체가 None입니다.")
-                    return None
-                
-                if not response.text:
-                    log("    → Gemini 응답 텍스트가 비어있습니다.")
-                    if hasattr(response, 'candidates'):
-                        log(f"    → candidates: {response.candidates}")
-                    return None
-                
-                log(f"    → 응답 수신 완료: {len(response.text):,}자")
-                return self._parse_response(response.text)
-                
-            except Exception as e:
-                error_str = str(e)
-                
-                # Rate Limit 오류 처리
-                if '429' in error_str or 'RESOURCE_EXHAUSTED' in error_str:
-                    # 오류 상세 메시지 출력 (처음 1회만)
-                    if attempt == 0:
-                        log(f"    → Rate Limit 오류 상세: {error_str[:300]}...")
-                    
-                    # retryDelay 파싱 시도
-                    wait_time = self._parse_retry_delay(error_str)
-                    
-                    if attempt < max_retries - 1:
-                        log(f"    → Rate Limit 발생, {wait_time}초 대기 후 재시도...")
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        log(f"    → Rate Limit: 최대 재시도 횟수({max_retries}) 초과")
-                        return None
-                else:
-                    log(f"    → PDF 직접 전달 오류: {type(e).__name__}: {e}")
-                    import traceback
-                    log(f"    → 스택 트레이스: {traceback.format_exc()[:500]}")
-                    return None
-        
-        return None
+        return await self._request(
+            [pdf_part, full_prompt], estimated_tokens, max_retries, error_label="PDF 직접 전달 오류"
+        )
     
     def _parse_retry_delay(self, error_str: str) -> int:
         """
@@ -461,27 +416,27 @@ class GeminiAnalyzer:
         # 기본 대기 시간
         return 30
     
-    def _analyze_with_text(
+    async def _analyze_with_text(
         self, 
         pdf_text: str, 
         company_name: str, 
         framework: Framework,
+        estimated_tokens: int = 0,
         max_retries: int = 3
     ) -> Optional[Dict[str, Any]]:
         """
-        텍스트로 분석 (fallback, Retry 로직 포함)
+        텍스트로 분석 (fallback)
         
         Args:
             pdf_text: PDF 추출 텍스트
             company_name: 회사명
             framework: 분석 프레임워크
+            estimated_tokens: 예상 입력 토큰 수
             max_retries: 최대 재시도 횟수
             
         Returns:
             분석 결과 또는 None
         """
-        import time
-        
         if not pdf_text or len(pdf_text) < 100:
             log(f"    → 텍스트가 너무 짧습니다. (길이: {len(pdf_text) if pdf_text else 0}자)")
             return None
@@ -495,29 +450,54 @@ class GeminiAnalyzer:
         
         log(f"    → 프롬프트 길이: {len(full_prompt):,}자")
         
+        return await self._request(
+            full_prompt, estimated_tokens, max_retries, error_label="텍스트 분석 오류"
+        )
+    
+    async def _request(
+        self,
+        contents: Any,
+        estimated_tokens: int,
+        max_retries: int,
+        error_label: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Gemini API 호출 (rate_limiter 슬롯 안에서 호출, 429 시 retryDelay만큼 보류 후 재시도)
+        
+        Args:
+            contents: generate_content에 전달할 contents
+            estimated_tokens: 예상 입력 토큰 수
+            max_retries: 최대 재시도 횟수
+            error_label: 일반 오류 로그 접두어
+            
+        Returns:
+            분석 결과 또는 None
+        """
         for attempt in range(max_retries):
             try:
-                log(f"    → Gemini API 호출 중... (시도 {attempt + 1}/{max_retries})")
-                
-                # API 호출
-                response = self.client.models.generate_content(
-                    model=self.model_name,
-                    contents=full_prompt,
-                    config=types.GenerateContentConfig(
-                        temperature=0.1,
-                        top_p=0.95,
-                        top_k=40,
-                        max_output_tokens=8192,
-                        response_mime_type="application/json"
+                async with self.rate_limiter.slot(estimated_tokens):
+                    log(f"    → Gemini API 호출 중... (시도 {attempt + 1}/{max_retries})")
+                    
+                    response = await self.client.aio.models.generate_content(
+                        model=self.model_name,
+                        contents=contents,
+                        config=types.GenerateContentConfig(
+                            temperature=0.1,
+                            top_p=0.95,
+                            top_k=40,
+                            max_output_tokens=8192,
+                            response_mime_type="application/json"
+                        )
                     )
-                )
                 
                 if not response:
                     log("    → Gemini 응답 객체가 None입니다.")
                     return None
-                    
+                
                 if not response.text:
                     log("    → Gemini 응답 텍스트가 비어있습니다.")
+                    if hasattr(response, 'candidates'):
+                        log(f"    → candidates: {response.candidates}")
                     return None
                 
                 log(f"    → 응답 수신 완료: {len(response.text):,}자")
@@ -532,17 +512,18 @@ class GeminiAnalyzer:
                     if attempt == 0:
                         log(f"    → Rate Limit 오류 상세: {error_str[:300]}...")
                     
+                    # retryDelay 파싱 후 같은 모델의 다른 요청도 함께 보류
                     wait_time = self._parse_retry_delay(error_str)
+                    self.rate_limiter.backoff(wait_time)
                     
                     if attempt < max_retries - 1:
                         log(f"    → Rate Limit 발생, {wait_time}초 대기 후 재시도...")
-                        time.sleep(wait_time)
                         continue
                     else:
                         log(f"    → Rate Limit: 최대 재시도 횟수({max_retries}) 초과")
                         return None
                 else:
-                    log(f"    → 텍스트 분석 오류: {type(e).__name__}: {e}")
+                    log(f"    → {error_label}: {type(e).__name__}: {e}")
                     import traceback
                     log(f"    → 스택 트레이스: {traceback.format_exc()[:500]}")
                     return None
@@ -677,7 +658,7 @@ def main():
         주주환원 정책으로 배당성향을 현재 30%에서 2025년까지 40%로 확대할 예정입니다.
         """
         
-        result = analyzer.analyze(sample_text, "테스트기업", framework)
+        result = asyncio.run(analyzer.analyze("테스트기업", framework, pdf_text=sample_text))
         
         if result:
             print("\n=== 분석 결과 ===")
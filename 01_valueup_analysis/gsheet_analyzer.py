@@ -14,6 +14,13 @@ from google.oauth2.service_account import Credentials
 
 from framework_loader import Framework, FrameworkLoader
 
+# 로컬 상태 저장소 (01_valueup_monitor/state_store.py 공유)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '01_valueup_monitor'))
+try:
+    from state_store import DisclosureStateStore
+except ImportError:
+    DisclosureStateStore = None
+
 sys.stdout.reconfigure(line_buffering=True)
 
 
@@ -51,13 +58,20 @@ class GSheetAnalyzer:
         '주요포인트',    # I
     ]
     
+    # 밸류업공시목록 L~P열 분석 메타정보 헤더
+    ANALYSIS_META_HEADERS = ['분석상태', '분석일시', '분석항목수', 'Core항목수', '기업시트링크']
+    
+    # 밸류업공시목록에서 행 추가 후에도 바뀌는 열 (증분 동기화 후 매 실행 재조회)
+    MUTABLE_DISCLOSURE_HEADERS = ['구글드라이브링크', '아티팩트링크', '원시PDF링크', '분석상태']
+    
     # 각 항목별 접미사
     ITEM_SUFFIXES = ['_level', '_current', '_target', '_year', '_note']
     
     def __init__(
         self, 
         credentials_json: Optional[str] = None, 
-        spreadsheet_id: Optional[str] = None
+        spreadsheet_id: Optional[str] = None,
+        state_store: Optional[Any] = None
     ):
         """
         초기화
@@ -65,6 +79,7 @@ class GSheetAnalyzer:
         Args:
             credentials_json: 서비스 계정 JSON 문자열 또는 파일 경로
             spreadsheet_id: 스프레드시트 ID
+            state_store: 로컬 상태 저장소 (기본: VALUEUP_STATE_STORE=false가 아니면 자동 생성)
         """
         self.spreadsheet_id = spreadsheet_id or os.environ.get('VALUEUP_GSPREAD_ID')
         self.client = None
@@ -72,6 +87,16 @@ class GSheetAnalyzer:
         self._worksheet_cache = {}
         self.framework: Optional[Framework] = None
         
+        # 로컬 상태 저장소 (없으면 시트 직접 조회)
+        self.state_store = state_store
+        if (self.state_store is None and DisclosureStateStore is not None
+                and os.environ.get('VALUEUP_STATE_STORE', 'true').lower() != 'false'):
+            try:
+                self.state_store = DisclosureStateStore()
+            except Exception as e:
+                log(f"[WARN] 상태 저장소 열기 실패 (시트 직접 조회): {e}")
+        self._synced_sheets = set()
+        
         # 인증 정보 로드
         creds = None
         if credentials_json:
@@ -113,6 +138,44 @@ class GSheetAnalyzer:
             log(f"[WARN] 워크시트를 찾을 수 없습니다: {sheet_name}")
             return None
     
+    def _sync_state(self, worksheet: gspread.Worksheet) -> bool:
+        """
+        상태 저장소를 시트와 동기화 (실행당 1회, 행 추가 후 재동기화)
+        
+        Returns:
+            상태 저장소 사용 가능 여부
+        """
+        if not self.state_store:
+            return False
+        if worksheet.title in self._synced_sheets:
+            return True
+        if self.state_store.sync_worksheet(worksheet) < 0:
+            return False
+        self._synced_sheets.add(worksheet.title)
+        return True
+    
+    def _acptno_row_map(self, worksheet: gspread.Worksheet) -> Dict[str, int]:
+        """
+        접수번호 → 행 번호 매핑 (상태 저장소 우선, 없으면 F열 조회)
+        
+        Returns:
+            {접수번호: 행번호} 딕셔너리
+        """
+        if self._sync_state(worksheet):
+            return self.state_store.row_numbers(worksheet.title)
+        
+        acptno_col = worksheet.col_values(6)  # F열: 접수번호
+        acptno_to_row = {}
+        for i, val in enumerate(acptno_col):
+            if val:
+                acptno_to_row[str(val).strip().lstrip("'")] = i + 1
+        return acptno_to_row
+    
+    def _write_through(self, acptno_fields: Dict[str, Dict[str, Any]]):
+        """밸류업공시목록 시트에 쓴 값을 상태 저장소에도 반영"""
+        if self.state_store:
+            self.state_store.update_many(self.SHEET_DISCLOSURES, acptno_fields)
+    
     def load_framework(self) -> Optional[Framework]:
         """Framework 시트에서 프레임워크 로드"""
         worksheet = self._get_worksheet(self.SHEET_FRAMEWORK)
@@ -151,16 +214,28 @@ class GSheetAnalyzer:
         analyzed_acptnos = self._get_analyzed_acptnos()
         
         try:
-            all_records = disclosures_ws.get_all_records()
+            cutoff_date = datetime.now() - timedelta(days=days)
+            
+            if (self._sync_state(disclosures_ws) and
+                    self.state_store.refresh_columns(disclosures_ws, self.MUTABLE_DISCLOSURE_HEADERS) >= 0):
+                # 상태 저장소에서 분석상태/기간 조건을 먼저 적용
+                all_records = self.state_store.records(
+                    self.SHEET_DISCLOSURES,
+                    exclude_status=['completed', 'error'],
+                    since_date=cutoff_date.strftime("%Y-%m-%d")
+                )
+                total_count = self.state_store.count(self.SHEET_DISCLOSURES)
+            else:
+                all_records = disclosures_ws.get_all_records()
+                total_count = len(all_records)
             
             # 필터링: 최근 N일 + 분석 안됨 + 아티팩트링크 있음
-            cutoff_date = datetime.now() - timedelta(days=days)
             pending = []
             skipped_by_analysis_sheet = 0
             skipped_by_status = 0
             
             for record in all_records:
-                acptno = str(record.get('접수번호', '')).strip()
+                acptno = str(record.get('접수번호', '')).strip().lstrip("'")
                 if not acptno:
                     continue
                 
@@ -202,7 +277,7 @@ class GSheetAnalyzer:
                 
                 pending.append(record)
             
-            log(f"분석 대기 공시: {len(pending)}건 (전체 {len(all_records)}건)")
+            log(f"분석 대기 공시: {len(pending)}건 (전체 {total_count}건)")
             if skipped_by_analysis_sheet > 0 or skipped_by_status > 0:
                 log(f"  → 제외: 분석시트 {skipped_by_analysis_sheet}건, L열상태 {skipped_by_status}건")
             return pending
@@ -217,10 +292,13 @@ class GSheetAnalyzer:
         if not worksheet:
             return set()
         
+        if self._sync_state(worksheet):
+            return self.state_store.acptno_set(worksheet.title)
+        
         try:
             # A열 (접수번호) 전체 조회
             acptno_col = worksheet.col_values(1)
-            return set(acptno_col[1:])  # 헤더 제외
+            return set(str(v).strip().lstrip("'") for v in acptno_col[1:])  # 헤더 제외
         except Exception as e:
             log(f"[WARN] 분석 완료 목록 조회 실패: {e}")
             return set()
@@ -244,7 +322,7 @@ class GSheetAnalyzer:
             headers = worksheet.row_values(1)
             
             # 필요한 헤더
-            required_headers = ['분석상태', '분석일시', '분석항목수', 'Core항목수', '기업시트링크']
+            required_headers = self.ANALYSIS_META_HEADERS
             
             # L열(12번째)부터 헤더 확인
             needs_update = False
@@ -400,6 +478,8 @@ class GSheetAnalyzer:
             
             # 행 추가
             worksheet.append_row(row, value_input_option='USER_ENTERED')
+            # 다음 조회 시 추가된 행만 증분 동기화
+            self._synced_sheets.discard(worksheet.title)
             
             log(f"  분석 결과 저장 완료: {disclosure.get('회사명', '')}")
             return True
@@ -468,14 +548,8 @@ class GSheetAnalyzer:
             return False
         
         try:
-            # F열(접수번호)에서 해당 행 찾기
-            acptno_col = worksheet.col_values(6)  # F열: 접수번호
-            
-            row_idx = None
-            for i, val in enumerate(acptno_col):
-                if str(val).strip() == str(acptno).strip():
-                    row_idx = i + 1  # 1-based index
-                    break
+            # 접수번호로 행 찾기
+            row_idx = self._acptno_row_map(worksheet).get(str(acptno).strip().lstrip("'"))
             
             if not row_idx:
                 log(f"  [WARN] 접수번호 {acptno}를 찾을 수 없습니다.")
@@ -489,6 +563,7 @@ class GSheetAnalyzer:
             
             # K열 업데이트
             worksheet.update_cell(row_idx, 11, estimated_tokens)
+            self._write_through({acptno: {'예상토큰수': estimated_tokens}})
             return True
             
         except Exception as e:
@@ -529,20 +604,15 @@ class GSheetAnalyzer:
                 worksheet.update_cell(1, 11, '예상토큰수')
                 log("  K열 '예상토큰수' 헤더 추가됨")
             
-            # F열(접수번호) 전체 조회
-            acptno_col = worksheet.col_values(6)
-            log(f"  접수번호 데이터 행 수: {len(acptno_col)}")
-            
             # 접수번호 → 행 번호 매핑
-            acptno_to_row = {}
-            for i, val in enumerate(acptno_col):
-                if val:
-                    acptno_to_row[str(val).strip()] = i + 1
+            acptno_to_row = self._acptno_row_map(worksheet)
+            log(f"  접수번호 데이터 행 수: {len(acptno_to_row)}")
             
             # 일괄 업데이트 준비
             batch_data = []
+            state_updates = {}
             for update in updates:
-                acptno = str(update.get('접수번호', '')).strip()
+                acptno = str(update.get('접수번호', '')).strip().lstrip("'")
                 tokens = update.get('예상토큰수', 0)
                 
                 if acptno in acptno_to_row:
@@ -551,11 +621,13 @@ class GSheetAnalyzer:
                         'range': f'K{row_idx}',
                         'values': [[tokens]]
                     })
+                    state_updates[acptno] = {'예상토큰수': tokens}
                 else:
                     log(f"  [WARN] 접수번호 {acptno}를 시트에서 찾을 수 없음")
             
             if batch_data:
                 worksheet.batch_update(batch_data)
+                self._write_through(state_updates)
                 log(f"  예상토큰수 일괄 업데이트: {len(batch_data)}건")
                 return len(batch_data)
             
@@ -603,14 +675,8 @@ class GSheetAnalyzer:
             # L~P열 헤더 확인 및 추가
             self._ensure_analysis_meta_headers(worksheet)
             
-            # 접수번호로 행 찾기 (F열 = 6번째 열)
-            acptno_col = worksheet.col_values(6)  # F열: 접수번호
-            
-            row_idx = None
-            for i, val in enumerate(acptno_col):
-                if str(val).strip() == str(acptno).strip():
-                    row_idx = i + 1
-                    break
+            # 접수번호로 행 찾기
+            row_idx = self._acptno_row_map(worksheet).get(str(acptno).strip().lstrip("'"))
             
             if not row_idx:
                 log(f"  [WARN] 접수번호 {acptno}를 밸류업공시목록 F열에서 찾을 수 없음")
@@ -621,6 +687,7 @@ class GSheetAnalyzer:
             update_data = [[status, now, items_count, core_count, company_sheet_url]]
             
             worksheet.update(f'L{row_idx}:P{row_idx}', update_data)
+            self._write_through({acptno: dict(zip(self.ANALYSIS_META_HEADERS, update_data[0]))})
             log(f"    → 밸류업공시목록 메타정보 업데이트 완료 (L~P열)")
             return True
             
@@ -644,20 +711,15 @@ class GSheetAnalyzer:
             return False
         
         try:
-            # 접수번호로 행 찾기 (F열 = 6번째 열)
-            acptno_col = worksheet.col_values(6)  # F열: 접수번호
-            
-            row_idx = None
-            for i, val in enumerate(acptno_col):
-                if str(val).strip() == str(acptno).strip():
-                    row_idx = i + 1
-                    break
+            # 접수번호로 행 찾기
+            row_idx = self._acptno_row_map(worksheet).get(str(acptno).strip().lstrip("'"))
             
             if not row_idx:
                 return False
             
             # P열 업데이트
             worksheet.update_acell(f'P{row_idx}', company_sheet_url)
+            self._write_through({acptno: {'기업시트링크': company_sheet_url}})
             return True
             
         except Exception as e:
@@ -690,21 +752,16 @@ class GSheetAnalyzer:
             self._ensure_analysis_meta_headers(worksheet)
             time.sleep(0.5)  # API 호출 간 딜레이
             
-            # F열(접수번호) 전체 조회
-            acptno_col = worksheet.col_values(6)  # F열: 접수번호
-            
             # 접수번호 → 행 번호 매핑
-            acptno_to_row = {}
-            for i, val in enumerate(acptno_col):
-                if val:
-                    acptno_to_row[str(val).strip()] = i + 1
+            acptno_to_row = self._acptno_row_map(worksheet)
             
             # 일괄 업데이트 준비
             now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             batch_data = []
+            state_updates = {}
             
             for update in updates:
-                acptno = str(update.get('접수번호', '')).strip()
+                acptno = str(update.get('접수번호', '')).strip().lstrip("'")
                 
                 if acptno not in acptno_to_row:
                     log(f"  [WARN] 접수번호 {acptno}를 시트에서 찾을 수 없음")
@@ -718,14 +775,17 @@ class GSheetAnalyzer:
                 core_count = update.get('Core항목수', 0)
                 company_url = update.get('기업시트링크', '')
                 
+                values = [status, now, items_count, core_count, company_url]
                 batch_data.append({
                     'range': f'L{row_idx}:P{row_idx}',
-                    'values': [[status, now, items_count, core_count, company_url]]
+                    'values': [values]
                 })
+                state_updates[acptno] = dict(zip(self.ANALYSIS_META_HEADERS, values))
             
             if batch_data:
                 time.sleep(0.5)  # API 호출 전 딜레이
                 worksheet.batch_update(batch_data)
+                self._write_through(state_updates)
                 log(f"  분석 메타정보 일괄 업데이트: {len(batch_data)}건")
                 return len(batch_data)
             
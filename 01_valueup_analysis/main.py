@@ -4,11 +4,12 @@ Framework 기반으로 PDF를 분석하여 Google Sheets에 기록
 """
 
 import argparse
+import asyncio
 import os
 import sys
 import json
-import time
-from typing import Optional, Dict, Any
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 
 # stdout 버퍼링 해제 (GitHub Actions에서 실시간 출력)
@@ -52,9 +53,40 @@ def get_service_account_email() -> str:
     return '(GOOGLE_SERVICE 미설정)'
 
 
+@dataclass
+class AnalysisJob:
+    """파이프라인 단계 사이를 오가는 공시 1건의 작업 단위"""
+    idx: int
+    total: int
+    disclosure: Dict
+    pdf_bytes: Optional[bytes] = None
+    text: str = ""
+    tokens: int = 0
+    analysis_result: Optional[Dict] = None
+    error: str = ""
+    
+    @property
+    def acptno(self) -> str:
+        return self.disclosure.get('접수번호', '')
+    
+    @property
+    def company(self) -> str:
+        return self.disclosure.get('회사명', '')
+    
+    @property
+    def label(self) -> str:
+        return f"[{self.idx}/{self.total}] {self.company} ({self.acptno})"
+
+
 class ValueUpAnalyzer:
     """밸류업 공시 분석기"""
     
+    # 파이프라인 단계 사이 큐 크기 (메모리에 올려둘 PDF 수 제한)
+    PIPELINE_QUEUE_SIZE = 2
+    
+    # 추출 단계가 한 번에 모아 처리할 최대 PDF 수 (작은 PDF 여러 개를 프로세스 풀에서 함께 추출)
+    EXTRACT_BATCH_SIZE = 4
+    
     def __init__(
         self,
         credentials_json: Optional[str] = None,
@@ -192,290 +224,39 @@ class ValueUpAnalyzer:
         if len(pending_disclosures) > self.max_items:
             log(f"  → {self.max_items}건만 분석 (나머지는 다음 실행에서)")
         
-        # 3. PDF 토큰 산정 및 시트 업데이트
+        # 3~4. 파이프라인 분석 (다운로드 → 추출/토큰 산정 → LLM 분석 → 저장 단계 동시 진행)
         log("")
-        log("[3단계] PDF 토큰 산정 중...")
+        log("[3단계] 파이프라인 분석 시작 (다운로드 → 추출 → 분석 → 저장)...")
         sys.stdout.flush()
         
         token_updates = []
-        pdf_cache = {}  # PDF 데이터 캐시: {acptno: {'pdf_bytes': bytes, 'text': str, 'tokens': int}}
-        total_estimated_tokens = 0
+        meta_updates = []
+        asyncio.run(self._run_pipeline(items_to_analyze, result, token_updates, meta_updates))
         
-        for idx, disclosure in enumerate(items_to_analyze, 1):
-            try:
-                acptno = disclosure.get('접수번호', '')
-                company = disclosure.get('회사명', '')
-                gdrive_url = disclosure.get('구글드라이브링크', '')
-                
-                log(f"  [{idx}/{len(items_to_analyze)}] {company} ({acptno}) - 토큰 산정 중...")
-                sys.stdout.flush()
-                
-                if not gdrive_url:
-                    log(f"    → 구글드라이브링크 없음, 건너뜀")
-                    sys.stdout.flush()
-                    continue
-                
-                log(f"    → URL: {gdrive_url[:60]}...")
-                sys.stdout.flush()
-                
-                # PDF 다운로드 및 토큰 추정
-                pdf_info = self.pdf_extractor.get_pdf_info(gdrive_url)
-                
-                if pdf_info['pdf_bytes']:
-                    estimated_tokens = pdf_info['estimated_tokens']
-                    total_estimated_tokens += estimated_tokens
-                    
-                    # 캐시에 저장 (분석 단계에서 재사용)
-                    pdf_cache[acptno] = {
-                        'pdf_bytes': pdf_info['pdf_bytes'],
-                        'text': pdf_info['text'],
-                        'tokens': estimated_tokens
-                    }
-                    
-                    token_updates.append({
-                        '접수번호': acptno,
-                        '예상토큰수': estimated_tokens
-                    })
-                    
-                    log(f"    → {estimated_tokens:,} 토큰 (페이지: {pdf_info['page_count']}, 텍스트: {len(pdf_info['text']):,}자)")
-                    sys.stdout.flush()
-                else:
-                    log(f"    → PDF 다운로드 실패")
-                    sys.stdout.flush()
-                    
-            except Exception as e:
-                log(f"    → [ERROR] 토큰 산정 중 예외: {type(e).__name__}: {e}")
-                sys.stdout.flush()
-                import traceback
-                log(f"    → {traceback.format_exc()[:300]}")
-                sys.stdout.flush()
+        total_estimated_tokens = sum(u['예상토큰수'] for u in token_updates)
+        log("")
+        log(f"  → 총 예상 토큰: {total_estimated_tokens:,} 토큰 ({len(token_updates)}건)")
+        if self.pdf_extractor.pdf_cache:
+            log(f"  → PDF 디스크 캐시: {self.pdf_extractor.pdf_cache.summary()}")
+        if self.pdf_extractor.extraction_cache:
+            log(f"  → 추출 캐시: {self.pdf_extractor.extraction_cache.summary()}")
+        if self.company_sheet_manager.index:
+            log(f"  → Drive 인덱스: {self.company_sheet_manager.index.summary()}")
+        log(f"  → {ANALYZER_NAME} Rate Limit: {self.llm_analyzer.rate_limiter.summary()}")
+        if hasattr(self.llm_analyzer, 'usage_summary'):
+            log(f"  → {ANALYZER_NAME} 토큰 사용량: {self.llm_analyzer.usage_summary()}")
+        sys.stdout.flush()
         
-        # 시트 업데이트
+        # 5. 예상토큰수 / 메타정보 일괄 업데이트 (Quota 절약)
         if token_updates and not self.dry_run:
             log("")
-            log("  시트에 토큰 정보 업데이트 중...")
-            sys.stdout.flush()
+            log("[5단계] 밸류업공시목록 예상토큰수 일괄 업데이트...")
             try:
                 updated = self.sheet_analyzer.batch_update_estimated_tokens(token_updates)
                 log(f"  → {updated}건 업데이트 완료")
             except Exception as e:
                 log(f"  → [ERROR] 시트 업데이트 실패: {e}")
-            sys.stdout.flush()
-        
-        log(f"  → 총 예상 토큰: {total_estimated_tokens:,} 토큰")
-        log(f"  → 캐시된 PDF: {len(pdf_cache)}건")
-        sys.stdout.flush()
-        
-        # Rate Limit 체크 (분당 100만 토큰 제한)
-        if total_estimated_tokens > 1_000_000:
-            log("")
-            log("  [WARN] 총 토큰이 분당 제한(1,000,000)을 초과합니다.")
-            log("  [WARN] 일부 공시만 분석하고, 나머지는 다음 실행에서 처리합니다.")
-        
-        # 4. 각 공시 분석
-        log("")
-        log("[4단계] 공시 분석 시작...")
-        sys.stdout.flush()
-        sys.stderr.flush()
-        
-        # Rate Limit 관리 변수
-        requests_this_minute = 0
-        tokens_this_minute = 0
-        minute_start_time = time.time()
         
-        # 메타 업데이트 일괄 처리용 리스트
-        meta_updates = []
-        
-        for idx, disclosure in enumerate(items_to_analyze, 1):
-            # 강제 flush
-            sys.stdout.flush()
-            
-            acptno = disclosure.get('접수번호', '')
-            company = disclosure.get('회사명', '')
-            gdrive_url = disclosure.get('구글드라이브링크', '')
-            
-            log("")
-            log(f"[{idx}/{len(items_to_analyze)}] {company} ({acptno})")
-            sys.stdout.flush()
-            
-            # Rate Limit 체크 (분당 15회, 100만 토큰)
-            elapsed = time.time() - minute_start_time
-            if elapsed >= 60:
-                # 1분 경과 시 카운터 리셋
-                requests_this_minute = 0
-                tokens_this_minute = 0
-                minute_start_time = time.time()
-                log("  [Rate Limit] 1분 경과, 카운터 리셋")
-            
-            # 분당 요청 수 체크
-            if requests_this_minute >= 14:  # 15회 제한에서 여유 1회
-                wait_time = 60 - elapsed + 5  # 5초 여유
-                log(f"  [Rate Limit] 분당 요청 제한 도달, {wait_time:.0f}초 대기...")
-                time.sleep(wait_time)
-                requests_this_minute = 0
-                tokens_this_minute = 0
-                minute_start_time = time.time()
-            
-            # 분당 토큰 체크
-            cached_data = pdf_cache.get(acptno, {})
-            estimated_tokens = cached_data.get('tokens', 0)
-            
-            if tokens_this_minute + estimated_tokens > 900_000:  # 100만에서 여유 10만
-                wait_time = 60 - elapsed + 5
-                log(f"  [Rate Limit] 분당 토큰 제한 도달, {wait_time:.0f}초 대기...")
-                time.sleep(wait_time)
-                requests_this_minute = 0
-                tokens_this_minute = 0
-                minute_start_time = time.time()
-            
-            # 구글 드라이브 링크 확인
-            if not gdrive_url:
-                log("  [WARN] 구글드라이브링크가 없습니다. 건너뜁니다.")
-                sys.stdout.flush()
-                if not self.dry_run:
-                    self.sheet_analyzer.save_error_result(disclosure, "구글드라이브링크 없음")
-                result['errors'] += 1
-                result['error_details'].append(f"{company}: 구글드라이브링크 없음")
-                continue
-            
-            try:
-                # 4-1. PDF 데이터 가져오기 (캐시 또는 새로 다운로드)
-                if acptno in pdf_cache:
-                    log("  [STEP 1] PDF 캐시에서 로드...")
-                    pdf_bytes = cached_data.get('pdf_bytes')
-                    pdf_text = cached_data.get('text', '')
-                    log(f"  [STEP 1 결과] pdf_bytes: {len(pdf_bytes) if pdf_bytes else 0} bytes, pdf_text: {len(pdf_text) if pdf_text else 0}자")
-                else:
-                    log("  [STEP 1] 구글 드라이브에서 PDF 다운로드 중...")
-                    sys.stdout.flush()
-                    pdf_bytes, pdf_text = self.pdf_extractor.get_pdf_and_text_from_gdrive(gdrive_url)
-                    log(f"  [STEP 1 결과] pdf_bytes: {len(pdf_bytes) if pdf_bytes else 0} bytes, pdf_text: {len(pdf_text) if pdf_text else 0}자")
-                
-                sys.stdout.flush()
-                
-                if not pdf_bytes:
-                    log("  [ERROR] PDF 다운로드 실패")
-                    sys.stdout.flush()
-                    if not self.dry_run:
-                        self.sheet_analyzer.save_error_result(disclosure, "PDF 다운로드 실패")
-                    result['errors'] += 1
-                    result['error_details'].append(f"{company}: PDF 다운로드 실패")
-                    continue
-                
-                # 4-2. LLM 분석 (텍스트 우선, PDF fallback)
-                log(f"  [STEP 2] {ANALYZER_NAME} 분석 시작...")
-                sys.stdout.flush()
-                
-                analysis_result = self.llm_analyzer.analyze(
-                    company_name=company,
-                    framework=self.framework,
-                    pdf_bytes=pdf_bytes,
-                    pdf_text=pdf_text
-                )
-                
-                # Rate Limit 카운터 업데이트 (성공/실패 무관하게 요청은 발생)
-                requests_this_minute += 1
-                tokens_this_minute += estimated_tokens
-                log(f"  [Rate Limit] 이번 분 요청: {requests_this_minute}/15, 토큰: {tokens_this_minute:,}/1,000,000")
-                
-                log(f"  [STEP 2 결과] analysis_result: {'성공' if analysis_result else '실패'}")
-                sys.stdout.flush()
-                
-                if not analysis_result:
-                    log(f"  [WARN] {ANALYZER_NAME} 분석 실패")
-                    sys.stdout.flush()
-                    if not self.dry_run:
-                        self.sheet_analyzer.save_error_result(disclosure, f"{ANALYZER_NAME} 분석 실패")
-                    result['errors'] += 1
-                    result['error_details'].append(f"{company}: {ANALYZER_NAME} 분석 실패")
-                    
-                    # 연속 실패 체크 (일일 할당량 초과 가능성)
-                    consecutive_failures = sum(1 for err in result['error_details'][-3:] if f'{ANALYZER_NAME} 분석 실패' in err)
-                    if consecutive_failures >= 3:
-                        log("")
-                        log(f"  [WARN] 연속 3회 {ANALYZER_NAME} 분석 실패 - Rate Limit 초과 가능성")
-                        log("  [WARN] 남은 공시 분석을 중단합니다. 나중에 다시 시도하세요.")
-                        break
-                    
-                    continue
-                
-                # 분석 방식 기록 (PDF_DIRECT 또는 TEXT_FIRST)
-                analysis_method = self.llm_analyzer.last_analysis_method
-                
-                # 4-3. 결과 저장
-                if self.dry_run:
-                    log("  [DRY-RUN] 저장 건너뜀")
-                    result['analyzed'] += 1
-                else:
-                    log("  [STEP 3] 결과 저장 중...")
-                    
-                    # 3-1. 메인 스프레드시트(분석결과 시트)에 저장
-                    success = self.sheet_analyzer.save_analysis_result(
-                        disclosure=disclosure,
-                        analysis_result=analysis_result,
-                        status="completed"
-                    )
-                    
-                    if success:
-                        result['analyzed'] += 1
-                        
-                        # 분석 항목 수 계산
-                        analysis_items = analysis_result.get('analysis_items', {})
-                        items_count = sum(1 for v in analysis_items.values() if v.get('level', 0) > 0)
-                        core_count = sum(1 for k, v in analysis_items.items() 
-                                        if v.get('level', 0) > 0 and v.get('is_core', False))
-                        
-                        # 3-2. 기업별 스프레드시트에 저장 (CompanySheetManager)
-                        company_sheet_url = ""
-                        if self.company_sheet_ready:
-                            stock_code = disclosure.get('종목코드', '')
-                            report_date = disclosure.get('공시일자', '')[:10] if disclosure.get('공시일자') else ''
-                            
-                            try:
-                                company_sheet_url = self.company_sheet_manager.add_analysis_result(
-                                    company_name=company,
-                                    stock_code=stock_code,
-                                    acptno=acptno,
-                                    report_date=report_date,
-                                    analysis_result=analysis_result
-                                ) or ""
-                                
-                                if company_sheet_url:
-                                    log(f"  [STEP 3] 기업별 시트 저장 완료")
-                            except RuntimeError as e:
-                                # Storage Quota 초과 또는 서비스 계정 폴더 존재 - 프로그램 종료
-                                log(f"")
-                                log(f"=" * 60)
-                                log(f"[FATAL ERROR] 기업별 시트 생성 실패!")
-                                log(f"  원인: {e}")
-                                log(f"  → 서비스 계정 소유 'ValueUp_analysis' 폴더를 삭제하고 다시 실행하세요.")
-                                log(f"=" * 60)
-                                sys.exit(1)
-                        
-                        # 3-3. 메타정보 업데이트 데이터 수집 (나중에 일괄 처리)
-                        meta_updates.append({
-                            '접수번호': acptno,
-                            '분석상태': 'completed',
-                            '분석항목수': items_count,
-                            'Core항목수': core_count,
-                            '기업시트링크': company_sheet_url
-                        })
-                    else:
-                        result['errors'] += 1
-                        result['error_details'].append(f"{company}: 저장 실패")
-                
-                # API 호출 간 딜레이 (Rate Limit 방지: 분당 15회 제한 고려)
-                log("  다음 분석 전 5초 대기...")
-                time.sleep(5)
-                
-            except Exception as e:
-                log(f"  [ERROR] 예외 발생: {e}")
-                if not self.dry_run:
-                    self.sheet_analyzer.save_error_result(disclosure, str(e))
-                result['errors'] += 1
-                result['error_details'].append(f"{company}: {str(e)[:50]}")
-        
-        # 5. 메타정보 일괄 업데이트 (Quota 절약)
         if meta_updates and not self.dry_run:
             log("")
             log("[5단계] 밸류업공시목록 메타정보 일괄 업데이트...")
@@ -504,7 +285,318 @@ class ValueUpAnalyzer:
         log(f"전체 분석 현황: 완료 {summary['completed']}건, 오류 {summary['error']}건")
         log("=" * 60)
         
+        self.pdf_extractor.close()
+        
         return result
+    
+    async def _run_pipeline(
+        self,
+        items: List[Dict],
+        result: Dict[str, Any],
+        token_updates: List[Dict],
+        meta_updates: List[Dict]
+    ):
+        """
+        분석 파이프라인 실행
+        
+        단계별로 크기가 제한된 큐로 연결되어 동시에 진행되므로,
+        LLM 분석/Rate Limit 대기 중에도 다음 PDF 다운로드와 추출이 계속됨.
+        블로킹 API(Drive, pdfplumber, gspread)는 스레드에서, LLM은 비동기 클라이언트로 실행.
+        
+        Args:
+            items: 분석 대상 공시 리스트
+            result: 실행 결과 딕셔너리 (analyzed/errors 갱신)
+            token_updates: 예상토큰수 업데이트 수집 리스트
+            meta_updates: 메타정보 업데이트 수집 리스트
+        """
+        extract_queue = asyncio.Queue(maxsize=max(self.PIPELINE_QUEUE_SIZE, self.EXTRACT_BATCH_SIZE))
+        analyze_queue = asyncio.Queue(maxsize=self.PIPELINE_QUEUE_SIZE)
+        write_queue = asyncio.Queue(maxsize=self.PIPELINE_QUEUE_SIZE)
+        stop = asyncio.Event()  # 연속 분석 실패 시 남은 작업 중단
+        
+        await asyncio.gather(
+            self._fetch_stage(items, extract_queue, write_queue, stop),
+            self._extract_stage(extract_queue, analyze_queue, write_queue, token_updates),
+            self._analyze_stage(analyze_queue, write_queue, stop),
+            self._write_stage(write_queue, result, meta_updates),
+        )
+    
+    async def _fetch_stage(
+        self,
+        items: List[Dict],
+        out_queue: asyncio.Queue,
+        write_queue: asyncio.Queue,
+        stop: asyncio.Event
+    ):
+        """[다운로드] Drive에서 PDF 다운로드 (로컬 캐시 우선)"""
+        try:
+            for idx, disclosure in enumerate(items, 1):
+                if stop.is_set():
+                    break
+                
+                job = AnalysisJob(idx=idx, total=len(items), disclosure=disclosure)
+                gdrive_url = disclosure.get('구글드라이브링크', '')
+                
+                if not gdrive_url:
+                    log(f"  {job.label} [WARN] 구글드라이브링크가 없습니다. 건너뜁니다.")
+                    job.error = "구글드라이브링크 없음"
+                    await write_queue.put(job)
+                    continue
+                
+                # Drive 클라이언트(httplib2)는 스레드 안전하지 않으므로 다운로드는 한 번에 1건
+                try:
+                    job.pdf_bytes = await asyncio.to_thread(
+                        self.pdf_extractor.download_pdf_from_gdrive_url, gdrive_url, acptno=job.acptno
+                    )
+                except Exception as e:
+                    log(f"  {job.label} [ERROR] PDF 다운로드 중 예외: {type(e).__name__}: {e}")
+                
+                if not job.pdf_bytes:
+                    log(f"  {job.label} [ERROR] PDF 다운로드 실패")
+                    job.error = "PDF 다운로드 실패"
+                    await write_queue.put(job)
+                    continue
+                
+                log(f"  {job.label} PDF 준비 완료: {len(job.pdf_bytes):,} bytes")
+                await out_queue.put(job)
+        finally:
+            await out_queue.put(None)
+            await write_queue.put(None)
+    
+    async def _extract_stage(
+        self,
+        in_queue: asyncio.Queue,
+        out_queue: asyncio.Queue,
+        write_queue: asyncio.Queue,
+        token_updates: List[Dict]
+    ):
+        """
+        [추출] 텍스트 추출 및 토큰 산정
+        
+        큐에 쌓인 PDF를 최대 EXTRACT_BATCH_SIZE건씩 모아 extract_many로 일괄 추출하므로,
+        페이지 수가 적은 PDF도 여러 건의 페이지 구간이 프로세스 풀에서 함께 처리됨.
+        """
+        try:
+            done = False
+            while not done:
+                job = await in_queue.get()
+                if job is None:
+                    break
+                
+                # 이미 대기 중인 작업만 추가로 모음 (다음 다운로드를 기다리지 않음)
+                batch = [job]
+                while len(batch) < self.EXTRACT_BATCH_SIZE and not in_queue.empty():
+                    job = in_queue.get_nowait()
+                    if job is None:
+                        done = True
+                        break
+                    batch.append(job)
+                
+                records = {}
+                if len(batch) > 1:
+                    try:
+                        records = await asyncio.to_thread(
+                            self.pdf_extractor.extract_many,
+                            {str(job.idx): job.pdf_bytes for job in batch}
+                        )
+                    except Exception as e:
+                        log(f"  [WARN] 일괄 추출 실패: {e} → 건별 추출")
+                
+                for job in batch:
+                    try:
+                        record = records.get(str(job.idx))
+                        if record is None:
+                            record = await asyncio.to_thread(self.pdf_extractor.extract_from_bytes, job.pdf_bytes)
+                        job.text = self.pdf_extractor.compose_text(record)
+                        job.tokens = record['estimated_tokens']
+                        token_updates.append({'접수번호': job.acptno, '예상토큰수': job.tokens})
+                        log(f"  {job.label} {job.tokens:,} 토큰 (페이지: {record['page_count']}, 텍스트: {len(job.text):,}자)")
+                    except Exception as e:
+                        # 텍스트 추출 실패해도 PDF 직접 전달로 분석 가능
+                        log(f"  {job.label} [WARN] 텍스트 추출 실패: {e} → PDF 직접 전달로 분석 시도 예정")
+                        job.tokens = self.pdf_extractor.estimate_tokens(pdf_bytes=job.pdf_bytes)
+                    
+                    await out_queue.put(job)
+        finally:
+            await out_queue.put(None)
+    
+    async def _analyze_stage(
+        self,
+        in_queue: asyncio.Queue,
+        write_queue: asyncio.Queue,
+        stop: asyncio.Event
+    ):
+        """[분석] LLM 분석 (rate_limiter 한도 내에서 여러 건을 동시에 진행)"""
+        limiter = self.llm_analyzer.rate_limiter
+        in_flight = set()
+        failures = {'consecutive': 0}
+        
+        try:
+            while (job := await in_queue.get()) is not None:
+                if stop.is_set():
+                    continue  # 중단 후에는 남은 작업을 버리고 큐만 비움
+                
+                task = asyncio.create_task(self._analyze_job(job, write_queue, stop, failures))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+                
+                # 동시 분석 수만큼 차 있으면 하나가 끝날 때까지 다음 작업을 받지 않음
+                if len(in_flight) >= limiter.max_concurrency:
+                    await asyncio.wait(set(in_flight), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+            await write_queue.put(None)
+    
+    async def _analyze_job(
+        self,
+        job: AnalysisJob,
+        write_queue: asyncio.Queue,
+        stop: asyncio.Event,
+        failures: Dict[str, int]
+    ):
+        """
+        공시 1건 LLM 분석
+        
+        Args:
+            job: 분석 작업
+            write_queue: 저장 단계 큐
+            stop: 중단 이벤트 (연속 실패 시 설정)
+            failures: 연속 실패 카운터 (분석 작업 간 공유)
+        """
+        log(f"  {job.label} {ANALYZER_NAME} 분석 시작...")
+        try:
+            job.analysis_result = await self.llm_analyzer.analyze(
+                company_name=job.company,
+                framework=self.framework,
+                pdf_bytes=job.pdf_bytes,
+                pdf_text=job.text,
+                estimated_tokens=job.tokens
+            )
+        except Exception as e:
+            log(f"  {job.label} [ERROR] 예외 발생: {e}")
+            job.error = str(e)
+        
+        # 저장 단계에 PDF 바이트는 필요 없음
+        job.pdf_bytes = None
+        
+        if job.error:
+            await write_queue.put(job)
+            return
+        
+        if not job.analysis_result:
+            log(f"  {job.label} [WARN] {ANALYZER_NAME} 분석 실패")
+            job.error = f"{ANALYZER_NAME} 분석 실패"
+            await write_queue.put(job)
+            
+            # 연속 실패 체크 (일일 할당량 초과 가능성)
+            failures['consecutive'] += 1
+            if failures['consecutive'] >= 3 and not stop.is_set():
+                log("")
+                log(f"  [WARN] 연속 3회 {ANALYZER_NAME} 분석 실패 - Rate Limit 초과 가능성")
+                log("  [WARN] 남은 공시 분석을 중단합니다. 나중에 다시 시도하세요.")
+                stop.set()
+            return
+        
+        failures['consecutive'] = 0
+        await write_queue.put(job)
+    
+    async def _write_stage(
+        self,
+        in_queue: asyncio.Queue,
+        result: Dict[str, Any],
+        meta_updates: List[Dict]
+    ):
+        """[저장] 분석 결과 / 오류를 시트에 기록"""
+        # 다운로드 단계(링크 없음/다운로드 실패)와 분석 단계가 모두 종료 신호를 보냄
+        remaining_producers = 2
+        
+        while remaining_producers:
+            job = await in_queue.get()
+            if job is None:
+                remaining_producers -= 1
+                continue
+            
+            company = job.company
+            
+            if job.error:
+                if not self.dry_run:
+                    await asyncio.to_thread(self.sheet_analyzer.save_error_result, job.disclosure, job.error)
+                result['errors'] += 1
+                result['error_details'].append(f"{company}: {job.error[:50]}")
+                continue
+            
+            if self.dry_run:
+                log(f"  {job.label} [DRY-RUN] 저장 건너뜀")
+                result['analyzed'] += 1
+                continue
+            
+            try:
+                # 메인 스프레드시트(분석결과 시트)에 저장
+                success = await asyncio.to_thread(
+                    self.sheet_analyzer.save_analysis_result,
+                    disclosure=job.disclosure,
+                    analysis_result=job.analysis_result,
+                    status="completed"
+                )
+                
+                if not success:
+                    result['errors'] += 1
+                    result['error_details'].append(f"{company}: 저장 실패")
+                    continue
+                
+                result['analyzed'] += 1
+                
+                # 분석 항목 수 계산
+                analysis_items = job.analysis_result.get('analysis_items', {})
+                items_count = sum(1 for v in analysis_items.values() if v.get('level', 0) > 0)
+                core_count = sum(1 for k, v in analysis_items.items() 
+                                if v.get('level', 0) > 0 and v.get('is_core', False))
+                
+                # 기업별 스프레드시트에 저장 (CompanySheetManager)
+                company_sheet_url = ""
+                if self.company_sheet_ready:
+                    stock_code = job.disclosure.get('종목코드', '')
+                    report_date = job.disclosure.get('공시일자', '')[:10] if job.disclosure.get('공시일자') else ''
+                    
+                    try:
+                        company_sheet_url = await asyncio.to_thread(
+                            self.company_sheet_manager.add_analysis_result,
+                            company_name=company,
+                            stock_code=stock_code,
+                            acptno=job.acptno,
+                            report_date=report_date,
+                            analysis_result=job.analysis_result
+                        ) or ""
+                        
+                        if company_sheet_url:
+                            log(f"  {job.label} 기업별 시트 저장 완료")
+                    except RuntimeError as e:
+                        # Storage Quota 초과 또는 서비스 계정 폴더 존재 - 프로그램 종료
+                        log(f"")
+                        log(f"=" * 60)
+                        log(f"[FATAL ERROR] 기업별 시트 생성 실패!")
+                        log(f"  원인: {e}")
+                        log(f"  → 서비스 계정 소유 'ValueUp_analysis' 폴더를 삭제하고 다시 실행하세요.")
+                        log(f"=" * 60)
+                        sys.exit(1)
+                
+                # 메타정보 업데이트 데이터 수집 (나중에 일괄 처리)
+                meta_updates.append({
+                    '접수번호': job.acptno,
+                    '분석상태': 'completed',
+                    '분석항목수': items_count,
+                    'Core항목수': core_count,
+                    '기업시트링크': company_sheet_url
+                })
+                log(f"  {job.label} 결과 저장 완료")
+                
+            except Exception as e:
+                log(f"  {job.label} [ERROR] 저장 중 예외 발생: {e}")
+                if not self.dry_run:
+                    await asyncio.to_thread(self.sheet_analyzer.save_error_result, job.disclosure, str(e))
+                result['errors'] += 1
+                result['error_details'].append(f"{company}: {str(e)[:50]}")
 
 
 def parse_args():
@@ -11,6 +11,10 @@ OAuth2 인증 우선, 서비스 계정 fallback
   
 - 서비스 계정 방식 (fallback):
   - GOOGLE_SERVICE: 서비스 계정 JSON
+
+- PDF 로컬 캐시 (01_valueup_monitor/pdf_cache.py 공유):
+  - VALUEUP_PDF_CACHE_DIR: 캐시 디렉토리
+  - VALUEUP_PDF_CACHE_MAX_MB: 최대 캐시 크기 (MB)
 """
 
 import os
@@ -18,9 +22,12 @@ import sys
 import re
 import io
 import json
+import hashlib
 import logging
+import math
 import tempfile
-from typing import Optional, Tuple, Dict, Any
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Optional, Tuple, Dict, Any, Iterator, List
 from datetime import datetime
 
 # pdfminer 경고 메시지 숨기기 (pdfplumber 내부에서 발생)
@@ -48,6 +55,19 @@ try:
 except ImportError:
     HAS_GOOGLE_DRIVE = False
 
+# PDF 로컬 캐시 (모니터와 공유)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '01_valueup_monitor'))
+try:
+    from pdf_cache import PDFCache
+    HAS_PDF_CACHE = True
+except ImportError:
+    HAS_PDF_CACHE = False
+
+from extraction_cache import ExtractionCache
+
+# 추출 로직(페이지/테이블 처리 방식) 변경 시 올려서 추출 캐시 무효화
+EXTRACTOR_VERSION = "1"
+
 sys.stdout.reconfigure(line_buffering=True)
 
 
@@ -59,6 +79,54 @@ def log(message: str):
     sys.stderr.flush()
 
 
+def format_table(table: list) -> str:
+    """
+    테이블 데이터를 텍스트로 포맷
+    
+    Args:
+        table: 2차원 리스트 형태의 테이블 데이터
+        
+    Returns:
+        포맷된 테이블 텍스트
+    """
+    if not table:
+        return ""
+    
+    lines = []
+    for row in table:
+        if row:
+            cells = [str(cell).strip() if cell else "" for cell in row]
+            if any(cells):  # 빈 행 제외
+                lines.append(" | ".join(cells))
+    
+    return "\n".join(lines)
+
+
+def extract_page_range(pdf_bytes: bytes, start: int, end: Optional[int]) -> List[Dict[str, Any]]:
+    """
+    pdfplumber로 페이지 구간 추출 (프로세스 풀 워커에서도 실행되므로 모듈 레벨 함수)
+    
+    Args:
+        pdf_bytes: PDF 바이트 데이터
+        start: 시작 페이지 인덱스 (0-based)
+        end: 끝 페이지 인덱스 (미포함, None이면 마지막까지)
+        
+    Returns:
+        [{'text': str, 'tables': [str, ...]}, ...]
+    """
+    logging.getLogger('pdfminer').setLevel(logging.ERROR)
+    
+    pages = []
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        for page in pdf.pages[start:end]:
+            tables = [format_table(table) for table in page.extract_tables() if table]
+            pages.append({
+                'text': page.extract_text() or '',
+                'tables': [t for t in tables if t]
+            })
+    return pages
+
+
 class PDFExtractor:
     """PDF 다운로드 및 텍스트 추출 (OAuth2 + 서비스 계정 지원)"""
     
@@ -91,6 +159,28 @@ class PDFExtractor:
         self.drive_service = None
         self.auth_method = None
         
+        # PDF 로컬 캐시 (Drive 재다운로드 방지)
+        self.pdf_cache = None
+        if HAS_PDF_CACHE:
+            try:
+                self.pdf_cache = PDFCache()
+            except Exception as e:
+                log(f"[WARN] PDF 캐시 사용 불가: {e}")
+        
+        # 추출 결과 캐시 (같은 PDF 재파싱 방지)
+        self.extraction_cache = None
+        self._last_record = None  # (digest, record) - 직전 추출 결과
+        
+        # 병렬 추출 (VALUEUP_PARALLEL_MIN_PAGES 이상 PDF 또는 여러 PDF 일괄 추출 시 사용)
+        self.extract_workers = int(os.environ.get('VALUEUP_EXTRACT_WORKERS', os.cpu_count() or 1))
+        self.parallel_min_pages = int(os.environ.get('VALUEUP_PARALLEL_MIN_PAGES', '16'))
+        self._pool: Optional[ProcessPoolExecutor] = None
+        try:
+            library = 'pdfplumber' if HAS_PDFPLUMBER else 'PyPDF2' if HAS_PYPDF2 else 'none'
+            self.extraction_cache = ExtractionCache(f"{EXTRACTOR_VERSION}-{library}")
+        except Exception as e:
+            log(f"[WARN] 추출 캐시 사용 불가: {e}")
+        
         # PDF 추출 라이브러리 확인
         if HAS_PDFPLUMBER:
             log("PDF 추출 라이브러리: pdfplumber")
@@ -192,16 +282,23 @@ class PDFExtractor:
         
         return None
     
-    def download_pdf_from_gdrive(self, file_id: str) -> Optional[bytes]:
+    def download_pdf_from_gdrive(self, file_id: str, acptno: Optional[str] = None) -> Optional[bytes]:
         """
-        구글 드라이브에서 PDF 다운로드
+        구글 드라이브에서 PDF 다운로드 (로컬 캐시 우선)
         
         Args:
             file_id: 파일 ID
+            acptno: 접수번호 (모니터가 저장한 캐시 조회용)
             
         Returns:
             PDF 바이트 데이터 또는 None
         """
+        if self.pdf_cache:
+            pdf_bytes = self.pdf_cache.get(acptno=acptno, drive_id=file_id)
+            if pdf_bytes:
+                log(f"  PDF 캐시 적중: {len(pdf_bytes):,} bytes (다운로드 생략)")
+                return pdf_bytes
+        
         if not self.drive_service:
             log("  [ERROR] Google Drive 서비스가 초기화되지 않았습니다.")
             return None
@@ -233,6 +330,8 @@ class PDFExtractor:
             
             if pdf_bytes[:4] == b'%PDF':
                 log(f"  PDF 다운로드 완료: {len(pdf_bytes):,} bytes")
+                if self.pdf_cache:
+                    self.pdf_cache.put(pdf_bytes, acptno=acptno, drive_id=file_id)
                 return pdf_bytes
             else:
                 log(f"  [WARN] PDF가 아닌 파일입니다: {mime_type}")
@@ -242,12 +341,13 @@ class PDFExtractor:
             log(f"  [ERROR] 드라이브 다운로드 실패: {e}")
             return None
     
-    def download_pdf_from_gdrive_url(self, gdrive_url: str) -> Optional[bytes]:
+    def download_pdf_from_gdrive_url(self, gdrive_url: str, acptno: Optional[str] = None) -> Optional[bytes]:
         """
         구글 드라이브 URL에서 PDF 다운로드
         
         Args:
             gdrive_url: 구글 드라이브 공유 링크
+            acptno: 접수번호 (캐시 조회용)
             
         Returns:
             PDF 바이트 데이터 또는 None
@@ -257,93 +357,236 @@ class PDFExtractor:
             log(f"  [ERROR] 파일 ID를 추출할 수 없습니다: {gdrive_url[:50]}...")
             return None
         
-        return self.download_pdf_from_gdrive(file_id)
+        return self.download_pdf_from_gdrive(file_id, acptno=acptno)
     
-    def extract_text_from_bytes(self, pdf_bytes: bytes) -> str:
+    def extract_from_bytes(self, pdf_bytes: bytes) -> Dict[str, Any]:
         """
-        PDF 바이트에서 텍스트 추출
+        PDF 바이트에서 페이지별 텍스트/테이블 추출 (추출 캐시 우선)
         
         Args:
             pdf_bytes: PDF 바이트 데이터
             
         Returns:
-            추출된 텍스트
+            {
+                'library': str,          # pdfplumber / PyPDF2 / '' (실패)
+                'page_count': int,
+                'pages': [{'text': str, 'tables': [str, ...]}, ...],
+                'estimated_tokens': int
+            }
         """
-        # 임시 파일에 저장
-        temp_path = os.path.join(
-            self.temp_dir, 
-            f"temp_{datetime.now().strftime('%Y%m%d%H%M%S%f')}.pdf"
-        )
+        return self.extract_many({'': pdf_bytes})['']
+    
+    def extract_many(self, pdfs: Dict[str, bytes]) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 PDF 일괄 추출 (캐시 미스분은 페이지 단위로 나눠 프로세스 풀에서 병렬 처리)
         
-        try:
-            with open(temp_path, 'wb') as f:
-                f.write(pdf_bytes)
+        Args:
+            pdfs: {키(접수번호 등): PDF 바이트}
             
-            text = self.extract_text_from_file(temp_path)
-            return text
+        Returns:
+            {키: extract_from_bytes 결과}
+        """
+        results = {}
+        pending = {}
+        for key, pdf_bytes in pdfs.items():
+            digest = hashlib.sha256(pdf_bytes).hexdigest()
+            record = self._cached_record(digest)
+            if record is not None:
+                results[key] = record
+            else:
+                pending[key] = (digest, pdf_bytes)
+        
+        # 배치 전체의 페이지 구간을 먼저 모두 제출 (작은 PDF 여러 개도 코어 활용)
+        shards = {}
+        pool = self._get_pool() if pending and HAS_PDFPLUMBER else None
+        if pool:
+            for key, (digest, pdf_bytes) in pending.items():
+                page_count = self._count_pdf_pages(pdf_bytes)
+                if page_count >= self.parallel_min_pages or (len(pending) > 1 and page_count > 0):
+                    shards[key] = self._submit_page_shards(pool, pdf_bytes, page_count)
+        
+        for key, (digest, pdf_bytes) in pending.items():
+            results[key] = self._build_record(digest, pdf_bytes, shards.get(key))
+        
+        return results
+    
+    def iter_pages(self, pdf_bytes: bytes) -> Iterator[Dict[str, Any]]:
+        """
+        페이지별 추출 결과를 페이지 순서대로 생성 (큰 PDF는 프로세스 풀에서 분할 처리)
+        
+        Args:
+            pdf_bytes: PDF 바이트 데이터
             
+        Yields:
+            {'text': str, 'tables': [str, ...]} (페이지 순서)
+        """
+        record = self._cached_record(hashlib.sha256(pdf_bytes).hexdigest())
+        if record is not None:
+            yield from record['pages']
+            return
+        
+        if not HAS_PDFPLUMBER:
+            yield from self._extract_pages_pypdf2(pdf_bytes)
+            return
+        
+        page_count = self._count_pdf_pages(pdf_bytes)
+        pool = self._get_pool() if page_count >= self.parallel_min_pages else None
+        if pool:
+            yield from self._iter_shards(self._submit_page_shards(pool, pdf_bytes, page_count))
+        else:
+            yield from extract_page_range(pdf_bytes, 0, None)
+    
+    def _cached_record(self, digest: str) -> Optional[Dict[str, Any]]:
+        """직전 결과 / 추출 캐시 조회"""
+        if self._last_record and self._last_record[0] == digest:
+            return self._last_record[1]
+        
+        record = self.extraction_cache.get(digest) if self.extraction_cache else None
+        if record is not None:
+            log(f"  추출 캐시 적중: {record['page_count']}페이지 (파싱 생략)")
+            self._last_record = (digest, record)
+        return record
+    
+    def _get_pool(self) -> Optional[ProcessPoolExecutor]:
+        """추출용 프로세스 풀 (워커 1개 이하면 None)"""
+        if self.extract_workers <= 1:
+            return None
+        if self._pool is None:
+            try:
+                self._pool = ProcessPoolExecutor(max_workers=self.extract_workers)
+            except Exception as e:
+                log(f"  [WARN] 프로세스 풀 생성 실패, 순차 추출: {e}")
+                self.extract_workers = 1
+                return None
+        return self._pool
+    
+    def _submit_page_shards(self, pool: ProcessPoolExecutor, pdf_bytes: bytes, page_count: int) -> List[Future]:
+        """페이지 구간별 추출 작업 제출 (워커당 약 2개 구간)"""
+        chunk = max(1, math.ceil(page_count / (self.extract_workers * 2)))
+        return [
+            pool.submit(extract_page_range, pdf_bytes, start, min(start + chunk, page_count))
+            for start in range(0, page_count, chunk)
+        ]
+    
+    def _iter_shards(self, futures: List[Future]) -> Iterator[Dict[str, Any]]:
+        """제출 순서(= 페이지 순서)대로 구간 결과를 풀어서 생성"""
+        try:
+            for future in futures:
+                yield from future.result()
         finally:
-            # 임시 파일 삭제
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+            for future in futures:
+                future.cancel()
     
-    def extract_text_from_file(self, pdf_path: str) -> str:
+    def _build_record(self, digest: str, pdf_bytes: bytes, shards: Optional[List[Future]] = None) -> Dict[str, Any]:
         """
-        PDF 파일에서 텍스트 추출
+        추출 결과 생성 및 캐시 저장 (pdfplumber 우선, PyPDF2 fallback)
         
         Args:
-            pdf_path: PDF 파일 경로
+            digest: PDF SHA-256
+            pdf_bytes: PDF 바이트 데이터
+            shards: 미리 제출한 페이지 구간 작업 (없으면 현재 프로세스에서 추출)
             
         Returns:
-            추출된 텍스트
+            extract_from_bytes 결과
         """
-        text_parts = []
+        record = {'library': '', 'page_count': 0, 'pages': []}
         
         # pdfplumber 시도 (더 나은 테이블 추출)
         if HAS_PDFPLUMBER:
+            pages = None
+            if shards:
+                try:
+                    pages = list(self._iter_shards(shards))
+                except Exception as e:
+                    log(f"  [WARN] 병렬 추출 실패, 순차 추출로 재시도: {e}")
             try:
-                with pdfplumber.open(pdf_path) as pdf:
-                    for i, page in enumerate(pdf.pages):
-                        page_text = page.extract_text()
-                        if page_text:
-                            text_parts.append(f"[페이지 {i+1}]\n{page_text}")
-                        
-                        # 테이블 추출 시도
-                        tables = page.extract_tables()
-                        for table_idx, table in enumerate(tables):
-                            if table:
-                                table_text = self._format_table(table)
-                                if table_text:
-                                    text_parts.append(f"[테이블 {table_idx+1}]\n{table_text}")
-                
-                if text_parts:
-                    full_text = "\n\n".join(text_parts)
-                    log(f"  텍스트 추출 완료 (pdfplumber): {len(full_text):,} 글자")
-                    return full_text
-                    
+                if pages is None:
+                    pages = extract_page_range(pdf_bytes, 0, None)
+                record['page_count'] = len(pages)
+                if any(p['text'] or p['tables'] for p in pages):
+                    record.update(library='pdfplumber', pages=pages)
             except Exception as e:
                 log(f"  [WARN] pdfplumber 추출 실패: {e}")
         
         # PyPDF2 fallback
-        if HAS_PYPDF2:
+        if not record['library'] and HAS_PYPDF2:
             try:
-                with open(pdf_path, 'rb') as f:
-                    reader = PdfReader(f)
-                    for i, page in enumerate(reader.pages):
-                        page_text = page.extract_text()
-                        if page_text:
-                            text_parts.append(f"[페이지 {i+1}]\n{page_text}")
-                
-                if text_parts:
-                    full_text = "\n\n".join(text_parts)
-                    log(f"  텍스트 추출 완료 (PyPDF2): {len(full_text):,} 글자")
-                    return full_text
-                    
+                pages = self._extract_pages_pypdf2(pdf_bytes)
+                record['page_count'] = len(pages)
+                if any(p['text'] for p in pages):
+                    record.update(library='PyPDF2', pages=pages)
             except Exception as e:
                 log(f"  [WARN] PyPDF2 추출 실패: {e}")
         
-        log("  [ERROR] 텍스트 추출 실패")
-        return ""
+        record['estimated_tokens'] = self._estimate_tokens_from(
+            self.compose_text(record), record['page_count'], len(pdf_bytes)
+        )
+        if self.extraction_cache:
+            self.extraction_cache.put(digest, record)
+        
+        self._last_record = (digest, record)
+        return record
+    
+    def _extract_pages_pypdf2(self, pdf_bytes: bytes) -> List[Dict[str, Any]]:
+        """PyPDF2로 페이지별 텍스트 추출 (테이블 없음)"""
+        reader = PdfReader(io.BytesIO(pdf_bytes))
+        return [{'text': page.extract_text() or '', 'tables': []} for page in reader.pages]
+    
+    def close(self):
+        """프로세스 풀 종료"""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+    
+    def compose_text(self, record: Dict[str, Any]) -> str:
+        """
+        페이지별 추출 결과를 분석용 텍스트로 조합
+        
+        Args:
+            record: extract_from_bytes 결과
+            
+        Returns:
+            "[페이지 N]" / "[테이블 N]" 구분자가 포함된 텍스트
+        """
+        text_parts = []
+        for i, page in enumerate(record.get('pages', [])):
+            if page['text']:
+                text_parts.append(f"[페이지 {i+1}]\n{page['text']}")
+            for table_idx, table_text in enumerate(page['tables']):
+                text_parts.append(f"[테이블 {table_idx+1}]\n{table_text}")
+        return "\n\n".join(text_parts)
+    
+    def extract_text_from_bytes(self, pdf_bytes: bytes) -> str:
+        """
+        PDF 바이트에서 텍스트 추출
+        
+        Args:
+            pdf_bytes: PDF 바이트 데이터
+            
+        Returns:
+            추출된 텍스트
+        """
+        record = self.extract_from_bytes(pdf_bytes)
+        full_text = self.compose_text(record)
+        
+        if full_text:
+            log(f"  텍스트 추출 완료 ({record['library']}): {len(full_text):,} 글자")
+        else:
+            log("  [ERROR] 텍스트 추출 실패")
+        return full_text
+    
+    def extract_text_from_file(self, pdf_path: str) -> str:
+        """
+        PDF 파일에서 텍스트 추출
+        
+        Args:
+            pdf_path: PDF 파일 경로
+            
+        Returns:
+            추출된 텍스트
+        """
+        with open(pdf_path, 'rb') as f:
+            return self.extract_text_from_bytes(f.read())
     
     def _format_table(self, table: list) -> str:
         """
@@ -355,19 +598,13 @@ class PDFExtractor:
         Returns:
             포맷된 테이블 텍스트
         """
-        if not table:
-            return ""
-        
-        lines = []
-        for row in table:
-            if row:
-                cells = [str(cell).strip() if cell else "" for cell in row]
-                if any(cells):  # 빈 행 제외
-                    lines.append(" | ".join(cells))
-        
-        return "\n".join(lines)
+        return format_table(table)
     
-    def get_pdf_and_text_from_gdrive(self, gdrive_url: str) -> Tuple[Optional[bytes], str]:
+    def get_pdf_and_text_from_gdrive(
+        self,
+        gdrive_url: str,
+        acptno: Optional[str] = None
+    ) -> Tuple[Optional[bytes], str]:
         """
         구글 드라이브에서 PDF 다운로드 및 텍스트 추출
         
@@ -375,13 +612,14 @@ class PDFExtractor:
         
         Args:
             gdrive_url: 구글 드라이브 공유 링크
+            acptno: 접수번호 (캐시 조회용)
             
         Returns:
             (PDF 바이트, 추출된 텍스트) 튜플
             - PDF 다운로드 성공 시: (bytes, text) - text는 빈 문자열일 수 있음
             - PDF 다운로드 실패 시: (None, "")
         """
-        pdf_bytes = self.download_pdf_from_gdrive_url(gdrive_url)
+        pdf_bytes = self.download_pdf_from_gdrive_url(gdrive_url, acptno=acptno)
         
         if not pdf_bytes:
             log("  [ERROR] PDF 다운로드 실패 - 구글드라이브 링크 또는 인증 확인 필요")
@@ -419,27 +657,40 @@ class PDFExtractor:
         Returns:
             예상 토큰 수
         """
-        # 1. 텍스트가 있으면 텍스트 기반 추정
         if text and len(text) > 100:
-            # 한글/영문 혼합 기준: 평균 2 토큰/글자
-            estimated = int(len(text) * 2.0)
-            return estimated
+            return self._estimate_tokens_from(text, 0, 0)
         
-        # 2. PDF 바이트가 있으면 페이지 수 기반 추정 (이미지 PDF 가정)
         if pdf_bytes:
-            page_count = self._count_pdf_pages(pdf_bytes)
-            if page_count > 0:
-                # 이미지 PDF: 페이지당 258 토큰 + 여유분
-                estimated = page_count * 300
-                return estimated
-            
-            # 페이지 수 확인 실패 시 바이트 기반 추정
-            # 일반적으로 PDF 1KB ≈ 50-100 토큰
-            estimated = int(len(pdf_bytes) / 1024 * 75)
-            return estimated
+            return self._estimate_tokens_from(text or '', self._count_pdf_pages(pdf_bytes), len(pdf_bytes))
         
         return 0
     
+    def _estimate_tokens_from(self, text: str, page_count: int, file_size: int) -> int:
+        """
+        텍스트 길이 / 페이지 수 / 파일 크기로 토큰 수 추정
+        
+        Args:
+            text: 추출된 텍스트
+            page_count: 페이지 수
+            file_size: PDF 바이트 크기
+            
+        Returns:
+            예상 토큰 수
+        """
+        # 1. 텍스트가 있으면 텍스트 기반 추정
+        if text and len(text) > 100:
+            # 한글/영문 혼합 기준: 평균 2 토큰/글자
+            return int(len(text) * 2.0)
+        
+        # 2. 페이지 수 기반 추정 (이미지 PDF 가정)
+        if page_count > 0:
+            # 이미지 PDF: 페이지당 258 토큰 + 여유분
+            return page_count * 300
+        
+        # 3. 페이지 수 확인 실패 시 바이트 기반 추정
+        # 일반적으로 PDF 1KB ≈ 50-100 토큰
+        return int(file_size / 1024 * 75)
+    
     def _count_pdf_pages(self, pdf_bytes: bytes) -> int:
         """
         PDF 페이지 수 확인
@@ -450,22 +701,21 @@ class PDFExtractor:
         Returns:
             페이지 수 (실패 시 0)
         """
-        temp_path = os.path.join(
-            self.temp_dir, 
-            f"temp_count_{datetime.now().strftime('%Y%m%d%H%M%S%f')}.pdf"
-        )
+        # 이미 추출했거나 캐시된 PDF면 다시 열지 않음
+        digest = hashlib.sha256(pdf_bytes).hexdigest()
+        if self._last_record and self._last_record[0] == digest:
+            return self._last_record[1]['page_count']
+        if self.extraction_cache:
+            record = self.extraction_cache.get(digest)
+            if record is not None:
+                return record['page_count']
         
         try:
-            with open(temp_path, 'wb') as f:
-                f.write(pdf_bytes)
-            
             if HAS_PYPDF2:
-                with open(temp_path, 'rb') as f:
-                    reader = PdfReader(f)
-                    return len(reader.pages)
+                return len(PdfReader(io.BytesIO(pdf_bytes)).pages)
             
             if HAS_PDFPLUMBER:
-                with pdfplumber.open(temp_path) as pdf:
+                with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
                     return len(pdf.pages)
             
             return 0
@@ -473,17 +723,14 @@ class PDFExtractor:
         except Exception as e:
             log(f"  [WARN] 페이지 수 확인 실패: {e}")
             return 0
-            
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
     
-    def get_pdf_info(self, gdrive_url: str) -> Dict[str, Any]:
+    def get_pdf_info(self, gdrive_url: str, acptno: Optional[str] = None) -> Dict[str, Any]:
         """
         PDF 정보 조회 (다운로드 + 텍스트 추출 + 토큰 추정)
         
         Args:
             gdrive_url: 구글 드라이브 공유 링크
+            acptno: 접수번호 (캐시 조회용)
             
         Returns:
             {
@@ -502,14 +749,15 @@ class PDFExtractor:
             'file_size': 0
         }
         
-        pdf_bytes, text = self.get_pdf_and_text_from_gdrive(gdrive_url)
+        pdf_bytes, text = self.get_pdf_and_text_from_gdrive(gdrive_url, acptno=acptno)
         
         if pdf_bytes:
             result['pdf_bytes'] = pdf_bytes
             result['text'] = text
             result['file_size'] = len(pdf_bytes)
-            result['page_count'] = self._count_pdf_pages(pdf_bytes)
-            result['estimated_tokens'] = self.estimate_tokens(pdf_bytes, text)
+            record = self.extract_from_bytes(pdf_bytes)
+            result['page_count'] = record['page_count']
+            result['estimated_tokens'] = record['estimated_tokens']
         
         return result
 
@@ -0,0 +1,204 @@
+"""
+LLM API 속도 제어 모듈
+Claude/Gemini 분석기가 공유하는 비동기 Rate Limiter (모델별 요청 버킷 + 토큰 버킷)
+
+- 요청 버킷: 분당 요청 수 (RPM)
+- 토큰 버킷: 분당 입력 토큰 수 (TPM)
+- 429 응답의 Retry-After 만큼 해당 모델의 모든 요청을 보류
+- 동시에 진행 중인 요청 수 제한
+
+환경변수:
+- VALUEUP_LLM_RPM: 분당 요청 수 (기본: 14)
+- VALUEUP_LLM_TPM: 분당 입력 토큰 수 (기본: 900000)
+- VALUEUP_LLM_CONCURRENCY: 동시 분석 수 (기본: 3)
+- VALUEUP_LLM_LIMITS: 모델별 설정 JSON
+    예: {"claude-3-5-haiku-20241022": {"rpm": 50, "tpm": 50000, "concurrency": 4}}
+
+사용법:
+    limiter = get_rate_limiter("claude-3-5-haiku-20241022")
+
+    async with limiter.slot(estimated_tokens):
+        response = await client.messages.create(...)
+"""
+
+import asyncio
+import json
+import os
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Dict, Optional
+
+
+def log(message: str):
+    """타임스탬프와 함께 로그 출력"""
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    print(f"[{timestamp}] {message}", flush=True)
+
+
+# 모델 공통 기본값 (Claude Haiku / Gemini Flash 무료 등급 모두 분당 15회, 100만 토큰보다 약간 낮게)
+DEFAULT_RPM = 14
+DEFAULT_TPM = 900_000
+DEFAULT_CONCURRENCY = 3
+
+
+class MinuteBucket:
+    """분당 한도 기반 토큰 버킷 (예약 방식: 먼저 차감하고 부족분만큼 대기)"""
+
+    def __init__(self, per_minute: float):
+        """
+        초기화
+
+        Args:
+            per_minute: 분당 허용량 (0 이하면 제한 없음)
+        """
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self._level = self.capacity
+        self._updated = time.monotonic()
+
+    def reserve(self, amount: float, now: float) -> float:
+        """
+        허용량 예약
+
+        Args:
+            amount: 사용할 양 (버킷 용량을 넘으면 용량으로 제한)
+            now: 현재 시각 (time.monotonic)
+
+        Returns:
+            예약분을 쓸 수 있을 때까지 기다려야 하는 시간 (초)
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        self._level = min(self.capacity, self._level + (now - self._updated) * self.rate)
+        self._updated = now
+        self._level -= min(amount, self.capacity)
+        return max(0.0, -self._level / self.rate)
+
+
+class RateLimiter:
+    """모델 단위 비동기 Rate Limiter"""
+
+    def __init__(
+        self,
+        model_name: str,
+        requests_per_minute: float = DEFAULT_RPM,
+        tokens_per_minute: float = DEFAULT_TPM,
+        max_concurrency: int = DEFAULT_CONCURRENCY
+    ):
+        """
+        초기화
+
+        Args:
+            model_name: 모델명 (로그용)
+            requests_per_minute: 분당 요청 수 (0 이하면 제한 없음)
+            tokens_per_minute: 분당 입력 토큰 수 (0 이하면 제한 없음)
+            max_concurrency: 동시 요청 수
+        """
+        self.model_name = model_name
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_concurrency = max(1, int(max_concurrency))
+
+        self._requests = MinuteBucket(requests_per_minute)
+        self._tokens = MinuteBucket(tokens_per_minute)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._blocked_until = 0.0
+
+        # 실행 통계
+        self.request_count = 0
+        self.token_count = 0
+        self.throttled_count = 0   # 429 응답 수
+        self.total_wait = 0.0      # 대기한 누적 시간 (초)
+
+    async def acquire(self, tokens: int = 0) -> float:
+        """
+        요청 1건 + 입력 토큰 예약 (한도를 넘으면 대기)
+
+        Args:
+            tokens: 예상 입력 토큰 수
+
+        Returns:
+            대기한 시간 (초)
+        """
+        now = time.monotonic()
+        # 두 버킷 모두 이 시점에 예약해 두므로 동시에 들어온 요청도 순서대로 분산됨
+        wait_time = max(
+            self._requests.reserve(1, now),
+            self._tokens.reserve(tokens, now),
+            self._blocked_until - now
+        )
+        self.request_count += 1
+        self.token_count += tokens
+
+        if wait_time > 0:
+            log(f"    → [Rate Limit] {self.model_name}: {wait_time:.1f}초 대기")
+            self.total_wait += wait_time
+            await asyncio.sleep(wait_time)
+        return max(0.0, wait_time)
+
+    def backoff(self, seconds: float):
+        """
+        서버가 429로 거절한 경우 해당 모델의 다음 요청을 모두 보류
+
+        Args:
+            seconds: 보류 시간 (Retry-After)
+        """
+        self.throttled_count += 1
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    @asynccontextmanager
+    async def slot(self, tokens: int = 0):
+        """
+        요청 슬롯 획득 (동시 요청 수 제한 + 요청/토큰 버킷)
+
+        Args:
+            tokens: 예상 입력 토큰 수
+        """
+        async with self._semaphore:
+            await self.acquire(tokens)
+            yield
+
+    def summary(self) -> str:
+        """실행 통계 요약 문자열"""
+        return (f"요청 {self.request_count}건, 입력 토큰 {self.token_count:,}, "
+                f"429 응답 {self.throttled_count}건, 대기 {self.total_wait:.0f}초")
+
+
+_limiters: Dict[str, RateLimiter] = {}
+
+
+def _model_config(model_name: str) -> Dict:
+    """VALUEUP_LLM_LIMITS에서 모델별 설정 조회"""
+    raw = os.environ.get('VALUEUP_LLM_LIMITS', '')
+    if not raw:
+        return {}
+    try:
+        return json.loads(raw).get(model_name, {})
+    except (json.JSONDecodeError, AttributeError):
+        log(f"[WARN] VALUEUP_LLM_LIMITS 파싱 실패, 기본값 사용")
+        return {}
+
+
+def get_rate_limiter(model_name: str) -> RateLimiter:
+    """
+    모델별 공유 Rate Limiter 조회 (없으면 생성)
+
+    같은 모델을 쓰는 분석기 인스턴스는 같은 한도를 공유함.
+
+    Args:
+        model_name: 모델명
+
+    Returns:
+        RateLimiter 인스턴스
+    """
+    if model_name not in _limiters:
+        config = _model_config(model_name)
+        _limiters[model_name] = RateLimiter(
+            model_name,
+            requests_per_minute=float(config.get('rpm', os.environ.get('VALUEUP_LLM_RPM', DEFAULT_RPM))),
+            tokens_per_minute=float(config.get('tpm', os.environ.get('VALUEUP_LLM_TPM', DEFAULT_TPM))),
+            max_concurrency=int(config.get('concurrency', os.environ.get('VALUEUP_LLM_CONCURRENCY', DEFAULT_CONCURRENCY)))
+        )
+    return _limiters[model_name]
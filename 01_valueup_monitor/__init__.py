@@ -4,14 +4,16 @@ KRX Value-Up Monitor Package
 """
 
 from .krx_valueup_crawler import KRXValueUpCrawler, DisclosureItem
-from .gdrive_uploader import GDriveUploader
-from .gsheet_manager import GSheetManager
+from .gdrive_uploader import GDriveUploader, PDFUpload
+from .gsheet_manager import GSheetManager, SheetWritePlan
 
 __all__ = [
     'KRXValueUpCrawler',
     'DisclosureItem',
     'GDriveUploader',
-    'GSheetManager'
+    'PDFUpload',
+    'GSheetManager',
+    'SheetWritePlan'
 ]
 
 __version__ = '1.0.0'
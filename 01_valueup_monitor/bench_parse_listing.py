@@ -0,0 +1,155 @@
+"""
+목록 파싱 마이크로 벤치마크
+_save_debug_html로 저장된 목록 HTML을 이용해 기존/신규 파싱 방식 비교
+
+비교 항목:
+1. legacy  : 행/셀 단위 locator 호출 (행당 inner_html + 셀별 text_content) + 매 행 정규식 컴파일 검색
+2. evaluate: page.evaluate 1회로 테이블 직렬화 + 모듈 레벨 컴파일 패턴
+3. http    : 브라우저 없이 HTML 문자열 직접 파싱 (HTTP 목록 조회 경로)
+
+사용법:
+    # VALUEUP_DEBUG=true 로 크롤러 실행 후 저장된 HTML 사용
+    python bench_parse_listing.py --debug-dir /tmp/krx_debug --repeat 5
+"""
+
+import argparse
+import asyncio
+import contextlib
+import glob
+import io
+import os
+import re
+import time
+from typing import List
+
+from krx_valueup_crawler import KRXValueUpCrawler, parse_listing_rows, log
+
+
+# 기존 parse_current_page의 접수번호 패턴 (행마다 re.search로 재검색)
+LEGACY_PATTERNS = [
+    r"openDisclsViewer\s*\(\s*['\"]?(\d+)['\"]?",
+    r"openPop\s*\(\s*['\"]?(\d+)['\"]?",
+    r'acpt[Nn]o[=\'"\s:]+(\d{14,})',
+    r'href="[^"]*?(\d{14,})[^"]*"',
+    r'onclick="[^"]*?(\d{14,})[^"]*"',
+    r'[\'"](\d{14,})[\'"]',
+]
+
+
+async def legacy_parse(page) -> tuple:
+    """기존 방식: 행/셀 단위 locator 호출 (IPC 횟수 함께 집계)"""
+    calls = 0
+    rows = []
+    for selector in ['table.list tbody tr', 'table tbody tr', '.board-list tbody tr', '#grid tbody tr']:
+        rows = await page.locator(selector).all()
+        calls += 1
+        if rows:
+            break
+
+    found = 0
+    for row in rows:
+        row_html = await row.inner_html()
+        cells = await row.locator('td').all()
+        calls += 2
+        if len(cells) < 3:
+            continue
+
+        acptno = ""
+        for pattern in LEGACY_PATTERNS:
+            match = re.search(pattern, row_html)
+            if match:
+                acptno = match.group(1)
+                break
+        if not acptno:
+            continue
+
+        await cells[0].text_content()
+        await cells[1].text_content()
+        # 기존 코드는 cells[2]를 두 번 조회
+        await cells[2].text_content()
+        await cells[2].text_content()
+        calls += 4
+        for cell in cells[3:5]:
+            await cell.text_content()
+            calls += 1
+        found += 1
+
+    return found, calls
+
+
+def list_html_files(debug_dir: str) -> List[str]:
+    """디버그 디렉토리에서 목록 HTML 파일 찾기"""
+    files = sorted(glob.glob(os.path.join(debug_dir, '*_list_*.html')))
+    return files
+
+
+async def run_benchmark(files: List[str], repeat: int, with_browser: bool):
+    """벤치마크 실행"""
+    # 디버그 로그/파일 저장 비활성화 (빈 문자열)
+    crawler = KRXValueUpCrawler(headless=True, debug_dir="")
+
+    page = None
+    if with_browser:
+        await crawler._ensure_browser()
+        page = crawler.page
+
+    try:
+        for path in files:
+            with open(path, encoding='utf-8') as f:
+                html = f.read()
+
+            log(f"=== {os.path.basename(path)} ({len(html):,} bytes) ===")
+
+            # 3. HTTP 경로 (순수 파이썬)
+            started = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                for _ in range(repeat):
+                    items, _ = crawler._parse_rows(parse_listing_rows(html))
+            elapsed = (time.perf_counter() - started) / repeat
+            log(f"  http     : {elapsed * 1000:8.2f} ms  ({len(items)}건)")
+
+            if page is None:
+                continue
+
+            await page.set_content(html)
+
+            # 1. 기존 방식
+            started = time.perf_counter()
+            for _ in range(repeat):
+                found, calls = await legacy_parse(page)
+            elapsed = (time.perf_counter() - started) / repeat
+            log(f"  legacy   : {elapsed * 1000:8.2f} ms  ({found}건, IPC {calls}회)")
+
+            # 2. evaluate 1회 방식
+            started = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                for _ in range(repeat):
+                    items = await crawler.parse_current_page()
+            elapsed = (time.perf_counter() - started) / repeat
+            log(f"  evaluate : {elapsed * 1000:8.2f} ms  ({len(items)}건, IPC 1회)")
+    finally:
+        await crawler.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='목록 파싱 마이크로 벤치마크')
+    parser.add_argument(
+        '--debug-dir',
+        default=os.environ.get('VALUEUP_DEBUG_DIR', '/tmp/krx_debug'),
+        help='_save_debug_html 저장 디렉토리 (기본: /tmp/krx_debug)'
+    )
+    parser.add_argument('--repeat', type=int, default=5, help='파일당 반복 횟수, 기본값: 5')
+    parser.add_argument('--no-browser', action='store_true', help='HTTP 경로만 측정 (브라우저 미사용)')
+    args = parser.parse_args()
+
+    files = list_html_files(args.debug_dir)
+    if not files:
+        log(f"목록 HTML 파일이 없습니다: {args.debug_dir}/*_list_*.html")
+        log("  → VALUEUP_DEBUG=true 로 크롤러를 실행하면 저장됩니다.")
+        return
+
+    asyncio.run(run_benchmark(files, max(1, args.repeat), not args.no_browser))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""
+실행 체크포인트 (중단된 백필 이어받기, JSON 파일)
+'전체'/'1년' 같은 긴 조회가 브라우저 오류나 Actions 시간 초과로 중간에 끊겨도
+다음 실행에서 --resume으로 끝난 목록 페이지와 처리 완료한 PDF를 건너뛰고 이어서 진행
+
+- 목록 페이지를 하나 처리할 때마다: 마지막 페이지 번호, 페이지 크기, 수집한 공시 항목 기록
+- PDF를 하나 처리할 때마다: 접수번호별 시트 링크 값(구글드라이브링크/아티팩트링크) 기록
+- 시트 기록은 실행 마지막에 한 번이므로, 이어받을 때 수집한 항목과 링크를 다시 예약함 (이미 기록된 행은 제외됨)
+- 목록을 끝까지 조회하고 시트 기록까지 성공하면 삭제
+
+저장 방식 (조회 범위별 파일 2개):
+- <범위>.json:  스냅샷. 시작 시와 실행 종료 시(close)에만 전체를 다시 씀 (임시 파일 → 교체)
+- <범위>.jsonl: 진행 기록. 페이지/PDF 처리마다 변경분 1줄만 덧붙이므로 기록 비용이 진행량에 비례하지 않음
+- 읽을 때는 스냅샷에 진행 기록을 순서대로 적용 (중단으로 잘린 마지막 줄은 무시)
+
+스냅샷 형식 (JSON):
+    {
+      "scope": "period:전체",
+      "watermark": null,                   # 처음 실행 시 사용한 워터마크
+      "page": 12,                          # 마지막으로 처리한 목록 페이지
+      "page_size": 100,                    # 그때 적용된 목록 페이지 크기
+      "listing_done": false,               # 목록을 끝까지 조회했는지
+      "items": [{"접수번호": ..., ...}],   # 수집한 공시 항목 (목록 순서)
+      "processed": {"20251226000082": {"구글드라이브링크": ..., "아티팩트링크": ...}},
+      "started_at": "2025-12-26 09:00:00",
+      "updated_at": "2025-12-26 10:12:34"
+    }
+
+진행 기록 형식 (JSON lines):
+    {"type": "page", "page": 13, "page_size": 100, "items": [...], "at": "..."}
+    {"type": "pdf", "acptno": "20251226000082", "links": {...}, "at": "..."}
+    {"type": "listing_done", "at": "..."}
+
+환경변수:
+- VALUEUP_CHECKPOINT_DIR: 체크포인트 디렉토리 (기본: .valueup_state/checkpoints)
+"""
+
+import json
+import os
+import re
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from state_store import STATE_DIR
+
+
+def log(message: str):
+    """타임스탬프와 함께 로그 출력"""
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    print(f"[{timestamp}] {message}", flush=True)
+
+
+class RunCheckpoint:
+    """조회 범위별 실행 진행 상황 파일"""
+
+    def __init__(self, scope: str, directory: Optional[str] = None):
+        """
+        초기화
+
+        Args:
+            scope: 조회 범위 (워터마크와 같은 키, 예: "period:전체", "days:7")
+            directory: 체크포인트 디렉토리 (기본: VALUEUP_CHECKPOINT_DIR 또는 .valueup_state/checkpoints)
+        """
+        self.scope = scope
+        directory = directory or os.environ.get('VALUEUP_CHECKPOINT_DIR') or os.path.join(STATE_DIR, 'checkpoints')
+        safe_scope = re.sub(r'[^\w가-힣]+', '_', scope).strip('_') or 'default'
+        self.path = os.path.join(directory, f"{safe_scope}.json")
+        self.journal_path = os.path.join(directory, f"{safe_scope}.jsonl")
+        self.data: Dict = {}
+        self._journal = None       # 진행 기록 파일 (덧붙이기 모드, 첫 기록 시 열림)
+        self._known: set = set()   # 수집한 접수번호 (페이지 중복 제거용)
+
+    @property
+    def page(self) -> int:
+        """마지막으로 처리한 목록 페이지 (없으면 0)"""
+        return int(self.data.get('page', 0))
+
+    @property
+    def page_size(self) -> Optional[int]:
+        """마지막 페이지를 조회할 때 적용된 페이지 크기"""
+        return self.data.get('page_size')
+
+    @property
+    def watermark(self) -> Optional[str]:
+        """처음 실행 시 사용한 워터마크"""
+        return self.data.get('watermark')
+
+    @property
+    def listing_done(self) -> bool:
+        """목록을 끝까지 조회했는지"""
+        return bool(self.data.get('listing_done'))
+
+    @property
+    def items(self) -> List[Dict]:
+        """수집한 공시 항목 (목록 순서)"""
+        return self.data.get('items', [])
+
+    @property
+    def processed(self) -> Dict[str, Dict]:
+        """PDF 처리 완료 항목 {접수번호: 시트 링크 값}"""
+        return self.data.get('processed', {})
+
+    def load(self) -> bool:
+        """
+        체크포인트 읽기
+
+        Returns:
+            같은 조회 범위의 체크포인트가 있으면 True
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if not isinstance(data, dict) or data.get('scope') != self.scope:
+            return False
+        self.data = data
+        self._known = {str(item.get('접수번호', '')) for item in self.items}
+
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        event = json.loads(line)
+                    except ValueError:
+                        break  # 기록 도중 중단된 마지막 줄
+                    self._apply(event)
+        except OSError:
+            pass
+        return True
+
+    def start(self, watermark: Optional[str] = None):
+        """
+        새 체크포인트 시작 (기존 파일은 덮어씀)
+
+        Args:
+            watermark: 이번 실행에서 사용하는 워터마크 (이어받을 때 같은 값 사용)
+        """
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.data = {
+            'scope': self.scope,
+            'watermark': watermark,
+            'page': 0,
+            'page_size': None,
+            'listing_done': False,
+            'items': [],
+            'processed': {},
+            'started_at': now,
+            'updated_at': now,
+        }
+        self._known = set()
+        self.save()
+
+    def page_done(self, page_num: int, items: List[Dict], page_size: int):
+        """
+        목록 페이지 처리 완료 기록
+
+        Args:
+            page_num: 페이지 번호
+            items: 이 페이지에서 수집한 공시 항목
+            page_size: 적용된 페이지 크기
+        """
+        self._record({'type': 'page', 'page': page_num, 'page_size': page_size, 'items': items})
+
+    def finish_listing(self):
+        """목록 조회 완료 기록"""
+        self._record({'type': 'listing_done'})
+
+    def pdf_done(self, acptno: str, links: Dict[str, str]):
+        """
+        PDF 처리 완료 기록
+
+        Args:
+            acptno: 접수번호
+            links: 시트에 기록할 링크 값 {'구글드라이브링크': ..., '아티팩트링크': ...}
+        """
+        self._record({
+            'type': 'pdf',
+            'acptno': acptno,
+            'links': {key: value for key, value in links.items() if key != '접수번호'},
+        })
+
+    def _record(self, event: Dict):
+        """변경분을 메모리에 반영하고 진행 기록에 1줄 덧붙임"""
+        event['at'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        if event['type'] == 'page':
+            # 이미 수집한 항목은 기록에서도 제외 (페이지 경계가 밀려 다시 나온 항목)
+            event['items'] = [item for item in event['items'] if str(item.get('접수번호', '')) not in self._known]
+        self._apply(event)
+        try:
+            if self._journal is None:
+                os.makedirs(os.path.dirname(os.path.abspath(self.journal_path)), exist_ok=True)
+                self._journal = open(self.journal_path, 'a', encoding='utf-8')
+            self._journal.write(json.dumps(event, ensure_ascii=False, separators=(',', ':')) + '\n')
+            self._journal.flush()
+        except OSError as e:
+            log(f"  [WARN] 체크포인트 기록 실패: {e}")
+
+    def _apply(self, event: Dict):
+        """진행 기록 1건을 체크포인트 데이터에 반영"""
+        kind = event.get('type')
+        if kind == 'page':
+            new_items = [item for item in event.get('items', []) if str(item.get('접수번호', '')) not in self._known]
+            self._known.update(str(item.get('접수번호', '')) for item in new_items)
+            self.data.setdefault('items', []).extend(new_items)
+            self.data['page'] = max(self.page, int(event.get('page', 0)))
+            self.data['page_size'] = event.get('page_size')
+        elif kind == 'listing_done':
+            self.data['listing_done'] = True
+        elif kind == 'pdf':
+            self.data.setdefault('processed', {})[event['acptno']] = event.get('links', {})
+        if event.get('at'):
+            self.data['updated_at'] = event['at']
+
+    def save(self):
+        """스냅샷 저장 (임시 파일 → 교체) 후 진행 기록 비우기"""
+        self.data['updated_at'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(temp_path, self.path)
+            # 스냅샷에 모두 반영되었으므로 진행 기록은 비움 (교체 직후 중단되어도 다시 적용하면 같은 결과)
+            self._close_journal()
+            with open(self.journal_path, 'w', encoding='utf-8'):
+                pass
+        except OSError as e:
+            log(f"  [WARN] 체크포인트 저장 실패: {e}")
+
+    def close(self):
+        """진행 기록을 스냅샷에 합치고 파일 닫기 (실행 종료 시 finally에서 호출)"""
+        if self.data:
+            self.save()
+        self._close_journal()
+
+    def _close_journal(self):
+        if self._journal is not None:
+            try:
+                self._journal.close()
+            except OSError:
+                pass
+            self._journal = None
+
+    def clear(self):
+        """체크포인트 삭제 (실행 완료)"""
+        self._close_journal()
+        self.data = {}
+        self._known = set()
+        for path in (self.path, self.journal_path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def summary(self) -> str:
+        """진행 상황 요약 문자열"""
+        state = '목록 완료' if self.listing_done else f"목록 {self.page}페이지까지"
+        return (f"{state}, 공시 {len(self.items)}건, PDF 처리 {len(self.processed)}건 "
+                f"(시작 {self.data.get('started_at', '-')}, 갱신 {self.data.get('updated_at', '-')})")
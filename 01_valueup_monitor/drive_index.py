@@ -0,0 +1,306 @@
+"""
+Google Drive 경로/내용 인덱스 (SQLite)
+폴더 경로, 기업별 스프레드시트 이름, 업로드한 PDF의 SHA-256을 로컬에 기록하여
+매 실행마다 files().list 검색을 반복하지 않도록 함
+
+동기화 방식:
+- 처음 사용할 때 Changes API의 시작 페이지 토큰만 받아 두고, 조회/생성한 파일을 그때그때 기록
+- 이후 실행 시작 시 저장된 토큰부터 변경분만 받아 반영 (삭제·휴지통·이름 변경·이동)
+- 토큰이 무효화되었거나 주기가 지나면 인덱스를 비우고 다시 시작
+- PDF는 업로드 시 appProperties(sha256, acptno)에 해시를 남기고, 같은 해시가 있으면 재업로드하지 않음
+
+모니터(GDriveUploader)와 분석기(CompanySheetManager)가 같은 파일을 공유하며,
+페이지 토큰은 인증 계정별로 따로 관리함.
+
+사용법:
+    index = DriveIndex()
+    index.refresh(service, account='OAuth2')
+    folder_id = index.find('25_12', parent_id, FOLDER_MIME)
+    if not folder_id:
+        folder_id = create(...)
+        index.record(folder_id, '25_12', parent_id, FOLDER_MIME)
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from functools import wraps
+from typing import Dict, Optional
+
+from state_store import STATE_DIR
+
+FOLDER_MIME = 'application/vnd.google-apps.folder'
+SPREADSHEET_MIME = 'application/vnd.google-apps.spreadsheet'
+PDF_MIME = 'application/pdf'
+
+# Changes API로 받을 파일 필드
+CHANGE_FIELDS = (
+    'nextPageToken, newStartPageToken, '
+    'changes(fileId, removed, file(id, name, parents, mimeType, trashed, webViewLink, appProperties))'
+)
+
+
+def log(message: str):
+    """타임스탬프와 함께 로그 출력"""
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    print(f"[{timestamp}] {message}", flush=True)
+
+
+def _locked(method):
+    """인스턴스 락을 잡고 실행 (업로드 워커 스레드에서 호출되는 경우 대비)"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class DriveIndex:
+    """Drive 파일 경로/해시 로컬 인덱스 (Changes API로 갱신)"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS files (
+            file_id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            parent TEXT DEFAULT '',
+            mime_type TEXT DEFAULT '',
+            sha256 TEXT DEFAULT '',
+            web_link TEXT DEFAULT '',
+            updated REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_files_path ON files (parent, name, mime_type);
+        CREATE INDEX IF NOT EXISTS idx_files_sha256 ON files (sha256);
+        CREATE TABLE IF NOT EXISTS tokens (
+            account TEXT PRIMARY KEY,
+            page_token TEXT NOT NULL,
+            started REAL NOT NULL
+        );
+    """
+
+    def __init__(self, path: Optional[str] = None, max_age_hours: Optional[float] = None):
+        """
+        초기화
+
+        Args:
+            path: SQLite 파일 경로 (기본: VALUEUP_DRIVE_INDEX_DB 또는 .valueup_state/drive_index.sqlite3)
+            max_age_hours: 인덱스를 비우고 다시 시작하는 주기 (기본: VALUEUP_DRIVE_INDEX_MAX_AGE_HOURS 또는 168시간)
+        """
+        self.path = path or os.environ.get('VALUEUP_DRIVE_INDEX_DB') or os.path.join(STATE_DIR, 'drive_index.sqlite3')
+        if max_age_hours is None:
+            max_age_hours = float(os.environ.get('VALUEUP_DRIVE_INDEX_MAX_AGE_HOURS', '168'))
+        self.max_age_seconds = max_age_hours * 3600
+
+        if self.path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.executescript(self.SCHEMA)
+        self.conn.commit()
+
+        # 실행 통계
+        self.hits = 0
+        self.misses = 0
+        self.changes_applied = 0
+
+    def close(self):
+        """연결 종료"""
+        self.conn.close()
+
+    # ------------------------------------------------------------------
+    # 동기화
+    # ------------------------------------------------------------------
+
+    @_locked
+    def refresh(self, service, account: str = 'default') -> int:
+        """
+        저장된 페이지 토큰 이후의 Drive 변경분 반영
+
+        Args:
+            service: Drive API 서비스 객체
+            account: 인증 계정 구분값 (계정마다 변경 스트림이 다름)
+
+        Returns:
+            반영한 변경 수
+        """
+        row = self.conn.execute(
+            "SELECT page_token, started FROM tokens WHERE account = ?", (account,)
+        ).fetchone()
+
+        if row and time.time() - row[1] > self.max_age_seconds:
+            log("  Drive 인덱스 주기 경과, 초기화")
+            self._reset()
+            row = None
+
+        if not row:
+            return self._start(service, account)
+
+        page_token = row[0]
+        applied = 0
+        try:
+            while page_token:
+                response = service.changes().list(
+                    pageToken=page_token,
+                    spaces='drive',
+                    includeRemoved=True,
+                    supportsAllDrives=True,
+                    includeItemsFromAllDrives=True,
+                    pageSize=1000,
+                    fields=CHANGE_FIELDS
+                ).execute()
+
+                with self.conn:
+                    for change in response.get('changes', []):
+                        applied += self._apply_change(change)
+
+                if 'newStartPageToken' in response:
+                    self._save_token(account, response['newStartPageToken'])
+                    break
+                page_token = response.get('nextPageToken')
+                self._save_token(account, page_token)
+        except Exception as e:
+            # 토큰 만료 등 → 인덱스를 믿을 수 없으므로 비우고 새로 시작
+            log(f"  [WARN] Drive 변경분 조회 실패, 인덱스 초기화: {e}")
+            self._reset()
+            return self._start(service, account)
+
+        self.changes_applied += applied
+        return applied
+
+    def _start(self, service, account: str) -> int:
+        """현재 시점의 시작 페이지 토큰 저장"""
+        try:
+            token = service.changes().getStartPageToken(supportsAllDrives=True).execute()['startPageToken']
+        except Exception as e:
+            log(f"  [WARN] Drive 시작 페이지 토큰 조회 실패 (인덱스 갱신 없이 진행): {e}")
+            return 0
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO tokens (account, page_token, started) VALUES (?, ?, ?)",
+                (account, token, time.time())
+            )
+        return 0
+
+    def _save_token(self, account: str, token: str):
+        with self.conn:
+            self.conn.execute("UPDATE tokens SET page_token = ? WHERE account = ?", (token, account))
+
+    def _reset(self):
+        """파일 기록과 모든 계정의 토큰 삭제 (파일 기록은 계정 간 공유)"""
+        with self.conn:
+            self.conn.execute("DELETE FROM files")
+            self.conn.execute("DELETE FROM tokens")
+
+    def _apply_change(self, change: Dict) -> int:
+        """변경 1건 반영 (인덱스에 있는 파일, 또는 인덱스에 있는 폴더 아래 파일만)"""
+        file_id = change.get('fileId')
+        file = change.get('file') or {}
+
+        if change.get('removed') or file.get('trashed'):
+            cursor = self.conn.execute("DELETE FROM files WHERE file_id = ?", (file_id,))
+            return cursor.rowcount
+
+        parent = (file.get('parents') or [''])[0]
+        known = self.conn.execute(
+            "SELECT 1 FROM files WHERE file_id = ? OR file_id = ?", (file_id, parent)
+        ).fetchone()
+        if not known:
+            return 0
+
+        self.conn.execute(
+            "INSERT OR REPLACE INTO files (file_id, name, parent, mime_type, sha256, web_link, updated) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (file_id, file.get('name', ''), parent, file.get('mimeType', ''),
+             (file.get('appProperties') or {}).get('sha256', ''), file.get('webViewLink', ''), time.time())
+        )
+        return 1
+
+    # ------------------------------------------------------------------
+    # 조회 / 기록
+    # ------------------------------------------------------------------
+
+    @_locked
+    def find(self, name: str, parent_id: Optional[str], mime_type: str) -> Optional[str]:
+        """
+        이름 + 부모 폴더 + MIME 타입으로 파일 ID 조회
+
+        Args:
+            name: 파일/폴더명
+            parent_id: 부모 폴더 ID
+            mime_type: MIME 타입
+
+        Returns:
+            파일 ID 또는 None
+        """
+        row = self.conn.execute(
+            "SELECT file_id FROM files WHERE parent = ? AND name = ? AND mime_type = ? ORDER BY updated LIMIT 1",
+            (parent_id or '', name, mime_type)
+        ).fetchone()
+        if row:
+            self.hits += 1
+            return row[0]
+        self.misses += 1
+        return None
+
+    @_locked
+    def find_by_hash(self, sha256: str) -> Optional[Dict[str, str]]:
+        """
+        내용 해시로 업로드된 PDF 조회
+
+        Args:
+            sha256: PDF SHA-256
+
+        Returns:
+            {'id': 파일ID, 'webViewLink': 링크} 또는 None
+        """
+        if not sha256:
+            return None
+        row = self.conn.execute(
+            "SELECT file_id, web_link FROM files WHERE sha256 = ? AND web_link != '' LIMIT 1", (sha256,)
+        ).fetchone()
+        if row:
+            self.hits += 1
+            return {'id': row[0], 'webViewLink': row[1]}
+        return None
+
+    @_locked
+    def record(
+        self,
+        file_id: str,
+        name: str,
+        parent_id: Optional[str],
+        mime_type: str,
+        sha256: str = '',
+        web_link: str = ''
+    ):
+        """
+        조회/생성한 파일 기록
+
+        Args:
+            file_id: 파일 ID
+            name: 파일/폴더명
+            parent_id: 부모 폴더 ID
+            mime_type: MIME 타입
+            sha256: PDF 내용 해시 (PDF만)
+            web_link: webViewLink (PDF만)
+        """
+        if not file_id:
+            return
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO files (file_id, name, parent, mime_type, sha256, web_link, updated) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (file_id, name, parent_id or '', mime_type, sha256 or '', web_link or '', time.time())
+            )
+
+    @_locked
+    def forget(self, file_id: str):
+        """파일 기록 삭제 (조회한 ID가 더 이상 유효하지 않을 때)"""
+        with self.conn:
+            self.conn.execute("DELETE FROM files WHERE file_id = ?", (file_id,))
+
+    def summary(self) -> str:
+        """실행 통계 요약 문자열"""
+        count = self.conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+        return f"항목 {count}개, 적중 {self.hits}건, 미스 {self.misses}건, 변경 반영 {self.changes_applied}건"
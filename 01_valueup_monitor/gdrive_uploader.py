@@ -20,14 +20,32 @@ Google Drive 업로더 (OAuth2 지원)
   
 - 서비스 계정 방식 (fallback):
   - GOOGLE_SERVICE: 서비스 계정 JSON
+
+- 경로/내용 인덱스 (drive_index.py):
+  - VALUEUP_DRIVE_INDEX: 로컬 인덱스 사용 여부 (기본: true)
+
+- 일괄 업로드 (upload_pdfs):
+  - VALUEUP_UPLOAD_WORKERS: 동시 업로드 수 (기본: 4)
+  - VALUEUP_UPLOAD_MULTIPART_MAX_MB: 이 크기 이하는 resumable 대신 multipart 단일 요청 (기본: 5)
 """
 
 import os
 import io
 import sys
-from typing import Optional
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Dict, List, Optional
 from datetime import datetime
 
+try:
+    from drive_index import DriveIndex, FOLDER_MIME, PDF_MIME
+except ImportError:
+    DriveIndex = None
+    FOLDER_MIME = 'application/vnd.google-apps.folder'
+    PDF_MIME = 'application/pdf'
+
 # stdout 버퍼링 해제
 sys.stdout.reconfigure(line_buffering=True)
 
@@ -38,6 +56,36 @@ def log(message: str):
     print(f"[{timestamp}] {message}", flush=True)
 
 
+# 배치 요청 1회에 담을 수 있는 최대 하위 요청 수 (Drive API 제한)
+BATCH_LIMIT = 100
+
+# 링크가 있는 모든 사용자 읽기 권한
+PUBLIC_READER = {'type': 'anyone', 'role': 'reader'}
+
+# Drive 해시 조회 1회에 묶는 SHA-256 수 (쿼리 문자열 길이 제한 대비)
+HASH_QUERY_CHUNK = 20
+
+
+def _file_sha256(path: str) -> str:
+    """파일 SHA-256 (청크 단위)"""
+    hasher = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while chunk := f.read(64 * 1024):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+@dataclass
+class PDFUpload:
+    """일괄 업로드 대상 PDF"""
+    acptno: str
+    filename: str
+    file_path: str
+    date: Optional[datetime] = None  # 월별 폴더 결정용
+    sha256: str = ''                 # 내용 해시 (같은 내용이 이미 업로드되어 있으면 건너뜀)
+    source: str = ''                 # PDF 출처 ('attachment': 기업 제출 원본, 'body': KIND 본문)
+
+
 class GDriveUploader:
     """Google Drive 업로더 (OAuth2 + 서비스 계정 지원)"""
     
@@ -54,7 +102,9 @@ class GDriveUploader:
         client_id: Optional[str] = None,
         client_secret: Optional[str] = None,
         # 서비스 계정 인증 정보 (fallback)
-        credentials_json: Optional[str] = None
+        credentials_json: Optional[str] = None,
+        # 경로/내용 인덱스
+        index: Optional['DriveIndex'] = None
     ):
         """
         초기화
@@ -65,11 +115,17 @@ class GDriveUploader:
             client_id: OAuth2 클라이언트 ID
             client_secret: OAuth2 클라이언트 시크릿
             credentials_json: 서비스 계정 JSON (fallback)
+            index: Drive 경로/내용 인덱스 (기본: VALUEUP_DRIVE_INDEX=false가 아니면 자동 생성)
         """
         self.folder_id = folder_id or os.environ.get('VALUEUP_ARCHIVE_ID')
         self.service = None
         self.auth_method = None
         self._folder_cache = {}  # 폴더 ID 캐시: {(parent_id, folder_name): folder_id}
+        self._credentials = None
+        self._local = threading.local()  # 스레드별 서비스 객체 (httplib2는 스레드 안전하지 않음)
+        
+        self.upload_workers = int(os.environ.get('VALUEUP_UPLOAD_WORKERS', '4'))
+        self.multipart_max_bytes = int(float(os.environ.get('VALUEUP_UPLOAD_MULTIPART_MAX_MB', '5')) * 1024 * 1024)
         
         # 환경변수에서 OAuth2 인증 정보 로드
         refresh_token = refresh_token or os.environ.get('GDRIVE_REFRESH_TOKEN')
@@ -95,6 +151,19 @@ class GDriveUploader:
                     log("Google Drive 인증: 서비스 계정 (공유 드라이브만 가능)")
                 except Exception as e:
                     log(f"서비스 계정 인증 실패: {e}")
+        
+        # 3. 로컬 인덱스 갱신 (지난 실행 이후 Drive 변경분만 반영)
+        self.index = index
+        if (self.index is None and DriveIndex is not None
+                and os.environ.get('VALUEUP_DRIVE_INDEX', 'true').lower() != 'false'):
+            try:
+                self.index = DriveIndex()
+            except Exception as e:
+                log(f"Drive 인덱스 초기화 실패 (원격 검색만 사용): {e}")
+        if self.index and self.service:
+            applied = self.index.refresh(self.service, account=self.auth_method)
+            if applied:
+                log(f"Drive 인덱스: 변경분 {applied}건 반영")
     
     def _init_oauth2(self, refresh_token: str, client_id: str, client_secret: str):
         """OAuth2 인증 초기화"""
@@ -113,6 +182,7 @@ class GDriveUploader:
         # 액세스 토큰 갱신
         creds.refresh(Request())
         
+        self._credentials = creds
         self.service = build('drive', 'v3', credentials=creds)
     
     def _init_service_account(self, credentials_json: str):
@@ -127,6 +197,7 @@ class GDriveUploader:
             info = json.loads(credentials_json)
             creds = Credentials.from_service_account_info(info, scopes=self.SCOPES)
         
+        self._credentials = creds
         self.service = build('drive', 'v3', credentials=creds)
     
     def find_folder(self, folder_name: str, parent_id: Optional[str] = None) -> Optional[str]:
@@ -143,12 +214,19 @@ class GDriveUploader:
         if not self.service:
             return None
         
-        # 캐시 확인
+        # 캐시 확인 (실행 내 캐시 → 로컬 인덱스)
         cache_key = (parent_id, folder_name)
         if cache_key in self._folder_cache:
             log(f"  [캐시] 폴더 발견: {folder_name}")
             return self._folder_cache[cache_key]
         
+        if self.index:
+            folder_id = self.index.find(folder_name, parent_id, FOLDER_MIME)
+            if folder_id:
+                self._folder_cache[cache_key] = folder_id
+                log(f"  [인덱스] 폴더 발견: {folder_name}")
+                return folder_id
+        
         try:
             # 방법 1: 부모 폴더가 있으면 부모 폴더의 하위 항목 중에서 검색
             if parent_id:
@@ -169,6 +247,8 @@ class GDriveUploader:
             if files:
                 folder_id = files[0]['id']
                 self._folder_cache[cache_key] = folder_id
+                if self.index:
+                    self.index.record(folder_id, folder_name, parent_id, FOLDER_MIME)
                 
                 if len(files) > 1:
                     log(f"  [주의] 동일 이름 폴더 {len(files)}개 발견: {folder_name}, 첫 번째 사용")
@@ -219,6 +299,8 @@ class GDriveUploader:
             # 캐시에 저장
             cache_key = (parent_id, folder_name)
             self._folder_cache[cache_key] = folder_id
+            if self.index:
+                self.index.record(folder_id, folder_name, parent_id, FOLDER_MIME)
             
             return folder_id
             
@@ -286,31 +368,44 @@ class GDriveUploader:
     
     def upload_pdf(
         self, 
-        pdf_data: bytes, 
+        pdf_data: Optional[bytes], 
         filename: str, 
         folder_id: Optional[str] = None,
         use_monthly_folder: bool = True,
-        date: Optional[datetime] = None
+        date: Optional[datetime] = None,
+        file_path: Optional[str] = None,
+        sha256: str = '',
+        acptno: str = ''
     ) -> Optional[str]:
         """
-        PDF 파일 업로드
+        PDF 파일 업로드 (같은 내용이 이미 업로드되어 있으면 기존 링크 반환)
         
         Args:
-            pdf_data: PDF 바이너리 데이터
+            pdf_data: PDF 바이너리 데이터 (file_path를 주면 None 가능)
             filename: 저장할 파일명
             folder_id: 업로드할 폴더 ID (없으면 월별 폴더 사용)
             use_monthly_folder: 월별 폴더 사용 여부 (기본: True)
             date: 파일 날짜 (월별 폴더 결정용)
+            file_path: 로컬 PDF 경로 (지정 시 메모리에 올리지 않고 파일에서 바로 업로드)
+            sha256: 내용 해시 (없으면 계산)
+            acptno: 접수번호 (파일 속성에 기록)
             
         Returns:
             업로드된 파일의 웹 링크 또는 None
         """
-        from googleapiclient.http import MediaIoBaseUpload
+        from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload
         
         if not self.service:
             log("Google Drive 서비스가 초기화되지 않았습니다.")
             return None
         
+        if not sha256:
+            sha256 = _file_sha256(file_path) if file_path else hashlib.sha256(pdf_data or b'').hexdigest()
+        existing = self.find_existing_pdfs([sha256]).get(sha256)
+        if existing:
+            log(f"  Drive 업로드 생략 (동일 내용 존재): {filename}")
+            return existing['webViewLink']
+        
         # 대상 폴더 결정
         if folder_id:
             target_folder = folder_id
@@ -324,17 +419,26 @@ class GDriveUploader:
         
         file_metadata = {
             'name': filename,
-            'mimeType': 'application/pdf'
+            'mimeType': 'application/pdf',
+            # 다른 실행/인덱스 재구성 후에도 내용으로 찾을 수 있도록 해시를 파일 속성에 기록
+            'appProperties': {'sha256': sha256, 'acptno': acptno}
         }
         
         if target_folder:
             file_metadata['parents'] = [target_folder]
         
-        media = MediaIoBaseUpload(
-            io.BytesIO(pdf_data),
-            mimetype='application/pdf',
-            resumable=True
-        )
+        if file_path:
+            media = MediaFileUpload(
+                file_path,
+                mimetype='application/pdf',
+                resumable=True
+            )
+        else:
+            media = MediaIoBaseUpload(
+                io.BytesIO(pdf_data),
+                mimetype='application/pdf',
+                resumable=True
+            )
         
         try:
             file = self.service.files().create(
@@ -346,15 +450,14 @@ class GDriveUploader:
             
             file_id = file.get('id')
             web_link = file.get('webViewLink')
+            if self.index:
+                self.index.record(file_id, filename, target_folder, PDF_MIME, sha256=sha256, web_link=web_link)
             
             # 파일 공유 설정 (링크가 있는 모든 사용자가 볼 수 있도록)
             try:
                 self.service.permissions().create(
                     fileId=file_id,
-                    body={
-                        'type': 'anyone',
-                        'role': 'reader'
-                    },
+                    body=PUBLIC_READER,
                     supportsAllDrives=True
                 ).execute()
             except Exception as perm_error:
@@ -374,6 +477,228 @@ class GDriveUploader:
             
             return None
     
+    def _thread_service(self):
+        """현재 스레드 전용 Drive 서비스 (업로드 워커용)"""
+        from googleapiclient.discovery import build
+        
+        service = getattr(self._local, 'service', None)
+        if service is None:
+            service = build('drive', 'v3', credentials=self._credentials, cache_discovery=False)
+            self._local.service = service
+        return service
+    
+    def _upload_file(self, upload: PDFUpload, folder_id: Optional[str]) -> Optional[dict]:
+        """
+        파일 1건 업로드 (작은 파일은 multipart 단일 요청, 큰 파일은 resumable)
+        
+        Args:
+            upload: 업로드 대상
+            folder_id: 대상 폴더 ID
+            
+        Returns:
+            {'id': ..., 'webViewLink': ...} 또는 None
+        """
+        from googleapiclient.http import MediaFileUpload
+        
+        file_metadata = {
+            'name': upload.filename,
+            'mimeType': 'application/pdf'
+        }
+        if folder_id:
+            file_metadata['parents'] = [folder_id]
+        if upload.sha256:
+            # 다른 실행/인덱스 재구성 후에도 내용으로 찾을 수 있도록 해시를 파일 속성에 기록
+            file_metadata['appProperties'] = {'sha256': upload.sha256, 'acptno': upload.acptno}
+            if upload.source:
+                file_metadata['appProperties']['source'] = upload.source
+        
+        resumable = os.path.getsize(upload.file_path) > self.multipart_max_bytes
+        media = MediaFileUpload(upload.file_path, mimetype='application/pdf', resumable=resumable)
+        
+        try:
+            return self._thread_service().files().create(
+                body=file_metadata,
+                media_body=media,
+                fields='id, webViewLink',
+                supportsAllDrives=True
+            ).execute(num_retries=2)
+        except Exception as e:
+            log(f"  업로드 오류 ({upload.acptno}): {e}")
+            return None
+    
+    def _grant_public_batch(self, file_ids: List[str]) -> int:
+        """
+        링크 공유 권한을 배치 요청으로 일괄 설정 (요청 1회당 최대 100건)
+        
+        Args:
+            file_ids: 파일 ID 리스트
+            
+        Returns:
+            실패 건수
+        """
+        failures = []
+        
+        def callback(request_id, response, exception):
+            if exception is not None:
+                failures.append((request_id, exception))
+        
+        for start in range(0, len(file_ids), BATCH_LIMIT):
+            batch = self.service.new_batch_http_request(callback=callback)
+            for file_id in file_ids[start:start + BATCH_LIMIT]:
+                batch.add(
+                    self.service.permissions().create(
+                        fileId=file_id,
+                        body=PUBLIC_READER,
+                        supportsAllDrives=True
+                    ),
+                    request_id=file_id
+                )
+            try:
+                batch.execute()
+            except Exception as e:
+                failures.extend((file_id, e) for file_id in file_ids[start:start + BATCH_LIMIT])
+        
+        for file_id, error in failures[:3]:
+            # 권한 설정 실패해도 업로드는 성공한 것으로 처리
+            log(f"  권한 설정 경고 (무시 가능): {file_id} {error}")
+        return len(failures)
+    
+    def upload_pdfs(self, uploads: List[PDFUpload], max_workers: Optional[int] = None) -> Dict[str, str]:
+        """
+        PDF 여러 건을 동시에 업로드하고 공유 권한을 배치로 설정
+        
+        월별 폴더는 업로드 전에 한 번씩만 확인/생성하고 (동시 생성으로 폴더가 중복되지 않도록),
+        업로드는 스레드 풀에서 병렬로, 권한 설정은 배치 요청으로 묶어서 처리함.
+        
+        Args:
+            uploads: 업로드 대상 리스트
+            max_workers: 동시 업로드 수 (기본: VALUEUP_UPLOAD_WORKERS)
+            
+        Returns:
+            {접수번호: webViewLink} (실패한 건은 제외)
+        """
+        if not self.service:
+            log("Google Drive 서비스가 초기화되지 않았습니다.")
+            return {}
+        if not uploads:
+            return {}
+        
+        # 0. 같은 내용이 이미 업로드된 PDF는 기존 링크 재사용 (로컬 인덱스 → Drive 파일 속성 순)
+        links = {}
+        existing = self.find_existing_pdfs([upload.sha256 for upload in uploads])
+        if existing:
+            remaining = []
+            for upload in uploads:
+                if upload.sha256 in existing:
+                    links[upload.acptno] = existing[upload.sha256]['webViewLink']
+                else:
+                    remaining.append(upload)
+            log(f"  Drive 업로드 생략 (동일 내용 존재): {len(links)}건")
+            uploads = remaining
+            if not uploads:
+                return links
+        
+        # 1. 대상 월별 폴더 미리 확인/생성
+        folders = {}
+        for upload in uploads:
+            month = (upload.date or datetime.now()).strftime("%y_%m")
+            if month not in folders:
+                folder_id = self.get_monthly_folder_id(upload.date)
+                if not folder_id:
+                    log("  월별 폴더 생성 실패, 기본 폴더에 업로드")
+                    folder_id = self.folder_id
+                folders[month] = folder_id
+        
+        # 2. 병렬 업로드
+        workers = max(1, min(max_workers or self.upload_workers, len(uploads)))
+        uploaded = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    self._upload_file,
+                    upload,
+                    folders[(upload.date or datetime.now()).strftime("%y_%m")]
+                ): upload
+                for upload in uploads
+            }
+            for future in as_completed(futures):
+                file = future.result()
+                if file:
+                    upload = futures[future]
+                    uploaded[upload.acptno] = file
+                    if self.index:
+                        self.index.record(
+                            file['id'], upload.filename,
+                            folders[(upload.date or datetime.now()).strftime("%y_%m")],
+                            PDF_MIME, sha256=upload.sha256, web_link=file.get('webViewLink', '')
+                        )
+        
+        # 3. 공유 권한 일괄 설정
+        perm_failures = self._grant_public_batch([file['id'] for file in uploaded.values()])
+        
+        log(f"  Drive 일괄 업로드: {len(uploaded)}/{len(uploads)}건 (동시 {workers}개"
+            + (f", 권한 설정 실패 {perm_failures}건" if perm_failures else "") + ")")
+        
+        links.update({acptno: file.get('webViewLink') for acptno, file in uploaded.items()})
+        return links
+    
+    def find_existing_pdfs(self, hashes: List[str]) -> Dict[str, Dict[str, str]]:
+        """
+        내용 해시로 이미 업로드된 PDF 조회
+        
+        로컬 인덱스에 없으면 Drive에서 appProperties(sha256)로 다시 찾으므로,
+        인덱스가 초기화되었거나 Actions 캐시가 사라져도 같은 내용을 다시 올리지 않음.
+        Drive에서 찾은 파일은 인덱스에 기록.
+        
+        Args:
+            hashes: SHA-256 리스트
+            
+        Returns:
+            {sha256: {'id': 파일ID, 'webViewLink': 링크}}
+        """
+        found = {}
+        missing = []
+        for sha256 in dict.fromkeys(h for h in hashes if h):
+            existing = self.index.find_by_hash(sha256) if self.index else None
+            if existing:
+                found[sha256] = existing
+            else:
+                missing.append(sha256)
+        
+        if not missing or not self.service:
+            return found
+        
+        # 쿼리 길이 제한을 넘지 않도록 묶어서 OR 조건으로 조회
+        for start in range(0, len(missing), HASH_QUERY_CHUNK):
+            chunk = missing[start:start + HASH_QUERY_CHUNK]
+            conditions = ' or '.join(
+                f"appProperties has {{ key='sha256' and value='{sha256}' }}" for sha256 in chunk
+            )
+            try:
+                response = self.service.files().list(
+                    q=f"({conditions}) and trashed = false",
+                    spaces='drive',
+                    fields='files(id, name, parents, webViewLink, appProperties)',
+                    supportsAllDrives=True,
+                    includeItemsFromAllDrives=True,
+                    pageSize=1000
+                ).execute()
+            except Exception as e:
+                log(f"  [WARN] Drive 해시 조회 실패 (업로드 진행): {e}")
+                continue
+            
+            for file in response.get('files', []):
+                sha256 = (file.get('appProperties') or {}).get('sha256', '')
+                if sha256 not in chunk or sha256 in found or not file.get('webViewLink'):
+                    continue
+                found[sha256] = {'id': file['id'], 'webViewLink': file['webViewLink']}
+                if self.index:
+                    self.index.record(
+                        file['id'], file.get('name', ''), (file.get('parents') or [''])[0],
+                        PDF_MIME, sha256=sha256, web_link=file['webViewLink']
+                    )
+        return found
+    
     def check_file_exists(self, filename: str, folder_id: Optional[str] = None) -> bool:
         """
         파일 존재 여부 확인
@@ -6,15 +6,22 @@ Quota 고려사항:
 - 읽기: 분당 300회
 - 쓰기: 분당 60회
 - 배치 업데이트로 API 호출 최소화
+- 접수번호/행번호 조회는 로컬 상태 저장소(state_store.py)로 증분 동기화
+- 모니터 실행 1회의 쓰기는 SheetWritePlan으로 모아 spreadsheets.batchUpdate 1회로 기록
+- 시트 직접 조회 시 필요한 열만 values.batchGet 1회로 읽음 (read_columns)
 """
 
 import os
+import re
 import sys
-from typing import List, Optional, Dict
+from typing import Any, List, Optional, Dict
 from datetime import datetime
 import gspread
+from gspread.utils import absolute_range_name, rowcol_to_a1
 from google.oauth2.service_account import Credentials
 
+from state_store import DisclosureStateStore, normalize_acptno
+
 # stdout 버퍼링 해제
 sys.stdout.reconfigure(line_buffering=True)
 
@@ -25,6 +32,60 @@ def log(message: str):
     print(f"[{timestamp}] {message}", flush=True)
 
 
+class SheetColumns:
+    """
+    열 단위 시트 조회 결과 (요청한 열만, 2행부터)
+    
+    사용법:
+        cols = manager.read_columns(worksheet, ['접수번호', '구글드라이브링크'])
+        for i, acptno in enumerate(cols['접수번호']):
+            row_num = cols.row_number(i)
+    """
+    
+    def __init__(self, headers: List[str], columns: Dict[str, List[Any]]):
+        """
+        초기화
+        
+        Args:
+            headers: 시트 헤더 행 전체
+            columns: {헤더: 2행부터의 값 리스트} (길이가 다르면 빈 문자열로 채움)
+        """
+        self.headers = headers
+        self.length = max((len(values) for values in columns.values()), default=0)
+        self.columns = {
+            name: values + [''] * (self.length - len(values))
+            for name, values in columns.items()
+        }
+    
+    def __len__(self) -> int:
+        return self.length
+    
+    def __getitem__(self, name: str) -> List[Any]:
+        return self.columns.get(name) or [''] * self.length
+    
+    def row_number(self, index: int) -> int:
+        """값 인덱스 → 시트 행 번호 (헤더가 1행)"""
+        return index + 2
+    
+    def records(self, key: str = '접수번호') -> List[Dict[str, Any]]:
+        """
+        key 열이 비어 있지 않은 행을 딕셔너리로 변환 (요청한 열만 포함)
+        
+        Args:
+            key: 빈 행 판정 기준 열
+            
+        Returns:
+            [{헤더: 값}, ...]
+        """
+        names = list(self.columns)
+        keys = self[key]
+        return [
+            {name: self.columns[name][i] for name in names}
+            for i in range(self.length)
+            if str(keys[i]).strip()
+        ]
+
+
 class GSheetManager:
     """Google Sheets 관리자"""
     
@@ -52,19 +113,38 @@ class GSheetManager:
     COL_GDRIVE_LINK = 8     # H열: 구글드라이브링크
     COL_ARTIFACT_LINK = 10  # J열: 아티팩트링크
     
-    def __init__(self, credentials_json: Optional[str] = None, spreadsheet_id: Optional[str] = None):
+    # 미처리 항목 조회에 필요한 열 (시트 직접 조회 시 이 열만 읽음, 공시제목은 PDF 확보 방식 선택용)
+    PENDING_COLUMNS = ['접수번호', '회사명', '공시일자', '공시제목', '구글드라이브링크', '아티팩트링크']
+    
+    def __init__(
+        self,
+        credentials_json: Optional[str] = None,
+        spreadsheet_id: Optional[str] = None,
+        state_store: Optional[DisclosureStateStore] = None
+    ):
         """
         초기화
         
         Args:
             credentials_json: 서비스 계정 JSON 파일 경로 또는 JSON 문자열
             spreadsheet_id: 스프레드시트 ID
+            state_store: 로컬 상태 저장소 (기본: VALUEUP_STATE_STORE=false가 아니면 자동 생성)
         """
         self.spreadsheet_id = spreadsheet_id or os.environ.get('VALUEUP_GSPREAD_ID')
         self.client = None
         self.spreadsheet = None
         self._worksheet_cache = {}
         
+        # 로컬 상태 저장소 (실패 시 시트 직접 조회로 동작)
+        self.state_store = state_store
+        if self.state_store is None and os.environ.get('VALUEUP_STATE_STORE', 'true').lower() != 'false':
+            try:
+                self.state_store = DisclosureStateStore()
+            except Exception as e:
+                log(f"상태 저장소 열기 실패 (시트 직접 조회): {e}")
+        self._synced_sheets = set()
+        self.last_append_error: Optional[str] = None  # 마지막 append_disclosures 실패 사유 (성공 시 None)
+        
         # 인증 정보 로드
         creds = None
         if credentials_json:
@@ -95,12 +175,17 @@ class GSheetManager:
                 except Exception as e:
                     log(f"스프레드시트 열기 실패: {type(e).__name__}: {e}")
     
-    def get_or_create_worksheet(self, sheet_name: str = "밸류업공시목록") -> Optional[gspread.Worksheet]:
+    def get_or_create_worksheet(
+        self,
+        sheet_name: str = "밸류업공시목록",
+        ensure_headers: bool = True
+    ) -> Optional[gspread.Worksheet]:
         """
         워크시트 가져오기 또는 생성
         
         Args:
             sheet_name: 시트 이름
+            ensure_headers: 기존 시트의 열/헤더 확장 여부 (쓰기 계획은 commit에서 함께 처리)
             
         Returns:
             워크시트 또는 None
@@ -116,7 +201,8 @@ class GSheetManager:
             worksheet = self.spreadsheet.worksheet(sheet_name)
             
             # 기존 시트 열/헤더 확장
-            self._ensure_columns_and_headers(worksheet)
+            if ensure_headers:
+                self._ensure_columns_and_headers(worksheet)
                     
         except gspread.exceptions.WorksheetNotFound:
             # 새 시트 생성
@@ -160,6 +246,22 @@ class GSheetManager:
         except Exception as e:
             log(f"  시트 열/헤더 확장 중 오류: {e}")
     
+    def _sync_state(self, worksheet: gspread.Worksheet) -> bool:
+        """
+        상태 저장소를 시트와 동기화 (실행당 1회, 행 추가 후 재동기화)
+        
+        Returns:
+            상태 저장소 사용 가능 여부
+        """
+        if not self.state_store:
+            return False
+        if worksheet.title in self._synced_sheets:
+            return True
+        if self.state_store.sync_worksheet(worksheet) < 0:
+            return False
+        self._synced_sheets.add(worksheet.title)
+        return True
+    
     def _ensure_row_capacity(self, worksheet: gspread.Worksheet, needed_rows: int):
         """
         필요한 행 수만큼 시트 용량 확보
@@ -170,9 +272,11 @@ class GSheetManager:
         """
         try:
             current_rows = worksheet.row_count
-            # 현재 데이터 행 수 확인
-            all_values = worksheet.col_values(1)  # A열 기준
-            used_rows = len(all_values)
+            # 현재 데이터 행 수 확인 (상태 저장소 우선, 없으면 A열 기준)
+            if self._sync_state(worksheet):
+                used_rows = self.state_store.last_row(worksheet.title)
+            else:
+                used_rows = len(worksheet.col_values(1))
             
             # 필요한 총 행 수
             required_rows = used_rows + needed_rows + 100  # 여유분 100행
@@ -195,13 +299,16 @@ class GSheetManager:
         Returns:
             접수번호 집합
         """
+        if self._sync_state(worksheet):
+            return self.state_store.acptno_set(worksheet.title)
+        
         try:
             # F열 (접수번호) 전체 가져오기
             acptno_col = worksheet.col_values(self.COL_ACPTNO)
             # 접수번호 정규화 (숫자/텍스트 모두 문자열로)
             result = set()
             for val in acptno_col[1:]:  # 헤더 제외
-                normalized = self._normalize_acptno(val)
+                normalized = normalize_acptno(val)
                 if normalized:
                     result.add(normalized)
             return result
@@ -209,15 +316,57 @@ class GSheetManager:
             log(f"접수번호 조회 중 오류: {e}")
             return set()
     
-    def _normalize_acptno(self, value) -> str:
-        """접수번호 정규화 - 숫자/텍스트 모두 문자열로 변환"""
-        if value is None or value == '':
-            return ''
-        if isinstance(value, (int, float)):
-            # 숫자인 경우 정수로 변환 후 문자열로
-            return str(int(value))
-        # 문자열인 경우 앞뒤 공백 및 ' 제거
-        return str(value).strip().lstrip("'")
+    def read_columns(self, worksheet: gspread.Worksheet, names: List[str]) -> Optional[SheetColumns]:
+        """
+        헤더 이름으로 지정한 열만 조회 (values.batchGet 1회)
+        
+        헤더 행과 기본 배치(HEADERS) 위치의 열 범위를 함께 요청하고,
+        실제 헤더 위치가 다를 때만 한 번 더 조회함
+        
+        Args:
+            worksheet: 워크시트
+            names: 조회할 헤더 이름 리스트
+            
+        Returns:
+            SheetColumns 또는 None (조회 실패)
+        """
+        positions = {name: self.HEADERS.index(name) + 1 for name in names if name in self.HEADERS}
+        try:
+            headers, columns = self._batch_get_columns(worksheet, positions)
+            actual = {name: headers.index(name) + 1 for name in names if name in headers}
+            if actual != positions:
+                headers, columns = self._batch_get_columns(worksheet, actual)
+        except Exception as e:
+            log(f"열 조회 중 오류: {e}")
+            return None
+        return SheetColumns(headers, columns)
+    
+    def _batch_get_columns(self, worksheet: gspread.Worksheet, positions: Dict[str, int]):
+        """
+        헤더 행 + 열 범위를 values.batchGet 1회로 조회
+        
+        Args:
+            worksheet: 워크시트
+            positions: {헤더: 1-based 열 번호}
+            
+        Returns:
+            (헤더 행, {헤더: 2행부터의 값 리스트})
+        """
+        letters = {name: rowcol_to_a1(1, col)[:-1] for name, col in positions.items()}
+        ranges = [absolute_range_name(worksheet.title, '1:1')] + [
+            absolute_range_name(worksheet.title, f'{letter}2:{letter}') for letter in letters.values()
+        ]
+        response = self.spreadsheet.values_batch_get(ranges, params={'majorDimension': 'COLUMNS'})
+        value_ranges = response.get('valueRanges', [])
+        
+        header_values = value_ranges[0].get('values', []) if value_ranges else []
+        headers = [str(col[0]).strip() if col else '' for col in header_values]
+        
+        columns = {}
+        for name, value_range in zip(letters, value_ranges[1:]):
+            values = value_range.get('values', [])
+            columns[name] = list(values[0]) if values else []
+        return headers, columns
     
     def get_all_data_with_row_numbers(self, worksheet: gspread.Worksheet) -> Dict[str, int]:
         """
@@ -229,11 +378,14 @@ class GSheetManager:
         Returns:
             {접수번호: 행번호} 딕셔너리
         """
+        if self._sync_state(worksheet):
+            return self.state_store.row_numbers(worksheet.title)
+        
         try:
             acptno_col = worksheet.col_values(self.COL_ACPTNO)
             result = {}
             for row_idx, acptno in enumerate(acptno_col):
-                normalized = self._normalize_acptno(acptno)
+                normalized = normalize_acptno(acptno)
                 if normalized:
                     result[normalized] = row_idx + 1
             return result
@@ -241,6 +393,86 @@ class GSheetManager:
             log(f"데이터 조회 중 오류: {e}")
             return {}
     
+    def _build_row(self, d: Dict, collected_at: str) -> List[Any]:
+        """
+        공시 정보를 시트 행(A~J열)으로 변환
+        
+        Args:
+            d: 공시 정보 딕셔너리
+            collected_at: 수집일시
+            
+        Returns:
+            행 값 리스트 (USER_ENTERED 기준)
+        """
+        # 종목코드와 접수번호는 텍스트로 저장 (앞에 ' 붙여서 숫자 변환 방지)
+        종목코드 = d.get('종목코드', '')
+        if 종목코드:
+            종목코드 = "'" + str(종목코드).zfill(6)  # 6자리 패딩 + 텍스트 표시
+        
+        접수번호 = d.get('접수번호', '')
+        if 접수번호:
+            접수번호 = "'" + str(접수번호)  # 텍스트로 저장
+        
+        return [
+            d.get('번호', ''),
+            d.get('공시일자', ''),
+            d.get('회사명', ''),
+            종목코드,
+            d.get('공시제목', ''),
+            접수번호,
+            d.get('원시PDF링크', ''),
+            d.get('구글드라이브링크', ''),
+            collected_at,
+            ''  # 아티팩트링크 (나중에 업데이트)
+        ]
+    
+    def begin_plan(self, sheet_name: str = "밸류업공시목록") -> Optional['SheetWritePlan']:
+        """
+        실행 단위 쓰기 계획 시작 (시트 1회 읽기)
+        
+        상태 저장소가 있으면 증분 동기화(batch_get 1회), 없으면 필요한 열만 read_columns 1회로 읽음
+        
+        Args:
+            sheet_name: 시트 이름
+            
+        Returns:
+            SheetWritePlan 또는 None (시트를 열거나 읽지 못한 경우)
+        """
+        worksheet = self.get_or_create_worksheet(sheet_name, ensure_headers=False)
+        if not worksheet:
+            return None
+        
+        if self._sync_state(worksheet):
+            return SheetWritePlan(
+                self,
+                worksheet,
+                headers=self.state_store.headers(worksheet.title),
+                row_numbers=self.state_store.row_numbers(worksheet.title),
+                last_row=self.state_store.last_row(worksheet.title)
+            )
+        
+        columns = self.read_columns(worksheet, self.PENDING_COLUMNS)
+        if columns is None:
+            return None
+        
+        records = []
+        row_numbers = {}
+        for index, value in enumerate(columns['접수번호']):
+            acptno = normalize_acptno(value)
+            if not acptno:
+                continue
+            row_numbers[acptno] = columns.row_number(index)
+            records.append({name: columns[name][index] for name in self.PENDING_COLUMNS})
+        
+        return SheetWritePlan(
+            self,
+            worksheet,
+            headers=columns.headers,
+            row_numbers=row_numbers,
+            last_row=len(columns) + 1,
+            records=records
+        )
+    
     def append_disclosures(self, disclosures: List[Dict], sheet_name: str = "밸류업공시목록") -> List[Dict]:
         """
         공시 목록 추가 (배치)
@@ -252,8 +484,10 @@ class GSheetManager:
         Returns:
             새로 추가된 항목 리스트 (PDF 처리용)
         """
+        self.last_append_error = None
         worksheet = self.get_or_create_worksheet(sheet_name)
         if not worksheet:
+            self.last_append_error = "워크시트 없음"
             return []
         
         # 이미 존재하는 접수번호 확인
@@ -262,7 +496,7 @@ class GSheetManager:
         # 새로운 항목만 필터링 (접수번호 정규화하여 비교)
         new_items = []
         for d in disclosures:
-            acptno = self._normalize_acptno(d.get('접수번호', ''))
+            acptno = normalize_acptno(d.get('접수번호', ''))
             if acptno and acptno not in existing:
                 new_items.append(d)
         
@@ -275,38 +509,18 @@ class GSheetManager:
         
         # 행 데이터 생성
         now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        rows = []
-        for d in new_items:
-            # 종목코드와 접수번호는 텍스트로 저장 (앞에 ' 붙여서 숫자 변환 방지)
-            종목코드 = d.get('종목코드', '')
-            if 종목코드:
-                종목코드 = "'" + str(종목코드).zfill(6)  # 6자리 패딩 + 텍스트 표시
-            
-            접수번호 = d.get('접수번호', '')
-            if 접수번호:
-                접수번호 = "'" + str(접수번호)  # 텍스트로 저장
-            
-            row = [
-                d.get('번호', ''),
-                d.get('공시일자', ''),
-                d.get('회사명', ''),
-                종목코드,
-                d.get('공시제목', ''),
-                접수번호,
-                d.get('원시PDF링크', ''),
-                d.get('구글드라이브링크', ''),
-                now,
-                ''  # 아티팩트링크 (나중에 업데이트)
-            ]
-            rows.append(row)
+        rows = [self._build_row(d, now) for d in new_items]
         
         # 배치로 추가 (1회 API 호출)
         try:
             worksheet.append_rows(rows, value_input_option='USER_ENTERED')
+            # 다음 조회 시 추가된 행만 증분 동기화
+            self._synced_sheets.discard(worksheet.title)
             log(f"{len(rows)}건의 새로운 공시 추가 완료")
             return new_items  # 추가된 항목 리스트 반환
         except Exception as e:
             log(f"행 추가 중 오류: {e}")
+            self.last_append_error = str(e)
             return []
     
     def batch_update_links(
@@ -337,9 +551,10 @@ class GSheetManager:
         # 업데이트할 셀 데이터 수집
         batch_data = []
         updated_count = 0
+        state_updates = {}
         
         for update in updates:
-            acptno = self._normalize_acptno(update.get('접수번호', ''))
+            acptno = normalize_acptno(update.get('접수번호', ''))
             gdrive_link = update.get('구글드라이브링크', '')
             artifact_link = update.get('아티팩트링크', '')
             
@@ -356,6 +571,7 @@ class GSheetManager:
                     'range': cell_h,
                     'values': [[gdrive_link]]
                 })
+                state_updates.setdefault(acptno, {})['구글드라이브링크'] = gdrive_link
             
             # J열 (아티팩트링크) 업데이트
             if artifact_link:
@@ -364,6 +580,7 @@ class GSheetManager:
                     'range': cell_j,
                     'values': [[artifact_link]]
                 })
+                state_updates.setdefault(acptno, {})['아티팩트링크'] = artifact_link
             
             updated_count += 1
         
@@ -374,6 +591,8 @@ class GSheetManager:
         # 배치 업데이트 (1회 API 호출)
         try:
             worksheet.batch_update(batch_data, value_input_option='USER_ENTERED')
+            if self.state_store:
+                self.state_store.update_many(worksheet.title, state_updates)
             log(f"  → {updated_count}건 링크 배치 업데이트 완료 (API 호출 1회)")
             return updated_count
         except Exception as e:
@@ -414,26 +633,16 @@ class GSheetManager:
         if not worksheet:
             return []
         
-        try:
-            all_records = worksheet.get_all_records()
-            result = []
-            for r in all_records:
-                if not r.get('접수번호'):
-                    continue
-                
-                gdrive_link = str(r.get('구글드라이브링크', '')).strip()
-                
-                # 실제 Google Drive 링크가 있으면 제외 (이미 업로드 완료)
-                if gdrive_link.startswith('https://drive.google.com/'):
-                    continue
-                
-                # 비어있거나, [로컬저장] 등 다른 값이면 포함 (재처리 필요)
-                result.append(r)
-            
-            return result
-        except Exception as e:
-            log(f"항목 조회 중 오류: {e}")
+        if self._sync_state(worksheet):
+            return self.state_store.records(worksheet.title, without_gdrive_link=True)
+        
+        columns = self.read_columns(worksheet, self.PENDING_COLUMNS)
+        if columns is None:
             return []
+        
+        # 실제 Google Drive 링크가 있으면 제외 (이미 업로드 완료)
+        # 비어있거나, [로컬저장] 등 다른 값이면 포함 (재처리 필요)
+        return [r for r in columns.records() if not _has_drive_link(r)]
     
     def get_items_without_artifact_link(self, sheet_name: str = "밸류업공시목록") -> List[Dict]:
         """
@@ -449,15 +658,296 @@ class GSheetManager:
         if not worksheet:
             return []
         
-        try:
-            all_records = worksheet.get_all_records()
+        if self._sync_state(worksheet):
             return [
-                r for r in all_records 
-                if r.get('접수번호') and not r.get('아티팩트링크')
+                r for r in self.state_store.records(worksheet.title)
+                if not r.get('아티팩트링크')
             ]
-        except Exception as e:
-            log(f"항목 조회 중 오류: {e}")
+        
+        columns = self.read_columns(worksheet, self.PENDING_COLUMNS)
+        if columns is None:
             return []
+        return [r for r in columns.records() if not str(r.get('아티팩트링크', '')).strip()]
+
+
+# 공시일자/수집일시 형식 → 시트 날짜 표시 형식 (USER_ENTERED와 같이 날짜 값으로 기록)
+_DATE_FORMATS = [
+    (re.compile(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$'), '%Y-%m-%d %H:%M:%S', 'DATE_TIME', 'yyyy-mm-dd hh:mm:ss'),
+    (re.compile(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}$'), '%Y-%m-%d %H:%M', 'DATE_TIME', 'yyyy-mm-dd hh:mm'),
+    (re.compile(r'^\d{4}-\d{2}-\d{2}$'), '%Y-%m-%d', 'DATE', 'yyyy-mm-dd'),
+]
+
+# 시트 날짜 일련번호 기준일
+_SHEETS_EPOCH = datetime(1899, 12, 30)
+
+# 행 추가 시 갱신할 CellData 필드 (날짜 셀의 표시 형식 포함)
+_APPEND_CELL_FIELDS = 'userEnteredValue,userEnteredFormat.numberFormat'
+
+
+def _date_cell(text: str) -> Optional[Dict]:
+    """날짜 문자열 → 일련번호 + 날짜 표시 형식 CellData (날짜가 아니면 None)"""
+    for pattern, parse_format, number_type, display in _DATE_FORMATS:
+        if not pattern.match(text):
+            continue
+        try:
+            moment = datetime.strptime(text, parse_format)
+        except ValueError:
+            return None
+        return {
+            'userEnteredValue': {'numberValue': (moment - _SHEETS_EPOCH).total_seconds() / 86400},
+            'userEnteredFormat': {'numberFormat': {'type': number_type, 'pattern': display}},
+        }
+    return None
+
+
+def _user_entered_cell(value) -> Dict:
+    """
+    행 값 → CellData (values.append의 USER_ENTERED 입력 규칙 중 이 시트가 쓰는 부분)
+    
+    - ' 로 시작: 텍스트 (' 제외)
+    - = 로 시작: 수식
+    - 숫자/불리언: 그대로
+    - YYYY-MM-DD[ HH:MM[:SS]]: 날짜 값 (표시 형식은 입력과 동일하므로 읽을 때도 같은 문자열)
+    - 그 외 문자열: 텍스트
+    """
+    if value is None or value == '':
+        return {}
+    if isinstance(value, bool):
+        return {'userEnteredValue': {'boolValue': value}}
+    if isinstance(value, (int, float)):
+        return {'userEnteredValue': {'numberValue': value}}
+    text = str(value)
+    if text.startswith("'"):
+        return {'userEnteredValue': {'stringValue': text[1:]}}
+    if text.startswith('='):
+        return {'userEnteredValue': {'formulaValue': text}}
+    return _date_cell(text) or {'userEnteredValue': {'stringValue': text}}
+
+
+def _has_drive_link(record: Dict) -> bool:
+    """실제 Google Drive 링크가 기록된 행인지 ([로컬저장] 등은 재처리 대상)"""
+    return str(record.get('구글드라이브링크', '')).strip().startswith('https://drive.google.com/')
+
+
+class SheetWritePlan:
+    """
+    실행 단위 시트 쓰기 계획 (unit of work)
+    
+    시작 시 시트를 1회 읽고, 행 추가/링크 업데이트는 로컬에 모아 두었다가
+    commit()에서 그리드 확장·헤더 보정과 함께 spreadsheets.batchUpdate 1회로 기록
+    
+    사용법:
+        plan = manager.begin_plan()
+        new_items = plan.stage_append(disclosures)
+        pending = plan.items_without_gdrive_link()
+        plan.stage_links(link_updates)
+        plan.commit()
+    """
+    
+    ROW_MARGIN = 100  # 행 확장 시 여유분
+    
+    def __init__(
+        self,
+        manager: GSheetManager,
+        worksheet: gspread.Worksheet,
+        headers: List[str],
+        row_numbers: Dict[str, int],
+        last_row: int,
+        records: Optional[List[Dict]] = None
+    ):
+        """
+        초기화 (GSheetManager.begin_plan에서 생성)
+        
+        Args:
+            manager: 시트 관리자
+            worksheet: 워크시트
+            headers: 현재 헤더 행
+            row_numbers: {접수번호: 행번호}
+            last_row: 마지막 데이터 행 번호 (헤더 포함)
+            records: 시트 전체 레코드 (None이면 상태 저장소에서 조회)
+        """
+        self.manager = manager
+        self.worksheet = worksheet
+        self.headers = headers
+        self.row_numbers = row_numbers
+        self.last_row = last_row
+        self._records = records
+        
+        self._appends: Dict[str, List[Any]] = {}         # 접수번호 → 추가할 행 값 (추가 순서 유지)
+        self._links: Dict[str, Dict[str, str]] = {}      # 접수번호 → {헤더: 링크}
+        self.committed = False
+        self.error: Optional[str] = None
+    
+    def stage_append(self, disclosures: List[Dict]) -> List[Dict]:
+        """
+        새 공시 행 추가 예약 (이미 기록/예약된 접수번호 제외)
+        
+        Args:
+            disclosures: 공시 정보 딕셔너리 리스트
+            
+        Returns:
+            새로 추가될 항목 리스트 (PDF 처리용)
+        """
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        new_items = []
+        for d in disclosures:
+            acptno = normalize_acptno(d.get('접수번호', ''))
+            if not acptno or acptno in self.row_numbers or acptno in self._appends:
+                continue
+            self._appends[acptno] = self.manager._build_row(d, now)
+            new_items.append(d)
+        
+        if new_items:
+            log(f"{len(new_items)}건의 새로운 공시 추가 예약")
+        else:
+            log("새로운 공시 항목이 없습니다.")
+        return new_items
+    
+    def stage_links(self, updates: List[Dict]) -> int:
+        """
+        링크 업데이트 예약 (추가 예약된 행은 행 값에 병합)
+        
+        Args:
+            updates: [{'접수번호': str, '구글드라이브링크': str, '아티팩트링크': str}, ...]
+            
+        Returns:
+            예약된 행 수
+        """
+        staged = 0
+        for update in updates:
+            acptno = normalize_acptno(update.get('접수번호', ''))
+            if acptno not in self.row_numbers and acptno not in self._appends:
+                log(f"  [WARN] 접수번호 {acptno}를 찾을 수 없음")
+                continue
+            
+            fields = {
+                header: update[header]
+                for header in ('구글드라이브링크', '아티팩트링크')
+                if update.get(header)
+            }
+            if not fields:
+                continue
+            self._links.setdefault(acptno, {}).update(fields)
+            staged += 1
+        return staged
+    
+    def items_without_gdrive_link(self) -> List[Dict]:
+        """
+        구글드라이브 링크가 없는 항목 (시트 기존 행 + 추가 예약 행, 예약된 링크 반영)
+        
+        Returns:
+            get_all_records()와 같은 형태의 딕셔너리 리스트
+        """
+        if self._records is None:
+            base = self.manager.state_store.records(self.worksheet.title, without_gdrive_link=True)
+        else:
+            base = [r for r in self._records if not _has_drive_link(r)]
+        
+        staged = [
+            {h: v[1:] if isinstance(v, str) and v.startswith("'") else v
+             for h, v in zip(GSheetManager.HEADERS, values)}
+            for values in self._appends.values()
+        ]
+        
+        result = []
+        for record in base + staged:
+            acptno = normalize_acptno(record.get('접수번호', ''))
+            if _has_drive_link({**record, **self._links.get(acptno, {})}):
+                continue
+            result.append(record)
+        return result
+    
+    def _requests(self) -> List[Dict]:
+        """batchUpdate 요청 목록 (그리드 확장 → 헤더 → 기존 행 링크 → 행 추가)"""
+        sheet_id = self.worksheet.id
+        requests = []
+        
+        grid = {}
+        required_rows = self.last_row + len(self._appends) + self.ROW_MARGIN
+        if self._appends and self.worksheet.row_count < required_rows:
+            grid['rowCount'] = required_rows
+            log(f"  시트 행 확장: {self.worksheet.row_count} → {required_rows}")
+        if self.worksheet.col_count < len(GSheetManager.HEADERS):
+            grid['columnCount'] = len(GSheetManager.HEADERS)
+            log(f"  시트 열 확장: {self.worksheet.col_count} → {len(GSheetManager.HEADERS)}")
+        if grid:
+            requests.append({'updateSheetProperties': {
+                'properties': {'sheetId': sheet_id, 'gridProperties': grid},
+                'fields': ','.join(f'gridProperties.{key}' for key in grid)
+            }})
+        
+        if self.headers and len(self.headers) < len(GSheetManager.HEADERS):
+            missing_headers = GSheetManager.HEADERS[len(self.headers):]
+            requests.append({'updateCells': {
+                'start': {'sheetId': sheet_id, 'rowIndex': 0, 'columnIndex': len(self.headers)},
+                'rows': [{'values': [_user_entered_cell(h) for h in missing_headers]}],
+                'fields': 'userEnteredValue'
+            }})
+            log(f"  시트에 새 헤더 추가: {missing_headers}")
+        
+        columns = {
+            '구글드라이브링크': GSheetManager.COL_GDRIVE_LINK,
+            '아티팩트링크': GSheetManager.COL_ARTIFACT_LINK,
+        }
+        for acptno, fields in self._links.items():
+            if acptno in self._appends:
+                values = self._appends[acptno]
+                for header, value in fields.items():
+                    values[columns[header] - 1] = value
+                continue
+            for header, value in fields.items():
+                requests.append({'updateCells': {
+                    'start': {
+                        'sheetId': sheet_id,
+                        'rowIndex': self.row_numbers[acptno] - 1,
+                        'columnIndex': columns[header] - 1
+                    },
+                    'rows': [{'values': [_user_entered_cell(value)]}],
+                    'fields': 'userEnteredValue'
+                }})
+        
+        # 행 추가는 서버 기준 마지막 데이터 행 뒤에 붙임 (다른 실행이 먼저 추가했어도 덮어쓰지 않음)
+        if self._appends:
+            requests.append({'appendCells': {
+                'sheetId': sheet_id,
+                'rows': [{'values': [_user_entered_cell(v) for v in values]} for values in self._appends.values()],
+                'fields': _APPEND_CELL_FIELDS
+            }})
+        return requests
+    
+    def commit(self) -> bool:
+        """
+        예약된 쓰기를 spreadsheets.batchUpdate 1회로 기록 (두 번째 호출부터는 결과만 반환)
+        
+        Returns:
+            성공 여부 (기록할 내용이 없으면 True)
+        """
+        if self.committed:
+            return self.error is None
+        self.committed = True
+        
+        requests = self._requests()
+        if not requests:
+            return True
+        
+        try:
+            self.manager.spreadsheet.batch_update({'requests': requests})
+        except Exception as e:
+            self.error = str(e)
+            log(f"시트 일괄 기록 중 오류: {e}")
+            return False
+        
+        # 추가 행은 다음 조회 시 증분 동기화, 기존 행 링크는 write-through
+        title = self.worksheet.title
+        if self._appends:
+            self.manager._synced_sheets.discard(title)
+        existing_links = {acptno: fields for acptno, fields in self._links.items() if acptno not in self._appends}
+        if self.manager.state_store and existing_links:
+            self.manager.state_store.update_many(title, existing_links)
+        
+        log(f"시트 일괄 기록 완료: 추가 {len(self._appends)}행, 링크 {len(self._links)}건 "
+            f"(batchUpdate 1회, 요청 {len(requests)}개)")
+        return True
 
 
 def main():
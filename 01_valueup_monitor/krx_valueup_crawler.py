@@ -4,14 +4,26 @@ Playwright 기반으로 KRX KIND 사이트에서 밸류업 공시를 크롤링
 """
 
 import asyncio
+import math
 import re
 import os
-import tempfile
+import time
 from datetime import datetime, timedelta
 from dataclasses import dataclass
-from typing import List, Optional
+from html.parser import HTMLParser
+from typing import AsyncIterable, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import urljoin
 from playwright.async_api import async_playwright, Page, Browser
 
+from throttle import HostThrottle
+from resource_policy import ResourcePolicy, ROLE_LISTING, ROLE_VIEWER
+from readiness import Readiness
+from pdf_downloader import DownloadedPDF, PDFDownloader
+from method_stats import (
+    MethodStats, disclosure_profile, DEFAULT_METHODS, METHOD_LABELS, METHOD_SOURCES,
+    METHOD_ATTACHMENT, METHOD_FILEDOWNLOAD, METHOD_BUTTON, SOURCE_ATTACHMENT, SOURCE_BODY, SOURCE_LABELS
+)
+
 
 def log(msg: str):
     """실시간 로그 출력 (GitHub Actions 호환)"""
@@ -19,6 +31,244 @@ def log(msg: str):
     print(f"[{timestamp}] {msg}", flush=True)
 
 
+# 접수번호 추출 패턴 (우선순위 순, 모듈 로드 시 1회 컴파일)
+ACPTNO_PATTERNS = [
+    re.compile(r"openDisclsViewer\s*\(\s*['\"]?(\d+)['\"]?"),  # openDisclsViewer('접수번호')
+    re.compile(r"openPop\s*\(\s*['\"]?(\d+)['\"]?"),           # openPop('접수번호')
+    re.compile(r'acpt[Nn]o[=\'"\s:]+(\d{14,})'),                # acptno=접수번호
+    re.compile(r'href="[^"]*?(\d{14,})[^"]*"'),                  # href 내 14자리 이상 숫자
+    re.compile(r'onclick="[^"]*?(\d{14,})[^"]*"'),               # onclick 내 14자리 이상 숫자
+    re.compile(r'[\'"](\d{14,})[\'"]'),                          # 임의 속성의 14자리 이상 숫자
+]
+STOCK_CODE_PATTERN = re.compile(r'[A-Z]?\d{6}')
+
+# 목록 전체 건수 ("전체 1,234건", "총 <em>1,234</em>건" 등)
+TOTAL_COUNT_PATTERN = re.compile(r'(?:전체|총)\s*(?:<[^>]+>\s*)*([\d,]+)\s*(?:<[^>]+>\s*)*건')
+
+# 목록 테이블 셀렉터 (우선순위 순)
+TABLE_ROW_SELECTORS = [
+    'table.list tbody tr',
+    'table tbody tr',
+    '.board-list tbody tr',
+    '#grid tbody tr',
+]
+
+# 목록 테이블 전체를 1회 evaluate로 직렬화 (셀렉터, 행별 HTML/셀 텍스트)
+SERIALIZE_ROWS_JS = """(selectors) => {
+    for (const selector of selectors) {
+        const rows = document.querySelectorAll(selector);
+        if (rows.length > 0) {
+            return {
+                selector: selector,
+                rows: Array.from(rows, tr => ({
+                    html: tr.innerHTML,
+                    cells: Array.from(tr.querySelectorAll('td'), td => td.textContent || '')
+                }))
+            };
+        }
+    }
+    return { selector: null, rows: [] };
+}"""
+
+
+def parse_total_count(html: str) -> Optional[int]:
+    """
+    목록 HTML에서 전체 건수 추출
+    
+    Args:
+        html: 목록 페이지 HTML
+        
+    Returns:
+        전체 건수 또는 None
+    """
+    match = TOTAL_COUNT_PATTERN.search(html)
+    if match:
+        digits = match.group(1).replace(',', '')
+        if digits.isdigit():
+            return int(digits)
+    return None
+
+
+def extract_acptno(row_html: str) -> str:
+    """
+    행 HTML에서 접수번호 추출
+    
+    Args:
+        row_html: 목록 행 HTML
+        
+    Returns:
+        접수번호 또는 빈 문자열
+    """
+    for pattern in ACPTNO_PATTERNS:
+        match = pattern.search(row_html)
+        if match:
+            return match.group(1)
+    return ""
+
+
+class _ListingTableParser(HTMLParser):
+    """목록 HTML에서 tbody 행(셀 텍스트 + 행 HTML)을 한 번에 추출"""
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.list_rows: List[Tuple[List[str], str]] = []   # table.list 행
+        self.other_rows: List[Tuple[List[str], str]] = []  # 그 외 table 행
+        self._table_stack: List[bool] = []  # 중첩 table별 'list' 클래스 여부
+        self._in_tbody = False
+        self._row = None   # (cells, html_parts)
+        self._cell = None  # 현재 셀 텍스트 조각
+    
+    def handle_starttag(self, tag, attrs):
+        if tag == 'table':
+            classes = (dict(attrs).get('class') or '').split()
+            self._table_stack.append('list' in classes)
+        elif tag == 'tbody':
+            self._in_tbody = True
+        elif tag == 'tr' and self._in_tbody and self._table_stack:
+            self._row = ([], [])
+        elif self._row is not None:
+            self._row[1].append(self.get_starttag_text() or '')
+            if tag == 'td':
+                self._cell = []
+    
+    def handle_endtag(self, tag):
+        if tag == 'table':
+            if self._table_stack:
+                self._table_stack.pop()
+        elif tag == 'tbody':
+            self._in_tbody = False
+        elif tag == 'tr' and self._row is not None:
+            cells, html_parts = self._row
+            target = self.list_rows if self._table_stack and self._table_stack[-1] else self.other_rows
+            target.append((cells, ''.join(html_parts)))
+            self._row = None
+        elif self._row is not None:
+            if tag == 'td' and self._cell is not None:
+                self._row[0].append(''.join(self._cell))
+                self._cell = None
+            self._row[1].append(f"</{tag}>")
+    
+    def handle_data(self, data):
+        if self._row is not None:
+            self._row[1].append(data)
+            if self._cell is not None:
+                self._cell.append(data)
+
+
+def parse_listing_rows(html: str) -> List[Tuple[List[str], str]]:
+    """
+    목록 HTML에서 tbody 행 추출 (HTTP 목록 조회용)
+    
+    Args:
+        html: 목록 페이지 HTML
+        
+    Returns:
+        [(셀 텍스트 리스트, 행 HTML), ...] - table.list 우선, 없으면 전체 table
+    """
+    parser = _ListingTableParser()
+    parser.feed(html)
+    parser.close()
+    return parser.list_rows or parser.other_rows
+
+
+# 첨부서류 드롭다운 옵션 판정 키워드
+ATTACHMENT_KEYWORDS = ['첨부', '기타공시', '기타공개', '첨부서류', '첨부문서']
+
+# searchContents 응답(setPath 스크립트)에서 문서 경로 추출
+DOCUMENT_PATH_PATTERNS = [
+    re.compile(r"""['"]([^'"\s]+?\.pdf)['"]""", re.IGNORECASE),
+    re.compile(r"""['"]([^'"\s]*?/external/[^'"\s]+?\.html?)['"]""", re.IGNORECASE),
+    re.compile(r"""['"]([^'"\s]+?\.html?)['"]""", re.IGNORECASE),
+]
+PDF_HREF_PATTERN = re.compile(r"""href\s*=\s*['"]([^'"]+?\.pdf[^'"]*)['"]""", re.IGNORECASE)
+
+
+class _AttachedDocParser(HTMLParser):
+    """뷰어 HTML에서 select#attachedDoc 옵션(value, 텍스트) 추출"""
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.found = False
+        self.options: List[Tuple[str, str]] = []
+        self._in_select = False
+        self._option = None  # (value, text_parts)
+    
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'select' and attrs.get('id') == 'attachedDoc':
+            self.found = True
+            self._in_select = True
+        elif tag == 'option' and self._in_select:
+            self._close_option()
+            self._option = (attrs.get('value') or '', [])
+    
+    def handle_endtag(self, tag):
+        if tag == 'option':
+            self._close_option()
+        elif tag == 'select' and self._in_select:
+            self._close_option()
+            self._in_select = False
+    
+    def handle_data(self, data):
+        if self._option is not None:
+            self._option[1].append(data)
+    
+    def _close_option(self):
+        if self._option is not None:
+            value, parts = self._option
+            self.options.append((value.strip(), ''.join(parts).strip()))
+            self._option = None
+
+
+def parse_attached_options(html: str) -> Optional[List[Tuple[str, str]]]:
+    """
+    뷰어 HTML에서 첨부문서 드롭다운 옵션 추출
+    
+    Args:
+        html: disclsviewer.do 응답 HTML
+        
+    Returns:
+        [(옵션 value, 옵션 텍스트), ...], 드롭다운 자체가 없으면 None (구조 미인식)
+    """
+    parser = _AttachedDocParser()
+    parser.feed(html)
+    parser.close()
+    return parser.options if parser.found else None
+
+
+def find_document_url(contents: str, base_url: str) -> str:
+    """
+    searchContents 응답에서 첨부문서(.htm) 또는 PDF 경로 추출
+    
+    Args:
+        contents: searchContents 응답 본문
+        base_url: 상대 경로 기준 URL
+        
+    Returns:
+        절대 URL 또는 빈 문자열
+    """
+    for pattern in DOCUMENT_PATH_PATTERNS:
+        match = pattern.search(contents)
+        if match:
+            return urljoin(base_url, match.group(1))
+    return ""
+
+
+def find_pdf_link(html: str, page_url: str) -> str:
+    """
+    첨부문서 HTML에서 PDF 링크 추출
+    
+    Args:
+        html: 첨부문서 HTML
+        page_url: 첨부문서 URL (상대 경로 기준)
+        
+    Returns:
+        PDF 절대 URL 또는 빈 문자열
+    """
+    match = PDF_HREF_PATTERN.search(html)
+    return urljoin(page_url, match.group(1)) if match else ""
+
+
 @dataclass
 class DisclosureItem:
     """공시 항목 데이터 클래스"""
@@ -33,6 +283,20 @@ class DisclosureItem:
     구글드라이브링크: str = ""
 
 
+@dataclass
+class PDFDownloadResult:
+    """PDF 다운로드 결과 (다운로드 풀 결과 단위)"""
+    접수번호: str
+    pdf: Optional[DownloadedPDF]  # 디스크에 저장된 PDF (경로 + SHA-256 + 크기)
+    elapsed: float  # 소요 시간 (초)
+    error: str = ""
+    cached: bool = False  # 다운로드 없이 lookup(캐시 등)에서 가져온 경우
+
+
+class ListingUnavailable(Exception):
+    """HTTP 목록 조회 경로를 쓸 수 없음 (첫 페이지부터 실패, Playwright로 fallback)"""
+
+
 class KRXValueUpCrawler:
     """KRX 밸류업 공시 크롤러"""
     
@@ -41,6 +305,56 @@ class KRXValueUpCrawler:
     VIEWER_URL = f"{BASE_URL}/common/disclsviewer.do"
     PDF_DOWNLOAD_URL = f"{BASE_URL}/common/pdfDownload.do"
     
+    # HTTP 목록 조회 (검색 폼 직접 POST)
+    LIST_SUB_URL = f"{BASE_URL}/valueup/disclsstat.do"
+    LIST_FORM = {
+        'method': 'valueupDisclsStatSub',
+        'forward': 'valueupdisclsstat_sub',
+        'currentPageSize': '15',
+        'pageIndex': '1',
+        'orderMode': '1',
+        'orderStat': 'D',
+        'searchCorpName': '',
+        'repIsuSrtCd': '',
+    }
+    
+    # 목록 페이지 크기 (KIND 기본값 15, 서버가 받아주면 더 큰 값으로 한 번에 조회)
+    DEFAULT_PAGE_SIZE = 15
+    
+    # 검색 폼에 currentPageSize 설정 (select면 옵션 추가, 필드가 없으면 hidden input 생성)
+    SET_PAGE_SIZE_JS = """(size) => {
+        const form = document.querySelector('form[name="searchform"]') ||
+                     document.querySelector('form[name="searchForm"]') ||
+                     document.querySelector('form#searchform') ||
+                     document.querySelector('form');
+        if (!form) return false;
+        let field = form.querySelector('[name="currentPageSize"]');
+        if (!field) {
+            field = document.createElement('input');
+            field.type = 'hidden';
+            field.name = 'currentPageSize';
+            form.appendChild(field);
+        }
+        const value = String(size);
+        if (field.tagName === 'SELECT' && !Array.from(field.options).some(o => o.value === value)) {
+            field.add(new Option(value, value));
+        }
+        field.value = value;
+        return true;
+    }"""
+    
+    # 기간 버튼 → 일수 (컷오프 계산용)
+    PERIOD_DAYS = {
+        '1주': 7,
+        '1개월': 30,
+        '3개월': 90,
+        '6개월': 180,
+        '1년': 365,
+        '2년': 730,
+        '3년': 1095,
+        '전체': 3650  # 약 10년
+    }
+    
     # 기간 버튼 매핑
     PERIOD_BUTTONS = {
         '1주': '1주',
@@ -53,15 +367,43 @@ class KRXValueUpCrawler:
         '전체': '전체'
     }
     
-    def __init__(self, headless: bool = True, debug_dir: Optional[str] = None):
+    def __init__(
+        self,
+        headless: bool = True,
+        debug_dir: Optional[str] = None,
+        max_per_host: Optional[int] = None,
+        requests_per_second: Optional[float] = None,
+        listing_mode: Optional[str] = None,
+        pdf_resolver: Optional[str] = None,
+        page_size: Optional[int] = None
+    ):
         """
         초기화
         
         Args:
             headless: 헤드리스 모드 여부
             debug_dir: 디버그 파일 저장 디렉토리 (None이면 환경변수에서 읽음)
+            max_per_host: 호스트당 최대 동시 요청 수 (None이면 VALUEUP_HOST_CONCURRENCY, 기본 3)
+            requests_per_second: 호스트당 초당 요청 수 (None이면 VALUEUP_REQUESTS_PER_SEC, 기본 1.0)
+            listing_mode: 목록 조회 방식 'http' 또는 'browser' (None이면 VALUEUP_LISTING_MODE, 기본 'http')
+            pdf_resolver: 첨부 PDF 탐색 방식 'http' 또는 'browser' (None이면 VALUEUP_PDF_RESOLVER, 기본 'http')
+            page_size: 목록 페이지 크기 (None이면 VALUEUP_LIST_PAGE_SIZE, 기본 100, 서버가 거부하면 15)
         """
         self.headless = headless
+        
+        # 요청 속도 제어 (고정 sleep 대신 호스트별 동시 접속 제한 + 토큰 버킷)
+        if max_per_host is None:
+            max_per_host = int(os.environ.get('VALUEUP_HOST_CONCURRENCY', '3'))
+        if requests_per_second is None:
+            requests_per_second = float(os.environ.get('VALUEUP_REQUESTS_PER_SEC', '1.0'))
+        self.throttle = HostThrottle(max_per_host=max_per_host, requests_per_second=requests_per_second)
+        
+        # 파서가 읽지 않는 리소스(이미지, 폰트, 외부 스크립트 등) 차단
+        self.resource_policy = ResourcePolicy()
+        
+        # 고정 sleep 대신 신호 기반 대기 (목록 행 변경, iframe 로드/이동)
+        self.readiness = Readiness()
+        
         # 환경변수에서 디버그 디렉토리 읽기
         if debug_dir is None:
             env_debug = os.environ.get('VALUEUP_DEBUG', 'false').lower()
@@ -72,8 +414,40 @@ class KRXValueUpCrawler:
         else:
             self.debug_dir = debug_dir
             
+        # 목록 조회 방식 (http: 검색 폼 직접 POST, 실패 시 browser로 fallback)
+        self.listing_mode = (listing_mode or os.environ.get('VALUEUP_LISTING_MODE', 'http')).lower()
+        
+        # 목록 페이지 크기 (첫 페이지 응답을 보고 서버가 실제로 적용한 크기로 조정)
+        if page_size is None:
+            page_size = int(os.environ.get('VALUEUP_LIST_PAGE_SIZE', '100'))
+        self.page_size = max(self.DEFAULT_PAGE_SIZE, page_size)
+        
+        # 마지막 목록 조회가 워터마크/컷오프 날짜/마지막 페이지까지 도달했는지
+        # (max_pages, 페이지 조회/이동 실패로 중간에 끊기면 False → 워터마크를 전진시키면 안 됨)
+        self.listing_complete = False
+        
+        # 첨부 PDF 탐색 방식 (http: 뷰어 HTML 직접 파싱, 실패 시 browser로 fallback)
+        self.pdf_resolver = (pdf_resolver or os.environ.get('VALUEUP_PDF_RESOLVER', 'http')).lower()
+        self.resolver_stats = {'http': 0, 'browser': 0}
+        
+        # PDF 스트리밍 다운로드 (공유 HTTP 세션 사용, 결과는 임시 파일)
+        self.downloader = PDFDownloader()
+        
+        # 뷰어 페이지 PDF 확보 방식별 성공률 (실행 간 유지, 유형별로 시도 순서 결정)
+        self.method_stats = MethodStats()
+        self._profiles: Dict[str, str] = {}  # 접수번호 → 공시/제출인 유형 키
+        self._pdf_methods = {
+            METHOD_ATTACHMENT: self._pdf_by_attachment,
+            METHOD_FILEDOWNLOAD: self._pdf_by_filedownload,
+            METHOD_BUTTON: self._pdf_by_button,
+        }
+        
+        self.playwright = None
         self.browser: Optional[Browser] = None
+        self.context = None
         self.page: Optional[Page] = None
+        self._browser_lock = asyncio.Lock()
+        self._http_session = None  # aiohttp 세션 (지연 생성)
         
         # 디버그 디렉토리 생성
         if self.debug_dir:
@@ -88,23 +462,47 @@ class KRXValueUpCrawler:
         await self.close()
         
     async def start(self):
-        """브라우저 시작"""
-        log("브라우저 시작 중...")
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(headless=self.headless)
-        self.context = await self.browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            locale="ko-KR",
-            accept_downloads=True  # 다운로드 허용
-        )
-        self.page = await self.context.new_page()
-        log("브라우저 시작 완료")
+        """크롤러 시작 (HTTP 목록 모드에서는 브라우저를 필요할 때 시작)"""
+        if self.listing_mode != 'http':
+            await self._ensure_browser()
+    
+    async def _ensure_browser(self):
+        """브라우저 시작 (최초 1회)"""
+        async with self._browser_lock:
+            if self.page is not None:
+                return
+            
+            log("브라우저 시작 중...")
+            self.playwright = await async_playwright().start()
+            self.browser = await self.playwright.chromium.launch(headless=self.headless)
+            self.context = await self.browser.new_context(
+                viewport={"width": 1920, "height": 1080},
+                locale="ko-KR",
+                accept_downloads=True  # 다운로드 허용
+            )
+            self.page = await self.context.new_page()
+            await self.resource_policy.attach(self.page, ROLE_LISTING)
+            log("브라우저 시작 완료")
         
     async def close(self):
-        """브라우저 종료"""
+        """브라우저 및 HTTP 세션 종료"""
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
+        
+        if self.resolver_stats['http'] or self.resolver_stats['browser']:
+            log(f"PDF 탐색 방식: HTTP {self.resolver_stats['http']}건, 브라우저 {self.resolver_stats['browser']}건")
+            log(f"PDF 다운로드: {self.downloader.summary()}")
+        if self.resolver_stats['browser']:
+            log(f"PDF 확보 방식: {self.method_stats.summary()}")
+        self.method_stats.save()
+        
+        if not self.browser:
+            return
+        
+        log(f"리소스 차단 통계: {self.resource_policy.summary()}")
+        log(f"대기 시간 통계: {self.readiness.summary()}")
         log("브라우저 종료 중...")
-        if self.browser:
-            await self.browser.close()
+        await self.browser.close()
         if self.playwright:
             await self.playwright.stop()
         log("브라우저 종료 완료")
@@ -194,9 +592,13 @@ class KRXValueUpCrawler:
             for selector in selectors:
                 btn = self.page.locator(selector).first
                 if await btn.count() > 0:
+                    old_first_row = await self.readiness.first_row_text(self.page)
                     await btn.click()
                     log(f"  기간 버튼 클릭: {period}")
-                    await asyncio.sleep(2)
+                    # 기간 버튼이 목록을 다시 조회하지 않을 수도 있으므로 짧게 대기
+                    await self.readiness.rows_changed(
+                        self.page, old_first_row, 'period', timeout_ms=3000, any_mutation=True
+                    )
                     return True
             
             log(f"  기간 버튼을 찾을 수 없음: {period}")
@@ -206,6 +608,25 @@ class KRXValueUpCrawler:
             log(f"  기간 버튼 클릭 오류: {e}")
             return False
     
+    async def apply_page_size(self, size: int) -> bool:
+        """
+        검색 폼의 페이지 크기 설정 (다음 검색/페이지 이동부터 적용)
+        
+        Args:
+            size: 페이지당 행 수
+            
+        Returns:
+            설정 성공 여부
+        """
+        try:
+            applied = await self.page.evaluate(self.SET_PAGE_SIZE_JS, size)
+        except Exception as e:
+            log(f"  페이지 크기 설정 오류: {e}")
+            return False
+        if applied:
+            log(f"  페이지 크기 설정: {size}행")
+        return bool(applied)
+    
     async def click_search_button(self) -> bool:
         """검색 버튼 클릭 - 밸류업 페이지에 특화된 셀렉터 사용"""
         try:
@@ -237,9 +658,13 @@ class KRXValueUpCrawler:
                         # 버튼이 보이는지 확인
                         is_visible = await btn.is_visible()
                         if is_visible:
+                            old_first_row = await self.readiness.first_row_text(self.page)
                             await btn.click()
                             log(f"  검색 버튼 클릭 성공: {selector}")
-                            await asyncio.sleep(2)
+                            # 검색 결과의 첫 행이 같을 수 있으므로 테이블이 다시 그려지는 것을 감지
+                            await self.readiness.rows_changed(
+                                self.page, old_first_row, 'search', any_mutation=True
+                            )
                             return True
                 except Exception:
                     continue
@@ -270,7 +695,7 @@ class KRXValueUpCrawler:
                 match = re.search(r'전체\s*(\d+)', total_text)
                 if match:
                     total = int(match.group(1))
-                    return (total // 15) + 1  # 페이지당 15건 가정
+                    return max(1, math.ceil(total / self.page_size))
             
             return 1
             
@@ -320,7 +745,6 @@ class KRXValueUpCrawler:
                     log(f"  fnPageGo navigation 없음, AJAX 방식 확인: {e}")
                     try:
                         await self.page.evaluate(f"fnPageGo('{page_num}')")
-                        await asyncio.sleep(2)
                         clicked = True
                     except:
                         pass
@@ -353,7 +777,6 @@ class KRXValueUpCrawler:
                 try:
                     await self.page.evaluate(f'goPage({page_num})')
                     log(f"  JavaScript goPage({page_num})로 이동")
-                    await asyncio.sleep(2)
                     clicked = True
                 except Exception:
                     pass
@@ -362,13 +785,10 @@ class KRXValueUpCrawler:
                 log(f"  페이지 {page_num} 링크를 찾을 수 없음 (1페이지만 존재할 수 있음)")
                 return False
             
-            # 데이터가 변경될 때까지 대기 (최대 10초)
-            for i in range(20):
-                await asyncio.sleep(0.5)
-                new_first_row = await self._get_first_row_text()
-                if new_first_row and new_first_row != old_first_row:
-                    log(f"  페이지 {page_num} 데이터 로드 완료")
-                    return True
+            # 첫 행이 바뀔 때까지 대기 (MutationObserver, 최대 VALUEUP_READY_TIMEOUT_MS)
+            if await self.readiness.rows_changed(self.page, old_first_row, 'page'):
+                log(f"  페이지 {page_num} 데이터 로드 완료")
+                return True
             
             log(f"  [WARN] 페이지 {page_num} 데이터 변경 감지 실패 (같은 데이터)")
             return False
@@ -379,116 +799,77 @@ class KRXValueUpCrawler:
     
     async def _get_first_row_text(self) -> str:
         """첫 번째 행의 텍스트 반환 (페이지 변경 감지용)"""
-        try:
-            first_row = self.page.locator('table.list tbody tr').first
-            if await first_row.count() > 0:
-                return await first_row.inner_text()
-        except:
-            pass
-        return ""
+        return await self.readiness.first_row_text(self.page)
     
     async def parse_current_page(self) -> List[DisclosureItem]:
-        """현재 페이지의 공시 목록 파싱 - 밸류업 페이지 특화"""
-        items = []
+        """현재 페이지의 공시 목록 파싱 - 밸류업 페이지 특화 (evaluate 1회로 테이블 직렬화)"""
+        try:
+            table = await self.page.evaluate(SERIALIZE_ROWS_JS, TABLE_ROW_SELECTORS)
+        except Exception as e:
+            log(f"  테이블 직렬화 오류: {e}")
+            return []
         
-        # 테이블 행 추출 (여러 셀렉터 시도)
-        table_selectors = [
-            'table.list tbody tr',
-            'table tbody tr',
-            '.board-list tbody tr',
-            '#grid tbody tr',
-        ]
-        
-        rows = []
-        for selector in table_selectors:
-            rows = await self.page.locator(selector).all()
-            if rows:
-                log(f"  테이블 셀렉터 사용: {selector}")
-                break
+        if table.get('selector'):
+            log(f"  테이블 셀렉터 사용: {table['selector']}")
         
+        rows = table.get('rows', [])
         log(f"  현재 페이지 행 수: {len(rows)}")
         
-        for row_idx, row in enumerate(rows):
+        if rows and self.debug_dir:
+            log(f"  [DEBUG] 첫 번째 행 HTML (처음 500자): {rows[0]['html'][:500]}")
+        
+        items, _ = self._parse_rows([(row['cells'], row['html']) for row in rows])
+        return items
+    
+    def _parse_rows(self, rows: List[Tuple[List[str], str]]) -> Tuple[List[DisclosureItem], int]:
+        """
+        행 데이터를 공시 항목으로 변환 (Playwright/HTTP 목록 공용)
+        
+        Args:
+            rows: [(셀 텍스트 리스트, 행 HTML), ...]
+            
+        Returns:
+            (공시 항목 리스트, 접수번호를 찾은 행 수)
+        """
+        items = []
+        recognized = 0
+        
+        for row_idx, (cells, row_html) in enumerate(rows):
             try:
-                # 행 전체 HTML 로깅 (디버그용)
-                row_html = await row.inner_html()
-                if row_idx == 0 and self.debug_dir:
-                    log(f"  [DEBUG] 첫 번째 행 HTML (처음 500자): {row_html[:500]}")
-                
-                cells = await row.locator('td').all()
                 if len(cells) < 3:
                     continue
                 
-                # 접수번호 추출 - 여러 패턴 시도
-                접수번호 = ""
-                
-                # 패턴 1: openDisclsViewer('접수번호')
-                match = re.search(r"openDisclsViewer\s*\(\s*['\"]?(\d+)['\"]?", row_html)
-                if match:
-                    접수번호 = match.group(1)
-                
-                # 패턴 2: openPop('접수번호') 또는 다른 팝업 함수
-                if not 접수번호:
-                    match = re.search(r"openPop\s*\(\s*['\"]?(\d+)['\"]?", row_html)
-                    if match:
-                        접수번호 = match.group(1)
-                
-                # 패턴 3: acptno=접수번호 또는 acptNo=접수번호
-                if not 접수번호:
-                    match = re.search(r'acpt[Nn]o[=\'"\s:]+(\d{14,})', row_html)
-                    if match:
-                        접수번호 = match.group(1)
-                
-                # 패턴 4: href에서 접수번호 추출
-                if not 접수번호:
-                    match = re.search(r'href="[^"]*?(\d{14,})[^"]*"', row_html)
-                    if match:
-                        접수번호 = match.group(1)
-                
-                # 패턴 5: onclick에서 14자리 이상 숫자 추출
-                if not 접수번호:
-                    match = re.search(r'onclick="[^"]*?(\d{14,})[^"]*"', row_html)
-                    if match:
-                        접수번호 = match.group(1)
-                
-                # 패턴 6: 어떤 속성이든 14자리 숫자 추출
-                if not 접수번호:
-                    match = re.search(r'[\'"](\d{14,})[\'"]', row_html)
-                    if match:
-                        접수번호 = match.group(1)
+                # 접수번호 추출 - 여러 패턴 시도 (우선순위 순)
+                접수번호 = extract_acptno(row_html)
                 
                 if not 접수번호:
                     log(f"  [SKIP] 행 {row_idx}: 접수번호 추출 실패")
                     continue
                 
-                log(f"  [FOUND] 접수번호: {접수번호}")
+                recognized += 1
+                if self.debug_dir:
+                    log(f"  [FOUND] 접수번호: {접수번호}")
                 
                 # 번호 (첫 번째 셀)
-                번호_text = await cells[0].text_content()
-                번호 = int(번호_text.strip()) if 번호_text and 번호_text.strip().isdigit() else 0
+                번호_text = cells[0].strip()
+                번호 = int(번호_text) if 번호_text.isdigit() else 0
                 
                 # 셀 개수에 따라 다른 파싱 로직
                 if len(cells) >= 5:
                     # 일반적인 구조: 번호 | 공시일자 | 회사명 | 종목코드 | 공시제목
-                    공시일자 = (await cells[1].text_content() or "").strip()
-                    회사명 = (await cells[2].text_content() or "").strip().split()[0] if await cells[2].text_content() else ""
-                    종목코드_text = (await cells[3].text_content() or "").strip()
-                    공시제목 = (await cells[4].text_content() or "").strip()
+                    공시일자 = cells[1].strip()
+                    회사명_full = cells[2].strip()
+                    회사명 = 회사명_full.split()[0] if 회사명_full else ""
+                    종목코드_text = cells[3].strip()
+                    공시제목 = cells[4].strip()
                     
-                elif len(cells) >= 4:
+                else:
                     # 대체 구조: 번호 | 공시일자 | 회사명(종목코드) | 공시제목
-                    공시일자 = (await cells[1].text_content() or "").strip()
-                    회사명_full = (await cells[2].text_content() or "").strip()
+                    공시일자 = cells[1].strip()
+                    회사명_full = cells[2].strip()
                     회사명 = 회사명_full.split()[0] if 회사명_full else ""
                     종목코드_text = 회사명_full
-                    공시제목 = (await cells[3].text_content() or "").strip()
-                    
-                else:
-                    # 최소 구조
-                    공시일자 = (await cells[1].text_content() or "").strip() if len(cells) > 1 else ""
-                    회사명 = ""
-                    종목코드_text = ""
-                    공시제목 = ""
+                    공시제목 = cells[3].strip() if len(cells) >= 4 else ""
                 
                 # "예고" 또는 "안내공시" 포함된 공시 제외
                 if "예고" in 공시제목 or "안내공시" in 공시제목:
@@ -498,7 +879,7 @@ class KRXValueUpCrawler:
                 # 종목코드 추출 (6자리 숫자)
                 종목코드 = ""
                 if 종목코드_text:
-                    stock_match = re.search(r'[A-Z]?\d{6}', 종목코드_text)
+                    stock_match = STOCK_CODE_PATTERN.search(종목코드_text)
                     if stock_match:
                         종목코드 = stock_match.group()
                 
@@ -521,59 +902,327 @@ class KRXValueUpCrawler:
                 log(f"  행 파싱 오류: {e}")
                 continue
         
-        return items
+        return items, recognized
     
-    async def get_disclosure_list(
-        self, 
-        days: int = 7, 
-        period: Optional[str] = None,
-        max_pages: int = 10
-    ) -> List[DisclosureItem]:
+    def _filter_page_items(
+        self,
+        page_items: List[DisclosureItem],
+        cutoff_date: datetime,
+        seen_acptno: set,
+        all_items: List[DisclosureItem],
+        watermark: Optional[str] = None
+    ) -> bool:
         """
-        공시 목록 조회
+        한 페이지 항목의 중복/기간/워터마크 필터링 후 all_items에 추가
         
         Args:
-            days: 조회할 기간(일), 기본 7일
-            period: 기간 버튼 ('1주', '1개월' 등) - 지정시 days 무시
-            max_pages: 최대 크롤링 페이지 수
+            page_items: 현재 페이지에서 파싱한 항목
+            cutoff_date: 컷오프 날짜 (이전 공시 제외)
+            seen_acptno: 이미 수집한 접수번호 (실시간 중복 방지, 갱신됨)
+            all_items: 누적 결과 리스트 (갱신됨)
+            watermark: 이전 실행에서 기록 완료한 최신 접수번호 (이하 접수번호는 제외하고 크롤링 종료)
             
         Returns:
-            공시 항목 리스트
+            다음 페이지 크롤링 계속 여부
+            (워터마크/컷오프에 도달해 종료하는 경우 listing_complete를 True로 설정)
+        """
+        filtered_items = []
+        old_items_in_page = 0
+        duplicate_count = 0
+        seen_count = 0  # 워터마크 이하 (이미 기록된) 항목 수
+        
+        for item in page_items:
+            self.note_disclosure(item.접수번호, item.공시제목, item.회사명)
+            
+            # 중복 체크 (실시간)
+            if item.접수번호 in seen_acptno:
+                duplicate_count += 1
+                continue
+            
+            # 워터마크 이하 접수번호 = 이전 실행에서 이미 기록한 공시
+            if watermark and item.접수번호.isdigit() and int(item.접수번호) <= int(watermark):
+                seen_count += 1
+                continue
+            
+            try:
+                # 날짜 파싱
+                date_str = item.공시일자.replace('.', '-').strip()
+                if ' ' in date_str:
+                    date_str = date_str.split(' ')[0]
+                
+                if len(date_str) == 10:
+                    item_date = datetime.strptime(date_str, "%Y-%m-%d")
+                elif len(date_str) == 8:
+                    item_date = datetime.strptime(date_str, "%Y%m%d")
+                else:
+                    # 날짜 파싱 실패시 포함
+                    seen_acptno.add(item.접수번호)
+                    filtered_items.append(item)
+                    continue
+                
+                if item_date >= cutoff_date:
+                    seen_acptno.add(item.접수번호)
+                    filtered_items.append(item)
+                else:
+                    old_items_in_page += 1
+                    log(f"    [SKIP] {item.회사명} - {item.공시일자} (기간 외)")
+                    
+            except Exception as e:
+                # 예외 발생시 포함 (안전)
+                seen_acptno.add(item.접수번호)
+                filtered_items.append(item)
+        
+        # 페이지 전체가 중복인 경우 → 페이지 이동 실패로 판단
+        if duplicate_count == len(page_items):
+            log(f"  [WARN] 페이지 전체가 중복 데이터, 페이지 이동 실패로 판단하여 종료")
+            return False
+        
+        # 워터마크 도달 → 이후 페이지는 모두 이미 기록된 공시
+        if seen_count > 0:
+            all_items.extend(filtered_items)
+            log(f"  필터 후: {len(filtered_items)}건 추가, 워터마크({watermark}) 도달 - 크롤링 종료")
+            self.listing_complete = True
+            return False
+        
+        # 새로 추가된 항목이 0개인 경우 → 더 이상 새 데이터 없음
+        if len(filtered_items) == 0:
+            if duplicate_count > 0:
+                log(f"  [WARN] 새로운 항목 없음 (중복 {duplicate_count}건), 페이지 이동 실패로 판단하여 종료")
+            else:
+                # 중복/워터마크 항목이 없는데 남은 것이 없으면 페이지 전체가 컷오프 이전 공시
+                log(f"  새로운 항목 없음, 크롤링 종료")
+                self.listing_complete = True
+            return False
+        
+        if duplicate_count > 0:
+            log(f"  중복 건너뜀: {duplicate_count}건")
+        
+        all_items.extend(filtered_items)
+        log(f"  필터 후: {len(filtered_items)}건 추가 (제외: {old_items_in_page}건)")
+        
+        # 조기 종료 조건: 페이지의 절반 이상이 기간 외 공시인 경우
+        if old_items_in_page > len(page_items) // 2:
+            log(f"  조회 기간 외 공시 다수 발견, 크롤링 종료")
+            # 목록은 최신순이므로 다음 페이지부터는 모두 컷오프 이전 공시
+            self.listing_complete = True
+            return False
+        
+        return True
+    
+    def note_disclosure(self, acptno: str, title: str, company: str = ""):
+        """
+        PDF 확보 방식 통계용 공시 유형 기록 (목록에서 파싱한 항목은 자동 기록)
+        
+        Args:
+            acptno: 접수번호
+            title: 공시제목
+            company: 회사명
+        """
+        profile = disclosure_profile(title, company)
+        if profile:
+            self._profiles[acptno] = profile
+    
+    async def _get_http_session(self):
+        """KIND 요청용 aiohttp 세션 (크롤러당 1개, 지연 생성)"""
+        import aiohttp
+        
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                headers={
+                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+                    'Referer': self.LIST_URL,
+                    'Accept-Language': 'ko-KR,ko;q=0.9',
+                },
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self._http_session
+    
+    async def _fetch_list_page_http(
+        self,
+        page_num: int,
+        start_date: datetime,
+        end_date: datetime,
+        page_size: int
+    ) -> Optional[Tuple[List[DisclosureItem], int, Optional[int]]]:
+        """
+        검색 폼을 disclsstat.do로 직접 POST하여 목록 한 페이지 조회
+        
+        Args:
+            page_num: 페이지 번호 (1부터)
+            start_date: 조회 시작일
+            end_date: 조회 종료일
+            page_size: 페이지당 행 수 (currentPageSize)
+            
+        Returns:
+            (공시 항목 리스트, 데이터 행 수, 전체 건수), 응답 구조를 인식하지 못하면 None
+        """
+        form = dict(self.LIST_FORM)
+        form.update({
+            'currentPageSize': str(page_size),
+            'pageIndex': str(page_num),
+            'fromDate': start_date.strftime("%Y-%m-%d"),
+            'toDate': end_date.strftime("%Y-%m-%d"),
+        })
+        
+        try:
+            session = await self._get_http_session()
+            async with self.throttle.slot(self.LIST_SUB_URL):
+                async with session.post(self.LIST_SUB_URL, data=form) as response:
+                    if response.status != 200:
+                        log(f"  [HTTP] 목록 조회 실패: HTTP {response.status}")
+                        return None
+                    html = await response.text(errors='replace')
+        except Exception as e:
+            log(f"  [HTTP] 목록 조회 오류: {type(e).__name__}: {e}")
+            return None
+        
+        rows = parse_listing_rows(html)
+        log(f"  [HTTP] 페이지 {page_num} 행 수: {len(rows)}")
+        
+        items, recognized = self._parse_rows(rows)
+        data_rows = sum(1 for cells, _ in rows if len(cells) >= 3)
+        
+        # 데이터 행이 있는데 접수번호를 하나도 못 찾음 → 구조 변경으로 판단
+        if data_rows > 0 and recognized == 0:
+            log("  [HTTP] 목록 구조를 인식할 수 없음")
+            return None
+        
+        # 테이블 자체가 없음 → 검색 폼 파라미터 불일치 가능성
+        if not rows and '<table' not in html.lower():
+            log("  [HTTP] 응답에 목록 테이블이 없음")
+            return None
+        
+        return items, data_rows, parse_total_count(html)
+    
+    async def _iter_disclosure_pages_http(
+        self,
+        cutoff_date: datetime,
+        end_date: datetime,
+        max_pages: int,
+        watermark: Optional[str] = None,
+        start_page: int = 1
+    ) -> AsyncIterator[Tuple[int, List[DisclosureItem]]]:
+        """
+        HTTP 전용 목록 조회 (브라우저 없이 검색 폼 POST + HTML 1회 파싱)
+        
+        Args:
+            cutoff_date: 컷오프 날짜 (조회 시작일)
+            end_date: 조회 종료일
+            max_pages: 최대 크롤링 페이지 수 (마지막 페이지 번호)
+            watermark: 이미 기록한 최신 접수번호 (도달하면 종료)
+            start_page: 조회를 시작할 페이지 (체크포인트에서 이어받을 때)
+            
+        Yields:
+            (페이지 번호, 필터 후 공시 항목 리스트)
+            
+        Raises:
+            ListingUnavailable: 첫 페이지부터 응답 구조를 인식하지 못한 경우 (Playwright fallback)
+        """
+        log(f"[HTTP] 공시 목록 조회: {cutoff_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}")
+        
+        seen_acptno = set()
+        
+        page_num = max(1, start_page)
+        while page_num <= max_pages:
+            first = page_num == max(1, start_page)
+            log(f"페이지 {page_num} 파싱 중... (HTTP, {self.page_size}행)")
+            result = await self._fetch_list_page_http(page_num, cutoff_date, end_date, self.page_size)
+            
+            # 큰 페이지 크기가 거부되면 (오류/빈 응답) 기본 크기로 첫 페이지 재조회
+            # (이어받는 중이면 이미 본 행부터 다시 보도록 기본 크기 기준 페이지로 환산, 중복은 필터에서 제외)
+            if first and self.page_size > self.DEFAULT_PAGE_SIZE and (result is None or result[1] == 0):
+                log(f"  [HTTP] 페이지 크기 {self.page_size} 응답 없음, {self.DEFAULT_PAGE_SIZE}행으로 재시도")
+                page_num = (page_num - 1) * self.page_size // self.DEFAULT_PAGE_SIZE + 1
+                self.page_size = self.DEFAULT_PAGE_SIZE
+                result = await self._fetch_list_page_http(page_num, cutoff_date, end_date, self.page_size)
+            
+            if result is None:
+                # 첫 페이지부터 실패하면 fallback, 중간 실패면 수집분까지만
+                if first:
+                    raise ListingUnavailable()
+                log(f"  [HTTP] 페이지 {page_num} 조회 실패, 크롤링 종료")
+                break
+            
+            page_items, data_rows, total = result
+            log(f"  발견: {len(page_items)}건" + (f" (전체 {total}건)" if total is not None else ""))
+            
+            # 요청보다 적게 왔으면 마지막 페이지, 단 첫 페이지는 서버가 크기를 줄였을 수 있음
+            last_page = data_rows < self.page_size
+            if last_page and page_num == 1 and self.page_size > self.DEFAULT_PAGE_SIZE:
+                clamped = total > data_rows if total is not None else data_rows == self.DEFAULT_PAGE_SIZE
+                if clamped:
+                    log(f"  [HTTP] 서버 적용 페이지 크기: {data_rows}행 (요청 {self.page_size}행)")
+                    self.page_size = data_rows
+                    last_page = False
+            
+            if not page_items:
+                log("  더 이상 항목 없음, 종료")
+                self.listing_complete = True
+                break
+            
+            page_new = []
+            keep_going = self._filter_page_items(page_items, cutoff_date, seen_acptno, page_new, watermark)
+            if page_new:
+                yield page_num, page_new
+            if not keep_going:
+                break
+            
+            if last_page:
+                log("  마지막 페이지, 종료")
+                self.listing_complete = True
+                break
+            page_num += 1
+        
+        if not self.listing_complete:
+            log(f"  [WARN] 목록을 끝까지 조회하지 못함 (페이지 {page_num}까지, 최대 {max_pages}페이지)")
+    
+    async def _iter_disclosure_pages_browser(
+        self,
+        days: int,
+        period: Optional[str],
+        effective_days: int,
+        cutoff_date: datetime,
+        end_date: datetime,
+        max_pages: int,
+        watermark: Optional[str] = None,
+        start_page: int = 1
+    ) -> AsyncIterator[Tuple[int, List[DisclosureItem]]]:
+        """
+        Playwright 목록 조회 (기간 버튼/날짜 검색 후 페이지 이동)
+        
+        Args:
+            days: 조회할 기간(일)
+            period: 기간 버튼 ('1주', '1개월' 등)
+            effective_days: 컷오프 계산에 쓴 일수
+            cutoff_date: 컷오프 날짜
+            end_date: 조회 종료일
+            max_pages: 최대 크롤링 페이지 수 (마지막 페이지 번호)
+            watermark: 이미 기록한 최신 접수번호 (도달하면 종료)
+            start_page: 조회를 시작할 페이지 (체크포인트에서 이어받을 때, 이동 실패 시 1페이지부터)
+            
+        Yields:
+            (페이지 번호, 필터 후 공시 항목 리스트)
         """
-        all_items = []
+        await self._ensure_browser()
         
         # 페이지 로드
         log(f"공시 목록 페이지 로드 중...")
-        await self.page.goto(self.LIST_URL, wait_until="networkidle")
-        await asyncio.sleep(3)
+        await self.page.goto(self.LIST_URL, wait_until="domcontentloaded")
+        await self.readiness.selector(self.page, ', '.join(TABLE_ROW_SELECTORS), 'listing')
         
         # 디버그: 초기 페이지 저장
         await self._save_debug_screenshot(self.page, "01_list_initial")
         await self._save_debug_html(self.page, "01_list_initial")
         await self._save_debug_js(self.page, "01_list_initial")
         
-        # 컷오프 날짜 계산 (period 여부와 관계없이)
-        # period 사용 시에도 days 기준으로 컷오프 적용
-        end_date = datetime.now()
+        # 큰 페이지 크기를 폼에 넣어 두면 기간 버튼/검색/fnPageGo 제출에 함께 전달됨
+        if self.page_size > self.DEFAULT_PAGE_SIZE and not await self.apply_page_size(self.page_size):
+            self.page_size = self.DEFAULT_PAGE_SIZE
         
         if period:
-            # 기간 버튼에 따른 days 계산
-            period_to_days = {
-                '1주': 7,
-                '1개월': 30,
-                '3개월': 90,
-                '6개월': 180,
-                '1년': 365,
-                '2년': 730,
-                '3년': 1095,
-                '전체': 3650  # 약 10년
-            }
-            effective_days = period_to_days.get(period, days)
             log(f"기간 버튼 클릭: {period} (약 {effective_days}일)")
             await self.click_period_button(period)
-            await asyncio.sleep(2)
         else:
-            effective_days = days
             # 날짜 범위로 검색
             start_date = end_date - timedelta(days=days)
             log(f"날짜 범위 설정: {start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}")
@@ -601,278 +1250,532 @@ class KRXValueUpCrawler:
             except Exception as e:
                 log(f"날짜 설정 오류: {e}")
         
-        # 컷오프 날짜 설정 (항상 적용) - 시간 제거하여 날짜만 비교
-        cutoff_date = (end_date - timedelta(days=effective_days)).replace(hour=0, minute=0, second=0, microsecond=0)
         log(f"  컷오프 날짜: {cutoff_date.strftime('%Y-%m-%d')} 이전 공시는 제외")
         
         # 디버그: 검색 후 저장
         await self._save_debug_screenshot(self.page, "02_list_after_search")
         await self._save_debug_html(self.page, "02_list_after_search")
         
+        # 이어받는 경우 시작 페이지로 이동
+        first_page = 1
+        if start_page > 1:
+            if await self.go_to_page(start_page):
+                first_page = start_page
+            else:
+                log(f"  페이지 {start_page} 이동 실패, 1페이지부터 조회")
+        
         # 페이지별 크롤링
-        consecutive_old_count = 0  # 연속으로 오래된 공시가 나온 횟수
         seen_acptno = set()  # 이미 수집한 접수번호 (실시간 중복 방지)
         
-        for page_num in range(1, max_pages + 1):
+        for page_num in range(first_page, max_pages + 1):
             log(f"페이지 {page_num} 파싱 중...")
             
             page_items = await self.parse_current_page()
             log(f"  발견: {len(page_items)}건")
             
+            # 큰 페이지 크기에서 결과가 비면 서버가 거부한 것으로 보고 기본 크기로 다시 검색
+            if not page_items and page_num == 1 and self.page_size > self.DEFAULT_PAGE_SIZE:
+                log(f"  페이지 크기 {self.page_size} 결과 없음, {self.DEFAULT_PAGE_SIZE}행으로 재검색")
+                self.page_size = self.DEFAULT_PAGE_SIZE
+                await self.apply_page_size(self.page_size)
+                await self.click_search_button()
+                page_items = await self.parse_current_page()
+                log(f"  발견: {len(page_items)}건")
+            
             if not page_items:
                 log("  더 이상 항목 없음, 종료")
+                self.listing_complete = True
                 break
             
-            # 중복 및 날짜 필터링
-            filtered_items = []
-            old_items_in_page = 0
-            duplicate_count = 0
-            
-            for item in page_items:
-                # 중복 체크 (실시간)
-                if item.접수번호 in seen_acptno:
-                    duplicate_count += 1
-                    continue
-                
-                try:
-                    # 날짜 파싱
-                    date_str = item.공시일자.replace('.', '-').strip()
-                    if ' ' in date_str:
-                        date_str = date_str.split(' ')[0]
-                    
-                    if len(date_str) == 10:
-                        item_date = datetime.strptime(date_str, "%Y-%m-%d")
-                    elif len(date_str) == 8:
-                        item_date = datetime.strptime(date_str, "%Y%m%d")
-                    else:
-                        # 날짜 파싱 실패시 포함
-                        seen_acptno.add(item.접수번호)
-                        filtered_items.append(item)
-                        continue
-                    
-                    if item_date >= cutoff_date:
-                        seen_acptno.add(item.접수번호)
-                        filtered_items.append(item)
-                        consecutive_old_count = 0  # 리셋
-                    else:
-                        old_items_in_page += 1
-                        log(f"    [SKIP] {item.회사명} - {item.공시일자} (기간 외)")
-                        
-                except Exception as e:
-                    # 예외 발생시 포함 (안전)
-                    seen_acptno.add(item.접수번호)
-                    filtered_items.append(item)
-            
-            # 페이지 전체가 중복인 경우 → 페이지 이동 실패로 판단
-            if duplicate_count == len(page_items):
-                log(f"  [WARN] 페이지 전체가 중복 데이터, 페이지 이동 실패로 판단하여 종료")
-                break
-            
-            # 새로 추가된 항목이 0개인 경우 → 더 이상 새 데이터 없음
-            if len(filtered_items) == 0:
-                if duplicate_count > 0:
-                    log(f"  [WARN] 새로운 항목 없음 (중복 {duplicate_count}건), 페이지 이동 실패로 판단하여 종료")
-                else:
-                    log(f"  새로운 항목 없음, 크롤링 종료")
-                break
-            
-            if duplicate_count > 0:
-                log(f"  중복 건너뜀: {duplicate_count}건")
-            
-            all_items.extend(filtered_items)
-            log(f"  필터 후: {len(filtered_items)}건 추가 (제외: {old_items_in_page}건)")
-            
-            # 조기 종료 조건: 페이지의 절반 이상이 기간 외 공시인 경우
-            if old_items_in_page > len(page_items) // 2:
-                consecutive_old_count += 1
-                if consecutive_old_count >= 1:  # 한 페이지라도 절반 이상 기간 외면 종료
-                    log(f"  조회 기간 외 공시 다수 발견, 크롤링 종료")
-                    break
-            else:
-                consecutive_old_count = 0
-            
-            # 전체 페이지가 기간 외인 경우 즉시 종료
-            if len(filtered_items) == 0 and len(page_items) > 0:
-                log(f"  현재 페이지 전체가 조회 기간 외, 크롤링 종료")
+            page_new = []
+            keep_going = self._filter_page_items(page_items, cutoff_date, seen_acptno, page_new, watermark)
+            if page_new:
+                yield page_num, page_new
+            if not keep_going:
                 break
             
             # 다음 페이지로 이동
             if page_num < max_pages:
                 if not await self.go_to_page(page_num + 1):
-                    log(f"  페이지 {page_num + 1} 이동 실패, 크롤링 종료")
+                    # 페이지를 다 채우지 못했으면 마지막 페이지라 다음 페이지가 없는 것
+                    if len(page_items) < self.page_size:
+                        log("  마지막 페이지, 종료")
+                        self.listing_complete = True
+                    else:
+                        log(f"  페이지 {page_num + 1} 이동 실패, 크롤링 종료")
                     break
-                await asyncio.sleep(1)
         
+        if not self.listing_complete:
+            log(f"  [WARN] 목록을 끝까지 조회하지 못함 (최대 {max_pages}페이지)")
+    
+    async def iter_disclosure_pages(
+        self,
+        days: int = 7,
+        period: Optional[str] = None,
+        max_pages: int = 10,
+        watermark: Optional[str] = None,
+        start_page: int = 1
+    ) -> AsyncIterator[Tuple[int, List[DisclosureItem]]]:
+        """
+        공시 목록을 페이지 단위로 조회 (페이지를 파싱할 때마다 바로 반환)
+        
+        listing_mode가 'http'이면 브라우저 없이 검색 폼을 직접 POST하고,
+        응답 구조를 인식하지 못하면 Playwright 경로로 fallback
+        
+        watermark가 주어지면 그 접수번호 이하(이전 실행에서 기록 완료)를 만나는 페이지에서 종료하므로
+        매일 실행 시에는 보통 첫 페이지만 조회함
+        
+        Args:
+            days: 조회할 기간(일), 기본 7일
+            period: 기간 버튼 ('1주', '1개월' 등) - 지정시 days 무시
+            max_pages: 최대 크롤링 페이지 수
+            watermark: 이미 기록한 최신 접수번호 (None이면 기간 전체 조회)
+            start_page: 조회를 시작할 페이지 (중단된 실행을 체크포인트에서 이어받을 때)
+            
+        Yields:
+            (페이지 번호, 중복/기간/워터마크 필터 후 공시 항목 리스트)
+            
+        조회가 끝나면 listing_complete에 워터마크/컷오프 날짜/마지막 페이지 도달 여부가 남음
+        (max_pages 소진, 페이지 조회/이동 실패로 끊긴 경우 False)
+        """
+        self.listing_complete = False
+        
+        # 컷오프 날짜 계산 (period 여부와 관계없이)
+        # period 사용 시에도 days 기준으로 컷오프 적용
+        end_date = datetime.now()
+        effective_days = self.PERIOD_DAYS.get(period, days) if period else days
+        
+        # 컷오프 날짜 설정 (항상 적용) - 시간 제거하여 날짜만 비교
+        cutoff_date = (end_date - timedelta(days=effective_days)).replace(hour=0, minute=0, second=0, microsecond=0)
+        
+        if self.listing_mode == 'http':
+            try:
+                async for page in self._iter_disclosure_pages_http(
+                    cutoff_date, end_date, max_pages, watermark, start_page
+                ):
+                    yield page
+                return
+            except ListingUnavailable:
+                log("[HTTP] 목록 조회 실패, Playwright로 재시도")
+        
+        async for page in self._iter_disclosure_pages_browser(
+            days, period, effective_days, cutoff_date, end_date, max_pages, watermark, start_page
+        ):
+            yield page
+    
+    async def iter_disclosures(
+        self,
+        days: int = 7,
+        period: Optional[str] = None,
+        max_pages: int = 10,
+        watermark: Optional[str] = None
+    ) -> AsyncIterator[DisclosureItem]:
+        """
+        공시 목록을 항목 단위로 조회 (페이지를 파싱할 때마다 바로 반환)
+        
+        Args:
+            days: 조회할 기간(일), 기본 7일
+            period: 기간 버튼 ('1주', '1개월' 등) - 지정시 days 무시
+            max_pages: 최대 크롤링 페이지 수
+            watermark: 이미 기록한 최신 접수번호 (None이면 기간 전체 조회)
+            
+        Yields:
+            DisclosureItem (목록 순서)
+        """
+        async for _, page_items in self.iter_disclosure_pages(days, period, max_pages, watermark):
+            for item in page_items:
+                yield item
+    
+    async def get_disclosure_list(
+        self, 
+        days: int = 7, 
+        period: Optional[str] = None,
+        max_pages: int = 10,
+        watermark: Optional[str] = None
+    ) -> List[DisclosureItem]:
+        """
+        공시 목록 조회 (전체 페이지를 모두 조회한 뒤 반환)
+        
+        Args:
+            days: 조회할 기간(일), 기본 7일
+            period: 기간 버튼 ('1주', '1개월' 등) - 지정시 days 무시
+            max_pages: 최대 크롤링 페이지 수
+            watermark: 이미 기록한 최신 접수번호 (None이면 기간 전체 조회)
+            
+        Returns:
+            공시 항목 리스트
+        """
+        all_items = [item async for item in self.iter_disclosures(days, period, max_pages, watermark)]
         log(f"총 {len(all_items)}건 수집 완료")
         return all_items
     
-    async def download_pdf(self, acptno: str, doc_no: str = "") -> Optional[bytes]:
+    async def download_pdf(self, acptno: str, doc_no: str = "") -> Optional[DownloadedPDF]:
         """
         PDF 다운로드 - 첨부문서 PDF 우선
         
         다운로드 순서:
+        0. (pdf_resolver='http') 뷰어 HTML을 직접 받아 첨부문서 PDF 링크 추적 (브라우저 없음)
         1. 첨부문서(기타공시첨부서류)에서 PDF 링크 찾기 (기업 제출 원본 PDF)
         2. filedownload('pdf') JavaScript 호출 (본문 PDF - fallback)
         3. PDF 버튼 클릭 (본문 PDF - fallback)
         
+        1은 기업 제출 원본, 2~3은 KIND 본문 PDF로 받는 문서가 다르므로 1을 항상 먼저 시도하고,
+        2~3의 순서만 공시 유형/제출인 유형별 이전 성공률과 소요 시간으로 정함
+        (self.method_stats, 거의 성공하지 않는 방식은 생략). 결과의 출처는 DownloadedPDF.source에 기록.
+        
         Args:
             acptno: 접수번호
             doc_no: 문서번호 (사용하지 않음, 호환성 유지)
             
         Returns:
-            PDF 바이너리 데이터 또는 None
+            DownloadedPDF (임시 파일) 또는 None
         """
         log(f"  PDF 다운로드 시작: acptno={acptno}")
         
+        if self.pdf_resolver == 'http':
+            pdf = await self._download_attachment_pdf_http(acptno)
+            if pdf:
+                self.resolver_stats['http'] += 1
+                return pdf
+            log(f"    [HTTP] 첨부 PDF 확인 실패, 브라우저로 재시도")
+        
+        self.resolver_stats['browser'] += 1
         viewer_url = f"{self.VIEWER_URL}?method=search&acptno={acptno}"
         
+        await self._ensure_browser()
         page = await self.context.new_page()
+        await self.resource_policy.attach(page, ROLE_VIEWER)
         try:
-            # 1. 뷰어 페이지 열기
-            await page.goto(viewer_url, wait_until="networkidle")
-            await asyncio.sleep(5)  # iframe 로딩 대기
+            # 1. 뷰어 페이지 열기 (호스트별 동시 접속 제한 + 페이싱)
+            async with self.throttle.slot(viewer_url):
+                await page.goto(viewer_url, wait_until="domcontentloaded")
+            await self.readiness.iframe_loaded(page, 'iframe#docViewFrm', 'viewer')
             
             # 디버그: 다운로드 전 상태 저장
             await self._save_debug_screenshot(page, f"pdf_viewer_{acptno}")
             
-            # ========== 방법 1: 첨부문서에서 PDF 링크 찾기 (우선!) ==========
-            log(f"    [방법1] 첨부문서(기타공시첨부서류)에서 PDF 검색...")
-            attach_select = page.locator('select#attachedDoc')
+            # 2. 이전 실행 통계로 방식 순서 결정 (성공률/소요 시간이 좋은 방식 먼저, 거의 실패하는 방식은 생략)
+            profile = self._profiles.get(acptno, '')
+            methods = self.method_stats.plan(profile)
+            if methods != DEFAULT_METHODS:
+                log(f"    시도 순서: {' → '.join(METHOD_LABELS[m] for m in methods)} (유형: {profile or '전체'})")
+            
+            for method in methods:
+                started = time.monotonic()
+                try:
+                    pdf = await self._pdf_methods[method](page, acptno)
+                except Exception as e:
+                    log(f"    {METHOD_LABELS[method]} 실패: {e}")
+                    pdf = None
+                self.method_stats.record(method, profile, pdf is not None, time.monotonic() - started)
+                if pdf:
+                    pdf.source = METHOD_SOURCES[method]
+                    if pdf.source == SOURCE_BODY:
+                        log(f"    [NOTE] 원본 첨부 PDF 대신 {SOURCE_LABELS[SOURCE_BODY]} PDF 사용: acptno={acptno}")
+                    return pdf
+            
+            log(f"    모든 방법 실패, PDF를 찾을 수 없음")
+            await self._save_debug_screenshot(page, f"pdf_not_found_{acptno}")
+            return None
+            
+        except Exception as e:
+            log(f"  PDF 다운로드 오류: {e}")
+            import traceback
+            log(f"  {traceback.format_exc()}")
+            return None
+        finally:
+            await page.close()
+    
+    async def _pdf_by_attachment(self, page: Page, acptno: str) -> Optional[DownloadedPDF]:
+        """[방법1] 첨부문서(기타공시첨부서류)를 선택하고 iframe 내 PDF 링크로 다운로드 (기업 제출 원본 PDF)"""
+        log(f"    [방법1] 첨부문서(기타공시첨부서류)에서 PDF 검색...")
+        attach_select = page.locator('select#attachedDoc')
+        
+        if await attach_select.count() > 0:
+            options = await attach_select.locator('option').all()
+            log(f"    첨부문서 드롭다운 옵션 수: {len(options)}")
+            
+            # 옵션 목록 출력 (디버그)
+            for opt in options:
+                opt_text = await opt.text_content() or ""
+                opt_value = await opt.get_attribute('value') or ""
+                log(f"      - '{opt_text[:40]}' (value: {opt_value[:30] if opt_value else 'empty'})")
             
-            if await attach_select.count() > 0:
-                options = await attach_select.locator('option').all()
-                log(f"    첨부문서 드롭다운 옵션 수: {len(options)}")
+            # 기타공시첨부서류 또는 첨부서류가 있는 옵션 찾기
+            for option in options:
+                option_text = await option.text_content() or ""
+                option_value = await option.get_attribute('value') or ""
                 
-                # 옵션 목록 출력 (디버그)
-                for opt in options:
-                    opt_text = await opt.text_content() or ""
-                    opt_value = await opt.get_attribute('value') or ""
-                    log(f"      - '{opt_text[:40]}' (value: {opt_value[:30] if opt_value else 'empty'})")
+                # 빈 값이거나 "선택" 옵션은 건너뛰기
+                if not option_value or "선택" in option_text:
+                    continue
                 
-                # 기타공시첨부서류 또는 첨부서류가 있는 옵션 찾기
-                for option in options:
-                    option_text = await option.text_content() or ""
-                    option_value = await option.get_attribute('value') or ""
-                    
-                    # 빈 값이거나 "선택" 옵션은 건너뛰기
-                    if not option_value or "선택" in option_text:
-                        continue
-                    
-                    # 첨부서류 관련 옵션인지 확인
-                    is_attachment = any(keyword in option_text for keyword in [
-                        '첨부', '기타공시', '기타공개', '첨부서류', '첨부문서'
-                    ])
-                    
-                    if not is_attachment:
-                        log(f"    건너뜀 (첨부서류 아님): {option_text[:40]}")
-                        continue
-                    
-                    log(f"    첨부서류 선택: {option_text[:50]}...")
-                    
-                    # 옵션 선택
+                # 첨부서류 관련 옵션인지 확인
+                is_attachment = any(keyword in option_text for keyword in ATTACHMENT_KEYWORDS)
+                
+                if not is_attachment:
+                    log(f"    건너뜀 (첨부서류 아님): {option_text[:40]}")
+                    continue
+                
+                log(f"    첨부서류 선택: {option_text[:50]}...")
+                
+                # 옵션 선택 → 첨부문서가 iframe에 로드될 때까지 대기
+                async with self.readiness.iframe_navigation(page, 'attachment'):
                     await attach_select.select_option(value=option_value)
-                    await asyncio.sleep(3)  # iframe 로딩 대기
-                    
-                    # 디버그: 첨부서류 선택 후 상태 저장
-                    await self._save_debug_screenshot(page, f"pdf_attached_{acptno}")
-                    
-                    # iframe에서 PDF 링크 찾기
-                    pdf_url = await self._find_pdf_in_iframe(page)
-                    if pdf_url:
-                        log(f"    PDF URL 발견: {pdf_url[:80]}...")
-                        pdf_data = await self._download_pdf_from_url(pdf_url)
-                        if pdf_data:
-                            log(f"    첨부 PDF 다운로드 성공: {len(pdf_data):,} bytes")
-                            return pdf_data
-                        else:
-                            log(f"    첨부 PDF 다운로드 실패, 다음 방법 시도")
-                    else:
-                        log(f"    iframe에서 PDF 링크를 찾을 수 없음")
-            else:
-                log(f"    첨부문서 드롭다운(#attachedDoc)을 찾을 수 없음")
-            
-            # ========== 방법 2: filedownload('pdf') JavaScript 호출 (본문 PDF) ==========
-            log(f"    [방법2] filedownload('pdf') 시도 (본문 PDF)...")
-            try:
-                doc_no_value = await page.evaluate('''() => {
-                    const form = document.getElementById("docdownloadform");
-                    if (form) {
-                        const docNoInput = form.querySelector("#docNo, input[name='docNo']");
-                        return docNoInput ? docNoInput.value : "";
-                    }
-                    return "";
-                }''')
                 
-                if doc_no_value:
-                    log(f"    docNo 설정됨: {doc_no_value}")
-                    
-                    async with page.expect_download(timeout=30000) as download_info:
-                        await page.evaluate("filedownload('pdf')")
-                    
-                    download = await download_info.value
-                    log(f"    다운로드 파일: {download.suggested_filename}")
-                    
-                    with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp:
-                        tmp_path = tmp.name
-                    
-                    await download.save_as(tmp_path)
-                    
-                    with open(tmp_path, 'rb') as f:
-                        pdf_data = f.read()
-                    
-                    os.unlink(tmp_path)
-                    
-                    if len(pdf_data) > 1000 and pdf_data.startswith(b'%PDF'):
-                        log(f"    본문 PDF 다운로드 성공: {len(pdf_data):,} bytes")
-                        return pdf_data
+                # 디버그: 첨부서류 선택 후 상태 저장
+                await self._save_debug_screenshot(page, f"pdf_attached_{acptno}")
+                
+                # iframe에서 PDF 링크 찾기
+                pdf_url = await self._find_pdf_in_iframe(page)
+                if pdf_url:
+                    log(f"    PDF URL 발견: {pdf_url[:80]}...")
+                    pdf = await self._download_pdf_from_url(pdf_url)
+                    if pdf:
+                        log(f"    첨부 PDF 다운로드 성공: {pdf.size:,} bytes")
+                        return pdf
                     else:
-                        log(f"    filedownload 결과 유효하지 않음")
+                        log(f"    첨부 PDF 다운로드 실패, 다음 방법 시도")
                 else:
-                    log(f"    docNo가 설정되지 않음 (본문 없음)")
-                    
-            except Exception as e:
-                log(f"    filedownload 실패: {e}")
+                    log(f"    iframe에서 PDF 링크를 찾을 수 없음")
+        else:
+            log(f"    첨부문서 드롭다운(#attachedDoc)을 찾을 수 없음")
+        return None
+    
+    async def _pdf_by_filedownload(self, page: Page, acptno: str) -> Optional[DownloadedPDF]:
+        """[방법2] filedownload('pdf') JavaScript 호출 (본문 PDF)"""
+        log(f"    [방법2] filedownload('pdf') 시도 (본문 PDF)...")
+        try:
+            doc_no_value = await page.evaluate('''() => {
+                const form = document.getElementById("docdownloadform");
+                if (form) {
+                    const docNoInput = form.querySelector("#docNo, input[name='docNo']");
+                    return docNoInput ? docNoInput.value : "";
+                }
+                return "";
+            }''')
             
-            # ========== 방법 3: PDF 버튼 직접 클릭 (본문 PDF) ==========
-            log(f"    [방법3] PDF 버튼 클릭 시도 (본문 PDF)...")
-            try:
-                pdf_btn = page.locator('a:has(img[src*="btn_pdf"]), a:has(img[alt*="PDF"])').first
-                if await pdf_btn.count() > 0:
-                    async with page.expect_download(timeout=30000) as download_info:
-                        await pdf_btn.click()
-                    
-                    download = await download_info.value
-                    log(f"    다운로드 파일: {download.suggested_filename}")
-                    
-                    with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp:
-                        tmp_path = tmp.name
-                    
-                    await download.save_as(tmp_path)
-                    
-                    with open(tmp_path, 'rb') as f:
-                        pdf_data = f.read()
-                    
-                    os.unlink(tmp_path)
-                    
-                    if len(pdf_data) > 1000 and pdf_data.startswith(b'%PDF'):
-                        log(f"    본문 PDF(버튼) 다운로드 성공: {len(pdf_data):,} bytes")
-                        return pdf_data
+            if doc_no_value:
+                log(f"    docNo 설정됨: {doc_no_value}")
+                
+                async with page.expect_download(timeout=30000) as download_info:
+                    await page.evaluate("filedownload('pdf')")
+                
+                download = await download_info.value
+                log(f"    다운로드 파일: {download.suggested_filename}")
+                
+                pdf = await self.downloader.save_download(download)
+                if pdf:
+                    log(f"    본문 PDF 다운로드 성공: {pdf.size:,} bytes")
+                    return pdf
                 else:
-                    log(f"    PDF 버튼을 찾을 수 없음")
-            except Exception as e:
-                log(f"    PDF 버튼 클릭 실패: {e}")
+                    log(f"    filedownload 결과 유효하지 않음")
+            else:
+                log(f"    docNo가 설정되지 않음 (본문 없음)")
+                
+        except Exception as e:
+            log(f"    filedownload 실패: {e}")
+        return None
+    
+    async def _pdf_by_button(self, page: Page, acptno: str) -> Optional[DownloadedPDF]:
+        """[방법3] PDF 버튼 직접 클릭 (본문 PDF)"""
+        log(f"    [방법3] PDF 버튼 클릭 시도 (본문 PDF)...")
+        try:
+            pdf_btn = page.locator('a:has(img[src*="btn_pdf"]), a:has(img[alt*="PDF"])').first
+            if await pdf_btn.count() > 0:
+                async with page.expect_download(timeout=30000) as download_info:
+                    await pdf_btn.click()
+                
+                download = await download_info.value
+                log(f"    다운로드 파일: {download.suggested_filename}")
+                
+                pdf = await self.downloader.save_download(download)
+                if pdf:
+                    log(f"    본문 PDF(버튼) 다운로드 성공: {pdf.size:,} bytes")
+                    return pdf
+            else:
+                log(f"    PDF 버튼을 찾을 수 없음")
+        except Exception as e:
+            log(f"    PDF 버튼 클릭 실패: {e}")
+        return None
+    
+    async def _http_get_text(self, url: str) -> Optional[str]:
+        """
+        KIND 페이지 HTTP GET (공유 세션 + 호스트별 속도 제어)
+        
+        Args:
+            url: 요청 URL
             
-            log(f"    모든 방법 실패, PDF를 찾을 수 없음")
-            await self._save_debug_screenshot(page, f"pdf_not_found_{acptno}")
+        Returns:
+            응답 본문, 실패 시 None
+        """
+        try:
+            session = await self._get_http_session()
+            async with self.throttle.slot(url):
+                async with session.get(url) as response:
+                    if response.status != 200:
+                        log(f"    [HTTP] 요청 실패: HTTP {response.status} ({url[:80]})")
+                        return None
+                    return await response.text(errors='replace')
+        except Exception as e:
+            log(f"    [HTTP] 요청 오류: {type(e).__name__}: {e}")
             return None
+    
+    async def _download_attachment_pdf_http(self, acptno: str) -> Optional[DownloadedPDF]:
+        """
+        브라우저 없이 첨부문서 PDF 다운로드
+        
+        뷰어 HTML → select#attachedDoc 옵션 → searchContents(문서 경로) → 첨부문서 HTML → PDF 링크
+        
+        Args:
+            acptno: 접수번호
             
-        except Exception as e:
-            log(f"  PDF 다운로드 오류: {e}")
-            import traceback
-            log(f"  {traceback.format_exc()}")
+        Returns:
+            DownloadedPDF, 구조를 인식하지 못하거나 첨부 PDF가 없으면 None
+        """
+        viewer_html = await self._http_get_text(f"{self.VIEWER_URL}?method=search&acptno={acptno}")
+        if not viewer_html:
             return None
+        
+        options = parse_attached_options(viewer_html)
+        if options is None:
+            log(f"    [HTTP] 첨부문서 드롭다운을 찾을 수 없음")
+            return None
+        
+        for option_value, option_text in options:
+            if not option_value or "선택" in option_text:
+                continue
+            if not any(keyword in option_text for keyword in ATTACHMENT_KEYWORDS):
+                continue
+            
+            # 옵션 value 형식: "문서번호|구분" 또는 "문서번호"
+            doc_no = option_value.split('|')[0]
+            log(f"    [HTTP] 첨부서류: {option_text[:50]} (docNo={doc_no})")
+            
+            contents = await self._http_get_text(f"{self.VIEWER_URL}?method=searchContents&docNo={doc_no}")
+            document_url = find_document_url(contents or '', self.BASE_URL)
+            if not document_url:
+                log(f"    [HTTP] 첨부문서 경로를 찾을 수 없음")
+                continue
+            
+            pdf_url = document_url
+            if '.pdf' not in document_url.lower():
+                document_html = await self._http_get_text(document_url)
+                pdf_url = find_pdf_link(document_html or '', document_url)
+                if not pdf_url:
+                    log(f"    [HTTP] 첨부문서에 PDF 링크 없음: {document_url[:80]}")
+                    continue
+            
+            log(f"    [HTTP] PDF URL 발견: {pdf_url[:80]}...")
+            pdf = await self._download_pdf_from_url(pdf_url)
+            if pdf:
+                log(f"    [HTTP] 첨부 PDF 다운로드 성공: {pdf.size:,} bytes")
+                pdf.source = SOURCE_ATTACHMENT
+                return pdf
+        
+        return None
+    
+    async def iter_pdf_downloads(
+        self,
+        acptnos: Union[List[str], AsyncIterable[str]],
+        concurrency: int = 3,
+        lookup: Optional[Callable[[str], Optional[DownloadedPDF]]] = None
+    ) -> AsyncIterator[PDFDownloadResult]:
+        """
+        PDF 동시 다운로드 (공유 브라우저 컨텍스트에서 뷰어 페이지 N개 병렬)
+        
+        완료되는 순서대로 결과를 반환하므로 호출 측에서 저장/업로드를 바로 진행할 수 있음.
+        acptnos에 비동기 iterable(목록 조회 스트림 등)을 넘기면 접수번호가 들어오는 대로 다운로드를 시작하고,
+        입력 쪽에서 난 예외는 진행 중인 다운로드를 모두 반환한 뒤 다시 발생시킴.
+        서버 부하는 self.throttle(호스트별 동시 접속 제한 + 토큰 버킷)로 제어.
+        
+        Args:
+            acptnos: 접수번호 리스트 또는 비동기 iterable
+            concurrency: 동시에 열 뷰어 페이지 수
+            lookup: 다운로드 전에 확인할 PDF 조회 함수 (캐시 등, 있으면 다운로드 생략)
+                    해시 검증 등 블로킹 작업이므로 스레드에서 호출됨 (스레드 안전해야 함)
+            
+        Yields:
+            PDFDownloadResult (완료 순서)
+        """
+        if isinstance(acptnos, list):
+            if not acptnos:
+                return
+            worker_count = max(1, min(concurrency, len(acptnos)))
+            log(f"  PDF 다운로드 풀 시작: {len(acptnos)}건, 동시 {worker_count}개 "
+                f"(호스트당 {self.throttle.max_per_host}개, 초당 {self.throttle.requests_per_second}회)")
+        else:
+            worker_count = max(1, concurrency)
+            log(f"  PDF 다운로드 풀 시작: 목록 조회와 동시 진행, 동시 {worker_count}개 "
+                f"(호스트당 {self.throttle.max_per_host}개, 초당 {self.throttle.requests_per_second}회)")
+        
+        queue: asyncio.Queue = asyncio.Queue()
+        results: asyncio.Queue = asyncio.Queue()
+        source_errors: List[BaseException] = []
+        
+        async def feed():
+            try:
+                if isinstance(acptnos, list):
+                    for acptno in acptnos:
+                        queue.put_nowait(acptno)
+                else:
+                    async for acptno in acptnos:
+                        await queue.put(acptno)
+            except Exception as e:
+                source_errors.append(e)
+            finally:
+                for _ in range(worker_count):
+                    queue.put_nowait(None)
+        
+        async def worker():
+            while True:
+                acptno = await queue.get()
+                if acptno is None:
+                    await results.put(None)
+                    return
+                
+                started = time.monotonic()
+                error = ""
+                cached = None
+                try:
+                    # 캐시 파일 해시 검증/SQLite 기록 동안 다른 다운로드와 스로틀 대기가 멈추지 않도록 스레드에서
+                    cached = await asyncio.to_thread(lookup, acptno) if lookup else None
+                    pdf = cached or await self.download_pdf(acptno)
+                    if not pdf:
+                        error = "PDF를 찾을 수 없음"
+                except Exception as e:
+                    pdf = None
+                    error = str(e)
+                
+                await results.put(PDFDownloadResult(
+                    접수번호=acptno,
+                    pdf=pdf,
+                    elapsed=time.monotonic() - started,
+                    error=error,
+                    cached=cached is not None
+                ))
+        
+        # 워커들이 동시에 브라우저를 띄우지 않도록 먼저 시작 (HTTP 탐색 모드는 fallback 시에만 시작)
+        if self.pdf_resolver != 'http':
+            await self._ensure_browser()
+        
+        tasks = [asyncio.create_task(feed())] + [asyncio.create_task(worker()) for _ in range(worker_count)]
+        
+        try:
+            finished = 0
+            while finished < worker_count:
+                result = await results.get()
+                if result is None:
+                    finished += 1
+                    continue
+                yield result
         finally:
-            await page.close()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        if source_errors:
+            raise source_errors[0]
     
     async def _find_pdf_in_iframe(self, page: Page) -> Optional[str]:
         """iframe 내부에서 PDF 링크 찾기"""
@@ -970,68 +1873,46 @@ class KRXValueUpCrawler:
             log(f"    {traceback.format_exc()}")
             return None
     
-    async def _download_pdf_from_url(self, pdf_url: str) -> Optional[bytes]:
-        """URL에서 PDF 다운로드 (aiohttp 사용)"""
+    async def _download_pdf_from_url(self, pdf_url: str) -> Optional[DownloadedPDF]:
+        """URL에서 PDF 스트리밍 다운로드 (크롤러 공유 aiohttp 세션 사용)"""
+        headers = {
+            'Referer': 'https://kind.krx.co.kr/',
+            'Accept': 'application/pdf,*/*',
+        }
+        
         try:
-            import aiohttp
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Referer': 'https://kind.krx.co.kr/',
-                'Accept': 'application/pdf,*/*',
-            }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(pdf_url, headers=headers, timeout=aiohttp.ClientTimeout(total=60)) as response:
-                    if response.status == 200:
-                        pdf_data = await response.read()
-                        
-                        # PDF 유효성 검사
-                        if len(pdf_data) < 1000:
-                            log(f"    PDF가 너무 작음: {len(pdf_data)} bytes")
-                            return None
-                        
-                        if not pdf_data.startswith(b'%PDF'):
-                            log(f"    유효하지 않은 PDF 형식 (헤더: {pdf_data[:20]})")
-                            return None
-                        
-                        log(f"    PDF 다운로드 완료: {len(pdf_data)} bytes")
-                        return pdf_data
-                    else:
-                        log(f"    PDF 다운로드 실패: HTTP {response.status}")
-                        return None
-                        
+            session = await self._get_http_session()
         except ImportError:
             log(f"    aiohttp 없음, requests 사용...")
             return await self._download_pdf_with_requests(pdf_url)
+        
+        try:
+            async with self.throttle.slot(pdf_url):
+                pdf = await self.downloader.fetch(session, pdf_url, headers=headers, timeout=60)
+            if pdf:
+                log(f"    PDF 다운로드 완료: {pdf.size} bytes")
+            return pdf
         except Exception as e:
             log(f"    PDF URL 다운로드 오류: {e}")
             return None
     
-    async def _download_pdf_with_requests(self, pdf_url: str) -> Optional[bytes]:
-        """requests로 PDF 다운로드 (fallback)"""
+    async def _download_pdf_with_requests(self, pdf_url: str) -> Optional[DownloadedPDF]:
+        """requests로 PDF 다운로드 (fallback, 이벤트 루프를 막지 않도록 스레드에서 실행)"""
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Referer': 'https://kind.krx.co.kr/',
+        }
+        
         try:
-            import requests
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                'Referer': 'https://kind.krx.co.kr/',
-            }
-            
-            response = requests.get(pdf_url, headers=headers, timeout=60)
-            if response.status_code == 200:
-                pdf_data = response.content
-                
-                if len(pdf_data) > 1000 and pdf_data.startswith(b'%PDF'):
-                    log(f"    PDF 다운로드 완료 (requests): {len(pdf_data)} bytes")
-                    return pdf_data
-            
-            return None
+            async with self.throttle.slot(pdf_url):
+                pdf = await asyncio.to_thread(self.downloader.fetch_blocking, pdf_url, headers, 60)
+            if pdf:
+                log(f"    PDF 다운로드 완료 (requests): {pdf.size} bytes")
+            return pdf
         except Exception as e:
             log(f"    requests 다운로드 오류: {e}")
             return None
 
-
 async def main():
     """테스트용 메인 함수"""
     debug_dir = os.environ.get('VALUEUP_DEBUG_DIR', '/tmp/krx_debug')
@@ -1049,9 +1930,9 @@ async def main():
         if items:
             log(f"\n=== PDF 다운로드 테스트 ===")
             test_item = items[0]
-            pdf_data = await crawler.download_pdf(test_item.접수번호)
-            if pdf_data:
-                log(f"PDF 다운로드 성공: {len(pdf_data)} bytes")
+            pdf = await crawler.download_pdf(test_item.접수번호)
+            if pdf:
+                log(f"PDF 다운로드 성공: {pdf.size} bytes ({pdf.path})")
             else:
                 log("PDF 다운로드 실패")
         
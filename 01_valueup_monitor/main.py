@@ -11,16 +11,20 @@ import sys
 import json
 import re
 from dataclasses import asdict
-from typing import Optional
+from typing import AsyncIterable, AsyncIterator, Dict, List, Optional, Tuple, Union
 from datetime import datetime, timedelta
 
 # stdout 버퍼링 해제 (GitHub Actions에서 실시간 출력)
 sys.stdout.reconfigure(line_buffering=True)
 
-from krx_valueup_crawler import KRXValueUpCrawler, DisclosureItem
-from gsheet_manager import GSheetManager
-from gdrive_uploader import GDriveUploader
+from krx_valueup_crawler import KRXValueUpCrawler, DisclosureItem, PDFDownloadResult
+from gsheet_manager import GSheetManager, SheetWritePlan
+from state_store import normalize_acptno
+from gdrive_uploader import GDriveUploader, PDFUpload
 from stock_code_mapper import StockCodeMapper
+from pdf_cache import PDFCache, drive_file_id
+from checkpoint import RunCheckpoint
+from method_stats import SOURCE_BODY, SOURCE_LABELS
 
 
 def log(message: str):
@@ -55,7 +59,10 @@ class ValueUpMonitor:
         days: int = 7,
         period: str = None,
         max_pages: int = 10,
-        skip_pdf: bool = False
+        skip_pdf: bool = False,
+        download_concurrency: int = 3,
+        use_watermark: bool = True,
+        resume: bool = False
     ):
         """
         초기화
@@ -68,6 +75,9 @@ class ValueUpMonitor:
             period: 기간 버튼 ('1주', '1개월', '3개월', '6개월', '1년', '전체')
             max_pages: 최대 크롤링 페이지 수
             skip_pdf: PDF 다운로드 건너뛰기
+            download_concurrency: 동시에 열 PDF 뷰어 페이지 수
+            use_watermark: 조회 범위별 워터마크 사용 여부 (False면 기간 전체 재조회)
+            resume: 같은 조회 범위의 중단된 실행을 체크포인트에서 이어받을지 여부
         """
         self.credentials_json = credentials_json or os.environ.get('GOOGLE_SERVICE')
         self.spreadsheet_id = spreadsheet_id or os.environ.get('VALUEUP_GSPREAD_ID')
@@ -75,6 +85,10 @@ class ValueUpMonitor:
         self.period = period
         self.max_pages = max_pages
         self.skip_pdf = skip_pdf
+        self.download_concurrency = max(1, download_concurrency)
+        self.use_watermark = use_watermark
+        self.resume = resume
+        self.checkpoint: Optional[RunCheckpoint] = None  # run()에서 조회 범위별로 생성
         
         # period에 따른 effective_days 계산
         if period:
@@ -110,30 +124,247 @@ class ValueUpMonitor:
         # PDF 저장 폴더 생성
         os.makedirs(self.PDF_OUTPUT_DIR, exist_ok=True)
         
+        # PDF 로컬 캐시 (분석기와 공유, 재실행 시 KIND 재다운로드 방지)
+        self.pdf_cache = None
+        try:
+            self.pdf_cache = PDFCache()
+        except Exception as e:
+            log(f"PDF 캐시 사용 불가: {e}")
+        
         # GitHub Actions 환경변수
         self.github_run_id = os.environ.get('GITHUB_RUN_ID', '')
         self.github_repository = os.environ.get('GITHUB_REPOSITORY', '')
     
-    def _generate_artifact_info(self, filename: str) -> str:
+    def _generate_artifact_info(self, filename: str, source: str = '') -> str:
         """
         GitHub Actions 아티팩트 정보 생성
         
         Args:
             filename: PDF 파일명
+            source: PDF 출처 ('attachment': 기업 제출 원본, 'body': KIND 본문, 모르면 빈 값)
             
         Returns:
             아티팩트 정보 문자열 (다음 Action에서 조회 가능)
         """
         # 아티팩트 폴더/파일 경로
-        artifact_path = f"Archive_pdf/{filename}"
+        artifact_info = f"Archive_pdf/{filename}"
         
         # GitHub Actions 환경인 경우 실행 정보 포함
         if self.github_run_id and self.github_repository:
             # 아티팩트 다운로드 URL (Actions 페이지)
             actions_url = f"https://github.com/{self.github_repository}/actions/runs/{self.github_run_id}"
-            return f"{artifact_path}|run_id:{self.github_run_id}"
+            artifact_info += f"|run_id:{self.github_run_id}"
+        
+        # 원본 첨부인지 KIND 본문인지 링크마다 남김 (파일 경로|run_id 뒤에 붙이므로 기존 파서와 호환)
+        if source:
+            artifact_info += f"|source:{source}"
+        
+        return artifact_info
+    
+    async def _iter_pdfs(
+        self,
+        crawler: KRXValueUpCrawler,
+        acptnos: Union[List[str], AsyncIterable[str]]
+    ) -> AsyncIterator[PDFDownloadResult]:
+        """
+        PDF 조회 (로컬 캐시 우선, 없으면 KIND 다운로드)
+        
+        Args:
+            crawler: 크롤러
+            acptnos: 접수번호 리스트 또는 비동기 iterable (목록 조회 스트림)
+            
+        Yields:
+            PDFDownloadResult (완료 순)
+        """
+        lookup = None
+        if self.pdf_cache:
+            lookup = lambda acptno: self.pdf_cache.get_file(acptno=acptno)
+        
+        hits = 0
+        async for download in crawler.iter_pdf_downloads(
+            acptnos,
+            concurrency=self.download_concurrency,
+            lookup=lookup
+        ):
+            if download.cached:
+                hits += 1
+            elif download.pdf and self.pdf_cache:
+                await asyncio.to_thread(self.pdf_cache.put_file, download.pdf, acptno=download.접수번호)
+            yield download
+        
+        if hits:
+            log(f"  → PDF 캐시 적중: {hits}건 (다운로드 생략)")
+    
+    def _stage_upload_links(
+        self,
+        plan: SheetWritePlan,
+        uploads: List[Tuple[PDFUpload, str]],
+        drive_links: Dict[str, str],
+        result: dict
+    ):
+        """
+        업로드 결과를 링크 업데이트로 예약
+        
+        Args:
+            plan: 시트 쓰기 계획
+            uploads: [(PDFUpload, sha256), ...]
+            drive_links: {접수번호: Drive 링크}
+            result: 실행 결과 딕셔너리 (갱신됨)
+        """
+        link_updates = []
+        for upload, digest in uploads:
+            gdrive_link = drive_links.get(upload.acptno)
+            if gdrive_link:
+                log(f"      → Drive 업로드: {upload.filename} → {gdrive_link}")
+                # 분석기가 Drive 파일 ID로 캐시를 찾을 수 있도록 인덱스 추가
+                if self.pdf_cache:
+                    self.pdf_cache.link(digest, acptno=upload.acptno, drive_id=drive_file_id(gdrive_link))
+            
+            # 아티팩트 링크 정보 생성 + 링크 업데이트 예약 (시트 기록은 5단계에서 일괄)
+            links = {
+                '접수번호': upload.acptno,
+                '구글드라이브링크': gdrive_link or f"[로컬저장] {upload.filename}",
+                '아티팩트링크': self._generate_artifact_info(upload.filename, upload.source)
+            }
+            link_updates.append(links)
+            
+            # 중단되면 다음 --resume 실행에서 이 PDF는 건너뛰고 링크만 다시 예약
+            if self.checkpoint:
+                self.checkpoint.pdf_done(upload.acptno, links)
         
-        return artifact_path
+        result['pdf_uploaded'] += len(drive_links)
+        plan.stage_links(link_updates)
+    
+    async def _upload_batch(
+        self,
+        plan: SheetWritePlan,
+        uploads: List[Tuple[PDFUpload, str]],
+        result: dict,
+        previous: Optional[asyncio.Task] = None
+    ):
+        """
+        로컬 저장된 PDF 묶음을 Drive에 업로드하고 링크 예약 (직전 묶음이 끝난 뒤 실행)
+        
+        Args:
+            plan: 시트 쓰기 계획
+            uploads: [(PDFUpload, sha256), ...]
+            result: 실행 결과 딕셔너리 (갱신됨)
+            previous: 직전 업로드 묶음 태스크 (Drive 폴더 생성이 겹치지 않도록 순서대로)
+        """
+        if previous is not None:
+            await previous
+        
+        drive_links = {}
+        if self.drive_ready:
+            log(f"  → Google Drive 업로드: {len(uploads)}건...")
+            try:
+                # 동기 API이므로 스레드에서 실행, 내부에서 업로드 병렬 + 권한 배치 설정
+                drive_links = await asyncio.to_thread(
+                    self.drive_uploader.upload_pdfs,
+                    [upload for upload, _ in uploads]
+                )
+            except Exception as e:
+                result['errors'].append(f"Drive 업로드 오류: {e}")
+                log(f"      → Drive 업로드 오류: {e}")
+        
+        self._stage_upload_links(plan, uploads, drive_links, result)
+    
+    async def _process_pdfs(
+        self,
+        crawler: KRXValueUpCrawler,
+        acptnos: Union[List[str], AsyncIterable[str]],
+        pending_by_acptno: Dict[str, Dict],
+        plan: SheetWritePlan,
+        result: dict
+    ):
+        """
+        PDF 다운로드 → 로컬 저장 → Drive 업로드 → 링크 예약 (완료되는 대로 진행)
+        
+        업로드는 Drive 동시 업로드 수만큼 모이면 바로 시작하므로 다운로드와 겹쳐서 진행됨
+        
+        Args:
+            crawler: 크롤러
+            acptnos: 처리할 접수번호 (목록 조회 스트림이면 들어오는 대로 다운로드)
+            pending_by_acptno: 접수번호 → 시트 항목 (스트림이 접수번호를 넘기기 전에 채움)
+            plan: 시트 쓰기 계획
+            result: 실행 결과 딕셔너리 (갱신됨)
+        """
+        latencies = []
+        done_count = 0
+        batch: List[Tuple[PDFUpload, str]] = []  # 업로드 대기 중인 로컬 저장 PDF
+        upload_chain = None                       # 마지막으로 시작한 업로드 묶음
+        batch_size = max(1, self.drive_uploader.upload_workers)
+        
+        try:
+            async for download in self._iter_pdfs(crawler, acptnos):
+                done_count += 1
+                acptno = download.접수번호
+                item = pending_by_acptno[acptno]
+                company = item.get('회사명', '')
+                date_str = item.get('공시일자', '').replace('-', '').replace(' ', '_').replace(':', '')
+                latencies.append(download.elapsed)
+                
+                log(f"  [{done_count}/{len(pending_by_acptno)}] {company} ({acptno}) - {download.elapsed:.1f}초")
+                
+                # 공시 날짜 파싱 (월별 폴더용)
+                disclosure_date = None
+                try:
+                    date_part = date_str[:8]  # YYYYMMDD
+                    if len(date_part) == 8:
+                        disclosure_date = datetime.strptime(date_part, "%Y%m%d")
+                except:
+                    pass
+                
+                try:
+                    pdf = download.pdf
+                    
+                    if pdf:
+                        # 파일명 생성: 공시일자_회사명_접수번호.pdf
+                        safe_company = re.sub(r'[^\w가-힣]', '', company)
+                        filename = f"{date_str[:8]}_{safe_company}_{acptno}.pdf"
+                        filepath = os.path.join(self.PDF_OUTPUT_DIR, filename)
+                        
+                        # 1) 로컬에 PDF 저장 (항상, 임시 파일은 이동/캐시 파일은 복사)
+                        await asyncio.to_thread(pdf.save_to, filepath)
+                        result['pdf_downloaded'] += 1
+                        source_label = SOURCE_LABELS.get(pdf.source, '캐시')
+                        log(f"      → 로컬 저장: {filename} ({pdf.size:,} bytes, {source_label})")
+                        if pdf.source == SOURCE_BODY:
+                            result['pdf_body_fallback'] += 1
+                        
+                        # 2) Drive 업로드 대기열 (동시 업로드 수만큼 모이면 바로 업로드 시작)
+                        batch.append((
+                            PDFUpload(acptno=acptno, filename=filename, file_path=filepath,
+                                      date=disclosure_date, sha256=pdf.sha256, source=pdf.source),
+                            pdf.sha256
+                        ))
+                        if len(batch) >= batch_size:
+                            upload_chain = asyncio.create_task(self._upload_batch(plan, batch, result, upload_chain))
+                            batch = []
+                        
+                    else:
+                        result['errors'].append(f"PDF 다운로드 실패: {acptno}")
+                        log(f"      → PDF 다운로드 실패 ({download.error})")
+                        
+                except Exception as e:
+                    error_msg = f"{acptno}: {str(e)}"
+                    result['errors'].append(error_msg)
+                    log(f"      → 오류: {e}")
+        finally:
+            # 남은 PDF 업로드 (중간에 실패해도 로컬 저장된 PDF는 업로드 후 링크 예약)
+            if batch:
+                upload_chain = asyncio.create_task(self._upload_batch(plan, batch, result, upload_chain))
+            if upload_chain is not None:
+                await upload_chain
+        
+        if not pending_by_acptno:
+            log("  → 처리할 항목이 없습니다.")
+        
+        if latencies:
+            result['pdf_latency_avg'] = sum(latencies) / len(latencies)
+            result['pdf_latency_max'] = max(latencies)
+            log(f"  → 건당 다운로드 소요: 평균 {result['pdf_latency_avg']:.1f}초, "
+                f"최대 {result['pdf_latency_max']:.1f}초 (동시 {self.download_concurrency}개)")
     
     async def run(self) -> dict:
         """
@@ -147,6 +378,9 @@ class ValueUpMonitor:
             'new_added': 0,
             'pdf_downloaded': 0,
             'pdf_uploaded': 0,
+            'pdf_body_fallback': 0,
+            'pdf_latency_avg': 0.0,
+            'pdf_latency_max': 0.0,
             'errors': []
         }
         
@@ -169,6 +403,8 @@ class ValueUpMonitor:
             log(f"조회 기간: 최근 {self.days}일")
         log(f"최대 페이지: {self.max_pages}")
         log(f"PDF 다운로드: {'건너뜀' if self.skip_pdf else '활성화'}")
+        if not self.skip_pdf:
+            log(f"PDF 동시 다운로드: {self.download_concurrency}개")
         
         if not self.sheet_ready:
             log("[오류] Google Sheets에 연결할 수 없습니다.")
@@ -182,156 +418,201 @@ class ValueUpMonitor:
         else:
             log(f"[1단계] KRX에서 최근 {self.days}일간 공시 목록 조회 중...")
         
-        async with KRXValueUpCrawler(headless=True) as crawler:
-            try:
-                items = await crawler.get_disclosure_list(
-                    days=self.days,
-                    period=self.period,
-                    max_pages=self.max_pages
-                )
-                result['total_found'] = len(items)
-                log(f"  → 총 {len(items)}건의 공시 발견")
-                
-                if not items:
-                    log("  → 새로운 공시가 없습니다.")
-                    return result
-                
-                # 2. 종목코드 채우기 (비어있는 경우)
-                log("[2단계] 종목코드 조회 중...")
-                stock_mapper = StockCodeMapper()
+        # 조회 범위별 워터마크 (이전 실행에서 시트 기록까지 완료한 최신 접수번호)
+        state_store = self.sheet_manager.state_store
+        watermark_scope = f"period:{self.period}" if self.period else f"days:{self.days}"
+        
+        # 중단된 실행 이어받기 (같은 조회 범위의 체크포인트)
+        self.checkpoint = RunCheckpoint(watermark_scope)
+        resumed = self.resume and self.checkpoint.load()
+        if self.resume and not resumed:
+            log("  → 이어받을 체크포인트 없음, 처음부터 조회")
+        
+        watermark = None
+        if resumed:
+            # 처음 실행과 같은 워터마크로 조회 (워터마크는 시트 기록까지 끝나야 전진하므로 보통 그대로임)
+            watermark = self.checkpoint.watermark
+            log(f"  → 체크포인트에서 이어받음: {self.checkpoint.summary()}")
+        elif self.use_watermark and state_store:
+            mark = state_store.get_watermark(watermark_scope)
+            if mark:
+                watermark = mark['acptno']
+                log(f"  → 워터마크: {watermark} ({mark['disclosed_at']}) 이후 공시만 조회")
+        
+        # 시트 1회 읽기 → 추가/링크는 예약 후 마지막에 batchUpdate 1회로 기록
+        plan = self.sheet_manager.begin_plan()
+        if plan is None:
+            log("[오류] Google Sheets 시트를 읽을 수 없습니다.")
+            result['errors'].append("Google Sheets 읽기 실패")
+            return result
+        
+        if not resumed:
+            self.checkpoint.start(watermark)
+        
+        items: List[DisclosureItem] = []            # 이번 실행에서 수집한 공시
+        pending_by_acptno: Dict[str, Dict] = {}     # 접수번호 → 시트 항목 (PDF 처리 대상, 들어온 순서)
+        processed = self.checkpoint.processed       # 이전 실행에서 PDF 처리를 마친 접수번호 → 링크 (이어받은 경우)
+        newest = None                               # 시트 기록 후 워터마크로 남길 최신 공시
+        listing_complete = False                    # 목록이 워터마크/컷오프/마지막 페이지까지 도달했는지 (워터마크 전진 조건)
+        completed = False                           # 목록 조회와 PDF 처리를 끝까지 마쳤는지 (체크포인트 삭제 조건)
+        stock_mapper = None
+        
+        # 기존 행 중 구글드라이브링크가 없는 항목 (이번 목록에 다시 나오면 재시도, 시트 재조회 없음)
+        existing_pending: Dict[str, Dict] = {}
+        if not self.skip_pdf:
+            for record in plan.items_without_gdrive_link():
+                # 접수번호 비교 시 문자열로 정규화 (시트에서 숫자로 저장된 경우 대비)
+                acptno = normalize_acptno(record.get('접수번호', ''))
+                if acptno:
+                    existing_pending[acptno] = record
+        
+        # 워터마크로 목록을 일부만 조회한 경우, 기간 내 기존 항목도 재시도 대상에 포함
+        window_start = None
+        if watermark:
+            window_start = (datetime.now() - timedelta(days=self.days)).strftime("%Y%m%d")
+        
+        async def stage_page(page_items: List[DisclosureItem]) -> List[str]:
+            """목록 한 페이지의 2~3단계를 진행하고 PDF 처리 대상 접수번호 반환"""
+            nonlocal stock_mapper
+            items.extend(page_items)
+            result['total_found'] = len(items)
+            
+            # 2. 종목코드 채우기 (비어있는 경우)
+            #    매퍼 생성/조회는 블로킹 I/O라 스레드에서 실행 (그동안 PDF 다운로드는 계속 진행)
+            missing = [item.회사명 for item in page_items if not item.종목코드]
+            if missing:
+                if stock_mapper is None:
+                    log("[2단계] 종목코드 조회 중...")
+                    stock_mapper = await asyncio.to_thread(StockCodeMapper)
+                codes = await asyncio.to_thread(stock_mapper.get_code_bulk, missing)
                 
-                for item in items:
+                for item in page_items:
                     if not item.종목코드:
-                        code = stock_mapper.get_code(item.회사명)
+                        code = codes.get(item.회사명)
                         if code:
                             item.종목코드 = code
                             log(f"  → {item.회사명} → {code}")
                         else:
                             log(f"  → {item.회사명} → (종목코드 없음)")
+            
+            # 3. 새 항목 추가 예약 (시트 기록은 5단계에서 일괄)
+            new_items = plan.stage_append([asdict(item) for item in page_items])
+            result['new_added'] += len(new_items)
+            
+            if self.skip_pdf:
+                return []
+            
+            # 4. 새 항목 + 이번 목록에 다시 나온 미처리 항목은 바로 다운로드 대기열로
+            #    (이전 실행에서 처리를 마친 항목은 제외, 링크는 체크포인트에서 다시 예약)
+            queued = []
+            new_records = {str(d['접수번호']).strip(): d for d in new_items}
+            for item in page_items:
+                acptno = str(item.접수번호).strip()
+                if acptno in processed:
+                    continue
+                record = new_records.get(acptno) or existing_pending.get(acptno)
+                if record and acptno not in pending_by_acptno:
+                    pending_by_acptno[acptno] = record
+                    queued.append(acptno)
+            return queued
+        
+        async def listing_stream() -> AsyncIterator[str]:
+            """목록을 페이지 단위로 받아 2~3단계를 진행하고, PDF 처리 대상 접수번호를 바로 넘김"""
+            nonlocal newest, listing_complete
+            
+            start_page = 1
+            restored_acptnos = set()
+            if resumed:
+                # 이전 실행에서 수집한 항목과 처리한 PDF 링크를 다시 예약 (이미 시트에 기록된 행은 제외됨)
+                restored = [DisclosureItem(**d) for d in self.checkpoint.items]
+                log(f"  → 체크포인트 항목 {len(restored)}건, PDF 처리 완료 {len(processed)}건 다시 예약")
+                restored_acptnos = {item.접수번호 for item in restored}
+                queued = await stage_page(restored) if restored else []
+                plan.stage_links([{'접수번호': acptno, **links} for acptno, links in processed.items()])
+                for acptno in queued:
+                    yield acptno
                 
-                # 3. Google Sheets에 새 항목 추가
-                log("[3단계] Google Sheets에 공시 목록 기록 중...")
-                
-                disclosures = [asdict(item) for item in items]
-                new_items = self.sheet_manager.append_disclosures(disclosures)
-                new_count = len(new_items)
-                result['new_added'] = new_count
-                log(f"  → {new_count}건의 새로운 공시 추가됨")
-                
-                if new_count == 0:
-                    log("  → 모든 공시가 이미 기록되어 있습니다.")
-                
-                # 4. PDF 다운로드 및 저장/업로드
-                if self.skip_pdf:
-                    log("[4단계] PDF 다운로드 건너뜀 (--skip-pdf 옵션)")
-                else:
-                    log("[4단계] PDF 다운로드 및 저장 중...")
-                    
-                    # 이번 크롤링에서 수집한 접수번호 집합 (문자열)
-                    crawled_acptno_set = {str(item.접수번호).strip() for item in items}
-                    
-                    # 구글드라이브링크가 없는 항목 조회 (새 항목 + 기존 실패 항목)
-                    all_pending = self.sheet_manager.get_items_without_gdrive_link()
-                    
-                    # 이번 크롤링 범위 내 항목만 필터링
-                    # 접수번호 비교 시 문자열로 정규화 (시트에서 숫자로 저장된 경우 대비)
-                    pending_items = []
-                    for item in all_pending:
-                        sheet_acptno = item.get('접수번호', '')
-                        # 숫자인 경우 정수로 변환 후 문자열로 (지수 표기 방지)
-                        if isinstance(sheet_acptno, (int, float)):
-                            sheet_acptno = str(int(sheet_acptno))
-                        else:
-                            sheet_acptno = str(sheet_acptno).strip()
-                        
-                        if sheet_acptno in crawled_acptno_set:
-                            pending_items.append(item)
-                    
-                    skipped = len(all_pending) - len(pending_items)
-                    log(f"  → 처리 대상: {len(pending_items)}건 (범위 외 {skipped}건 제외)")
-                    
-                    if not pending_items:
-                        log("  → 처리할 항목이 없습니다.")
-                    
-                    # 링크 업데이트 정보 수집 (배치용)
-                    link_updates = []
-                    
-                    for idx, item in enumerate(pending_items, 1):
-                        acptno = item.get('접수번호', '')
-                        company = item.get('회사명', '')
-                        date_str = item.get('공시일자', '').replace('-', '').replace(' ', '_').replace(':', '')
-                        
-                        log(f"  [{idx}/{len(pending_items)}] {company} ({acptno})...")
-                        
-                        # 공시 날짜 파싱 (월별 폴더용)
-                        disclosure_date = None
-                        try:
-                            date_part = date_str[:8]  # YYYYMMDD
-                            if len(date_part) == 8:
-                                disclosure_date = datetime.strptime(date_part, "%Y%m%d")
-                        except:
+                # 같은 페이지 크기로 마지막 페이지 다음부터 조회
+                start_page = self.checkpoint.page + 1
+                if self.checkpoint.page_size:
+                    crawler.page_size = self.checkpoint.page_size
+            
+            if resumed and self.checkpoint.listing_done:
+                listing_complete = True
+            else:
+                async for page_num, page_items in crawler.iter_disclosure_pages(
+                    days=self.days,
+                    period=self.period,
+                    max_pages=self.max_pages,
+                    watermark=watermark,
+                    start_page=start_page
+                ):
+                    # 그사이 새 공시가 올라와 페이지 경계가 밀리면 이어받은 항목이 다시 나올 수 있음
+                    page_items = [item for item in page_items if item.접수번호 not in restored_acptnos]
+                    log(f"  → 페이지 {page_num}: {len(page_items)}건 (누적 {len(items) + len(page_items)}건)")
+                    queued = await stage_page(page_items) if page_items else []
+                    self.checkpoint.page_done(page_num, [asdict(item) for item in page_items], crawler.page_size)
+                    for acptno in queued:
+                        yield acptno
+                # max_pages 소진이나 페이지 조회 실패로 끊긴 경우는 체크포인트에 남겨 --resume으로 이어서 조회
+                listing_complete = crawler.listing_complete
+                if listing_complete:
+                    self.checkpoint.finish_listing()
+            
+            # 목록이 워터마크/컷오프/마지막 페이지까지 도달한 경우에만 워터마크 전진
+            # (중간에 끊긴 경우 이전 워터마크를 유지해야 끊긴 지점 이후 공시를 다음 실행에서 다시 조회)
+            if items and listing_complete:
+                newest = max(items, key=lambda item: int(item.접수번호) if item.접수번호.isdigit() else 0)
+            elif items:
+                log("  → 목록을 끝까지 조회하지 못해 워터마크를 유지합니다 (--resume으로 이어서 조회 가능)")
+            
+            if self.skip_pdf or not window_start:
+                return
+            for acptno, record in existing_pending.items():
+                if acptno in pending_by_acptno or acptno in processed:
+                    continue
+                if re.sub(r'\D', '', str(record.get('공시일자', '')))[:8] >= window_start:
+                    pending_by_acptno[acptno] = record
+                    crawler.note_disclosure(acptno, str(record.get('공시제목', '')), str(record.get('회사명', '')))
+                    yield acptno
+        
+        try:
+            async with KRXValueUpCrawler(headless=True) as crawler:
+                try:
+                    # 목록 조회와 PDF 다운로드/업로드를 동시에 진행 (페이지가 파싱되는 대로 다운로드 시작)
+                    if self.skip_pdf:
+                        async for _ in listing_stream():
                             pass
-                        
-                        try:
-                            # PDF 다운로드
-                            pdf_data = await crawler.download_pdf(acptno)
-                            
-                            if pdf_data:
-                                # 파일명 생성: 공시일자_회사명_접수번호.pdf
-                                safe_company = re.sub(r'[^\w가-힣]', '', company)
-                                filename = f"{date_str[:8]}_{safe_company}_{acptno}.pdf"
-                                filepath = os.path.join(self.PDF_OUTPUT_DIR, filename)
-                                
-                                # 1) 로컬에 PDF 저장 (항상)
-                                with open(filepath, 'wb') as f:
-                                    f.write(pdf_data)
-                                result['pdf_downloaded'] += 1
-                                log(f"      → 로컬 저장: {filename} ({len(pdf_data):,} bytes)")
-                                
-                                # 2) Google Drive 업로드 (가능한 경우)
-                                gdrive_link = None
-                                if self.drive_ready:
-                                    gdrive_link = self.drive_uploader.upload_pdf(
-                                        pdf_data, 
-                                        filename,
-                                        use_monthly_folder=True,
-                                        date=disclosure_date
-                                    )
-                                    if gdrive_link:
-                                        result['pdf_uploaded'] += 1
-                                        log(f"      → Drive 업로드: {gdrive_link}")
-                                
-                                # 3) 아티팩트 링크 정보 생성
-                                artifact_info = self._generate_artifact_info(filename)
-                                
-                                # 링크 업데이트 정보 수집 (나중에 배치로 업데이트)
-                                link_updates.append({
-                                    '접수번호': acptno,
-                                    '구글드라이브링크': gdrive_link or f"[로컬저장] {filename}",
-                                    '아티팩트링크': artifact_info
-                                })
-                                
-                            else:
-                                result['errors'].append(f"PDF 다운로드 실패: {acptno}")
-                                log(f"      → PDF 다운로드 실패")
-                                
-                        except Exception as e:
-                            error_msg = f"{acptno}: {str(e)}"
-                            result['errors'].append(error_msg)
-                            log(f"      → 오류: {e}")
-                        
-                        # 요청 간 딜레이
-                        await asyncio.sleep(2)
+                        log("[4단계] PDF 다운로드 건너뜀 (--skip-pdf 옵션)")
+                    else:
+                        log("[4단계] PDF 다운로드 및 저장 (목록 조회와 동시 진행)...")
+                        await self._process_pdfs(crawler, listing_stream(), pending_by_acptno, plan, result)
+                    completed = listing_complete
                     
-                    # 5. 시트에 링크 배치 업데이트 (1회 API 호출)
-                    if link_updates:
-                        log("[5단계] 시트에 링크 정보 배치 업데이트...")
-                        updated = self.sheet_manager.batch_update_links(link_updates)
-                        log(f"  → {updated}건 업데이트 완료")
-                
-            except Exception as e:
-                result['errors'].append(f"크롤링 오류: {str(e)}")
-                log(f"오류 발생: {e}")
+                    log(f"  → 총 {len(items)}건의 공시 발견, {result['new_added']}건 추가 예정, "
+                        f"PDF 처리 대상 {len(pending_by_acptno)}건")
+                    if not items:
+                        log("  → 새로운 공시가 없습니다.")
+                    elif result['new_added'] == 0:
+                        log("  → 모든 공시가 이미 기록되어 있습니다.")
+                    
+                except Exception as e:
+                    result['errors'].append(f"크롤링 오류: {str(e)}")
+                    log(f"오류 발생: {e}")
+        finally:
+            # 5. 예약된 행 추가 + 링크 업데이트를 한 번에 기록 (중간에 실패해도 수집분은 기록)
+            log("[5단계] Google Sheets에 일괄 기록 중...")
+            if plan.commit():
+                if newest and state_store:
+                    state_store.set_watermark(watermark_scope, newest.접수번호, newest.공시일자)
+                # 끝까지 마치고 시트 기록까지 성공하면 더 이어받을 것이 없음
+                if completed:
+                    self.checkpoint.clear()
+            else:
+                result['errors'].append(f"시트 기록 실패: {plan.error}")
+                result['new_added'] = 0
+            # 진행 기록을 스냅샷에 합쳐 둠 (삭제된 경우 아무것도 하지 않음)
+            self.checkpoint.close()
         
         # 결과 출력
         log("=" * 60)
@@ -341,7 +622,15 @@ class ValueUpMonitor:
         log(f"  새로 추가됨: {result['new_added']}건")
         log(f"  PDF 로컬 저장: {result['pdf_downloaded']}건")
         log(f"  PDF Drive 업로드: {result['pdf_uploaded']}건")
+        if result['pdf_body_fallback']:
+            log(f"  원본 첨부 대신 KIND 본문 PDF: {result['pdf_body_fallback']}건 (아티팩트링크에 source:body로 표시)")
         log(f"  저장 위치: {self.PDF_OUTPUT_DIR}/")
+        if self.pdf_cache:
+            log(f"  PDF 캐시: {self.pdf_cache.summary()}")
+        if self.drive_uploader.index:
+            log(f"  Drive 인덱스: {self.drive_uploader.index.summary()}")
+        if self.checkpoint and self.checkpoint.data:
+            log(f"  체크포인트: {self.checkpoint.summary()} (--resume으로 이어서 실행)")
         if result['errors']:
             log(f"  오류: {len(result['errors'])}건")
             for err in result['errors']:
@@ -372,6 +661,15 @@ def parse_args():
   
   # 목록만 수집 (PDF 다운로드 건너뜀)
   python main.py --period 1년 --skip-pdf
+  
+  # PDF 동시 다운로드 5개 (백필용)
+  python main.py --period 3개월 --concurrency 5
+  
+  # 워터마크 무시하고 기간 전체 재조회
+  python main.py --days 30 --ignore-watermark
+  
+  # 중단된 전체 기간 백필 이어서 실행
+  python main.py --period 전체 --max-pages 50 --resume
         """
     )
     
@@ -404,6 +702,27 @@ def parse_args():
         help='PDF 다운로드 건너뛰기'
     )
     
+    parser.add_argument(
+        '--concurrency', '-c',
+        type=int,
+        default=int(os.environ.get('VALUEUP_DOWNLOAD_CONCURRENCY', '3')),
+        help='동시 PDF 다운로드 수, 기본값: 3'
+    )
+    
+    parser.add_argument(
+        '--ignore-watermark',
+        action='store_true',
+        default=os.environ.get('VALUEUP_IGNORE_WATERMARK', '').lower() == 'true',
+        help='이전 실행의 워터마크를 무시하고 기간 전체 조회'
+    )
+    
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        default=os.environ.get('VALUEUP_RESUME', '').lower() == 'true',
+        help='같은 조회 범위의 중단된 실행을 체크포인트에서 이어서 진행'
+    )
+    
     return parser.parse_args()
 
 
@@ -433,7 +752,10 @@ async def main():
         days=args.days,
         period=args.period,
         max_pages=args.max_pages,
-        skip_pdf=args.skip_pdf
+        skip_pdf=args.skip_pdf,
+        download_concurrency=args.concurrency,
+        use_watermark=not args.ignore_watermark,
+        resume=args.resume
     )
     result = await monitor.run()
     
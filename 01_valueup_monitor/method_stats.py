@@ -0,0 +1,292 @@
+"""
+PDF 확보 방식별 성공률 통계 (JSON 파일)
+뷰어 페이지에서 PDF를 얻는 방식(첨부문서 선택, filedownload('pdf'), PDF 버튼 클릭)의
+성공/실패와 소요 시간을 공시 유형 × 제출인 유형별로 기록하여,
+다음 실행부터 성공 가능성 대비 비용이 가장 좋은 방식을 먼저 시도하고 거의 성공하지 않는 방식은 건너뜀
+
+- 유형 키: "공시 유형|제출인 유형" (예: "계획|금융", "이행현황(정정)|일반"), 제목을 모르면 전체 통계만 사용
+- 출처: 첨부문서는 기업이 제출한 원본 PDF, filedownload/PDF 버튼은 KIND가 만든 본문 PDF로 결과물이 다름
+  → 원본(첨부문서)을 항상 먼저 시도하고, 순서 조정은 같은 출처의 방식끼리만 함
+- 순서: 같은 출처 안에서 성공률 / 평균 소요 시간이 큰 방식부터 (성공률은 전체 통계를 사전값으로 평활)
+- 건너뛰기: 시도 횟수가 충분한데 성공률이 기준 미만이면 제외, 단 일정 횟수 건너뛸 때마다 1회 다시 시도
+- 오래된 기록이 새 결과를 가리지 않도록 시도 횟수가 상한을 넘으면 절반으로 축소
+
+파일 형식 (JSON):
+    {
+      "profiles": {
+        "*": {"attachment": {"tries": 40, "ok": 37, "seconds": 92.1, "skipped": 0}, ...},   # 전체
+        "계획|일반": {...}
+      }
+    }
+
+환경변수:
+- VALUEUP_METHOD_STATS: 통계 파일 경로 (기본: .valueup_state/pdf_method_stats.json)
+- VALUEUP_METHOD_MIN_TRIALS: 건너뛰기 판단에 필요한 최소 시도 횟수 (기본: 10)
+- VALUEUP_METHOD_SKIP_RATE: 이 성공률 미만이면 건너뜀 (기본: 0.05)
+- VALUEUP_METHOD_EXPLORE_EVERY: 건너뛴 방식을 다시 시도하는 주기 (기본: 20회 건너뛸 때마다)
+"""
+
+import json
+import os
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from state_store import STATE_DIR
+
+# 뷰어 페이지 PDF 확보 방식 (기본 시도 순서)
+METHOD_ATTACHMENT = 'attachment'      # 첨부문서(기타공시첨부서류) 선택 → iframe 내 PDF 링크
+METHOD_FILEDOWNLOAD = 'filedownload'  # filedownload('pdf') JavaScript 호출 (본문 PDF)
+METHOD_BUTTON = 'button'              # PDF 버튼 클릭 (본문 PDF)
+DEFAULT_METHODS = [METHOD_ATTACHMENT, METHOD_FILEDOWNLOAD, METHOD_BUTTON]
+
+METHOD_LABELS = {
+    METHOD_ATTACHMENT: '첨부문서',
+    METHOD_FILEDOWNLOAD: 'filedownload',
+    METHOD_BUTTON: 'PDF 버튼',
+}
+
+# PDF 출처 (방식마다 받는 문서가 다르므로 출처 순서는 고정)
+SOURCE_ATTACHMENT = 'attachment'  # 기업이 제출한 원본 첨부 PDF
+SOURCE_BODY = 'body'              # KIND가 공시 본문으로 만든 PDF
+SOURCE_ORDER = [SOURCE_ATTACHMENT, SOURCE_BODY]
+SOURCE_LABELS = {
+    SOURCE_ATTACHMENT: '원본 첨부',
+    SOURCE_BODY: 'KIND 본문',
+}
+METHOD_SOURCES = {
+    METHOD_ATTACHMENT: SOURCE_ATTACHMENT,
+    METHOD_FILEDOWNLOAD: SOURCE_BODY,
+    METHOD_BUTTON: SOURCE_BODY,
+}
+
+GLOBAL_PROFILE = '*'
+PRIOR_WEIGHT = 2.0       # 유형별 성공률에 섞는 전체 성공률의 가중치 (가상 시도 횟수)
+DEFAULT_SECONDS = 5.0    # 기록이 없을 때 가정하는 1회 평균 소요 시간
+MAX_TRIES = 200          # 이 횟수를 넘으면 기록을 절반으로 축소 (최근 결과 반영)
+
+# 제출인 유형 (회사명 키워드, 앞에서부터 판정)
+SUBMITTER_PATTERNS = [
+    ('리츠', ('리츠', '부동산투자회사')),
+    ('금융', ('금융', '은행', '증권', '보험', '생명', '화재', '캐피탈', '카드')),
+    ('지주', ('지주', '홀딩스')),
+]
+
+
+def log(message: str):
+    """타임스탬프와 함께 로그 출력"""
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    print(f"[{timestamp}] {message}", flush=True)
+
+
+def disclosure_profile(title: str, company: str = '') -> str:
+    """
+    공시 제목과 회사명으로 통계 유형 키 생성
+
+    Args:
+        title: 공시제목
+        company: 회사명 (제출인)
+
+    Returns:
+        "공시 유형|제출인 유형" (제목이 없으면 빈 문자열 → 전체 통계만 사용)
+    """
+    title = (title or '').replace(' ', '')
+    if not title:
+        return ''
+
+    kind = '이행현황' if '이행' in title else '계획'
+    if '정정' in title:
+        kind += '(정정)'
+
+    submitter = '일반'
+    name = (company or '').replace(' ', '')
+    for label, keywords in SUBMITTER_PATTERNS:
+        if any(keyword in name for keyword in keywords):
+            submitter = label
+            break
+
+    return f"{kind}|{submitter}"
+
+
+def _entry() -> Dict:
+    return {'tries': 0, 'ok': 0, 'seconds': 0.0, 'skipped': 0}
+
+
+class MethodStats:
+    """PDF 확보 방식별 성공률/소요 시간 기록 및 시도 순서 결정"""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        min_trials: Optional[int] = None,
+        skip_rate: Optional[float] = None,
+        explore_every: Optional[int] = None
+    ):
+        """
+        초기화 (파일이 있으면 읽음)
+
+        Args:
+            path: 통계 파일 경로 (기본: VALUEUP_METHOD_STATS 또는 .valueup_state/pdf_method_stats.json)
+            min_trials: 건너뛰기 판단에 필요한 최소 시도 횟수 (기본: VALUEUP_METHOD_MIN_TRIALS 또는 10)
+            skip_rate: 건너뛰기 기준 성공률 (기본: VALUEUP_METHOD_SKIP_RATE 또는 0.05)
+            explore_every: 건너뛴 방식을 다시 시도하는 주기 (기본: VALUEUP_METHOD_EXPLORE_EVERY 또는 20)
+        """
+        self.path = path or os.environ.get('VALUEUP_METHOD_STATS') or os.path.join(STATE_DIR, 'pdf_method_stats.json')
+        if min_trials is None:
+            min_trials = int(os.environ.get('VALUEUP_METHOD_MIN_TRIALS', '10'))
+        if skip_rate is None:
+            skip_rate = float(os.environ.get('VALUEUP_METHOD_SKIP_RATE', '0.05'))
+        if explore_every is None:
+            explore_every = int(os.environ.get('VALUEUP_METHOD_EXPLORE_EVERY', '20'))
+        self.min_trials = min_trials
+        self.skip_rate = skip_rate
+        self.explore_every = max(1, explore_every)
+
+        self.profiles: Dict[str, Dict[str, Dict]] = self._load()
+        self._dirty = False
+
+        # 이번 실행 통계 (방식별)
+        self.run: Dict[str, Dict] = defaultdict(_entry)
+
+    def _load(self) -> Dict[str, Dict[str, Dict]]:
+        """통계 파일 읽기 (없거나 손상되면 빈 통계)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        profiles = data.get('profiles') if isinstance(data, dict) else None
+        if not isinstance(profiles, dict):
+            return {}
+        return {
+            profile: {method: {**_entry(), **entry} for method, entry in methods.items() if isinstance(entry, dict)}
+            for profile, methods in profiles.items() if isinstance(methods, dict)
+        }
+
+    def save(self):
+        """변경이 있으면 통계 파일 저장 (임시 파일 → 교체)"""
+        if not self._dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'profiles': self.profiles}, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(temp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            log(f"  [WARN] PDF 확보 방식 통계 저장 실패: {e}")
+
+    def _get(self, profile: str, method: str) -> Dict:
+        return self.profiles.setdefault(profile, {}).setdefault(method, _entry())
+
+    def _rate(self, profile: str, method: str) -> float:
+        """유형별 성공률 (전체 성공률을 사전값으로 평활)"""
+        overall = self._get(GLOBAL_PROFILE, method)
+        prior = (overall['ok'] + 1) / (overall['tries'] + 2)
+        if not profile:
+            return prior
+        entry = self._get(profile, method)
+        return (entry['ok'] + PRIOR_WEIGHT * prior) / (entry['tries'] + PRIOR_WEIGHT)
+
+    def _seconds(self, method: str) -> float:
+        """1회 평균 소요 시간 (전체 기준)"""
+        overall = self._get(GLOBAL_PROFILE, method)
+        if not overall['tries']:
+            return DEFAULT_SECONDS
+        return max(0.1, overall['seconds'] / overall['tries'])
+
+    def _evidence(self, profile: str, method: str) -> Dict:
+        """건너뛰기 판단 기준 기록 (유형별 시도가 충분하면 유형별, 아니면 전체)"""
+        if profile:
+            entry = self._get(profile, method)
+            if entry['tries'] >= self.min_trials:
+                return entry
+        return self._get(GLOBAL_PROFILE, method)
+
+    def plan(self, profile: str = '', methods: Optional[List[str]] = None) -> List[str]:
+        """
+        이번 공시에서 시도할 방식과 순서 결정
+
+        출처 순서(원본 첨부 → KIND 본문)는 고정하고, 같은 출처 안에서만
+        성공률 / 평균 소요 시간이 큰 방식부터 시도 (기대 소요 시간 최소화).
+        시도가 충분한데 성공률이 기준 미만인 방식은 제외하되,
+        explore_every번 건너뛸 때마다 같은 출처의 마지막 순서로 1회 다시 시도.
+
+        Args:
+            profile: disclosure_profile() 유형 키
+            methods: 후보 방식 (기본 순서, 기본: DEFAULT_METHODS)
+
+        Returns:
+            시도할 방식 리스트 (순서대로)
+        """
+        methods = list(methods or DEFAULT_METHODS)
+
+        planned = []
+        for source in SOURCE_ORDER:
+            group = sorted(
+                (m for m in methods if METHOD_SOURCES[m] == source),
+                key=lambda m: -self._rate(profile, m) / self._seconds(m)
+            )
+            explore = []
+            for method in group:
+                evidence = self._evidence(profile, method)
+                if evidence['tries'] >= self.min_trials and evidence['ok'] / evidence['tries'] < self.skip_rate:
+                    evidence['skipped'] += 1
+                    self.run[method]['skipped'] += 1
+                    self._dirty = True
+                    if evidence['skipped'] % self.explore_every == 0:
+                        explore.append(method)
+                    continue
+                planned.append(method)
+            planned.extend(explore)
+
+        # 모든 방식이 제외되면 원본 첨부 방식부터 1개는 시도
+        return planned or methods[:1]
+
+    def record(self, method: str, profile: str, ok: bool, seconds: float):
+        """
+        시도 결과 기록
+
+        Args:
+            method: 방식
+            profile: disclosure_profile() 유형 키
+            ok: 성공 여부
+            seconds: 소요 시간
+        """
+        targets = [GLOBAL_PROFILE] + ([profile] if profile else [])
+        for target in targets:
+            entry = self._get(target, method)
+            entry['tries'] += 1
+            entry['ok'] += int(ok)
+            entry['seconds'] += seconds
+            if entry['tries'] > MAX_TRIES:
+                entry['tries'] //= 2
+                entry['ok'] //= 2
+                entry['seconds'] /= 2
+                entry['skipped'] = 0
+
+        current = self.run[method]
+        current['tries'] += 1
+        current['ok'] += int(ok)
+        current['seconds'] += seconds
+        self._dirty = True
+
+    def summary(self) -> str:
+        """이번 실행의 방식별 성공률/소요 시간 요약 문자열"""
+        parts = []
+        for method in DEFAULT_METHODS:
+            current = self.run.get(method)
+            if not current:
+                continue
+            label = METHOD_LABELS[method]
+            if current['tries']:
+                rate = current['ok'] / current['tries'] * 100
+                part = (f"{label} {current['ok']}/{current['tries']}회 성공({rate:.0f}%) "
+                        f"총 {current['seconds']:.1f}초")
+            else:
+                part = f"{label} 시도 없음"
+            if current['skipped']:
+                part += f" (건너뜀 {current['skipped']}회)"
+            parts.append(part)
+        return ', '.join(parts) or '-'
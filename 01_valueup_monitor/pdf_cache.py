@@ -0,0 +1,353 @@
+"""
+PDF 로컬 캐시 (내용 주소 기반)
+모니터(KIND 다운로드)와 분석기(Drive 다운로드)가 공유하는 디스크 캐시
+
+구조:
+- objects/ab/<sha256>.pdf : PDF 본문 (같은 내용은 한 번만 저장)
+- index.sqlite3           : 접수번호/Drive 파일 ID → SHA-256, 파일별 크기·최근 사용 시각
+- 전체 크기가 상한을 넘으면 최근 사용 시각이 오래된 순으로 삭제 (LRU)
+
+사용법:
+    cache = PDFCache()
+    pdf_bytes = cache.get(acptno='20251226000082')
+    if pdf_bytes is None:
+        pdf_bytes = download(...)
+        cache.put(pdf_bytes, acptno='20251226000082')
+
+    # 파일 기반 (다운로드 결과를 메모리에 올리지 않음)
+    pdf = cache.get_file(acptno='20251226000082')   # DownloadedPDF 또는 None
+    cache.put_file(downloaded_pdf, acptno='20251226000082')
+"""
+
+import hashlib
+import os
+import re
+import shutil
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from functools import wraps
+from typing import Optional
+
+from pdf_downloader import CHUNK_SIZE, DownloadedPDF
+from state_store import STATE_DIR, normalize_acptno
+
+
+def log(message: str):
+    """타임스탬프와 함께 로그 출력"""
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    print(f"[{timestamp}] {message}", flush=True)
+
+
+def drive_file_id(gdrive_url: str) -> str:
+    """Google Drive 링크에서 파일 ID 추출 (없으면 빈 문자열)"""
+    if not gdrive_url:
+        return ''
+    match = re.search(r'/d/([a-zA-Z0-9_-]+)', gdrive_url) or re.search(r'id=([a-zA-Z0-9_-]+)', gdrive_url)
+    return match.group(1) if match else ''
+
+
+def _locked(method):
+    """인스턴스 락을 잡고 실행 (분석기에서 스레드로 호출되는 경우 대비)"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class PDFCache:
+    """SHA-256 내용 주소 기반 PDF 디스크 캐시 (크기 상한 LRU)"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS blobs (
+            digest TEXT PRIMARY KEY,
+            size INTEGER NOT NULL,
+            last_access REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_blobs_access ON blobs (last_access);
+        CREATE TABLE IF NOT EXISTS aliases (
+            key TEXT PRIMARY KEY,
+            digest TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_aliases_digest ON aliases (digest);
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_mb: Optional[float] = None):
+        """
+        초기화
+
+        Args:
+            cache_dir: 캐시 디렉토리 (기본: VALUEUP_PDF_CACHE_DIR 또는 .valueup_state/pdf_cache)
+            max_mb: 최대 캐시 크기 MB (기본: VALUEUP_PDF_CACHE_MAX_MB 또는 1024)
+        """
+        self.cache_dir = cache_dir or os.environ.get('VALUEUP_PDF_CACHE_DIR') or os.path.join(STATE_DIR, 'pdf_cache')
+        if max_mb is None:
+            max_mb = float(os.environ.get('VALUEUP_PDF_CACHE_MAX_MB', '1024'))
+        self.max_bytes = int(max_mb * 1024 * 1024)
+
+        os.makedirs(os.path.join(self.cache_dir, 'objects'), exist_ok=True)
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(os.path.join(self.cache_dir, 'index.sqlite3'), check_same_thread=False)
+        self.conn.executescript(self.SCHEMA)
+        self.conn.commit()
+
+        self.hits = 0
+        self.misses = 0
+
+    def close(self):
+        """연결 종료"""
+        self.conn.close()
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.cache_dir, 'objects', digest[:2], f"{digest}.pdf")
+
+    def _alias_keys(self, acptno: Optional[str], drive_id: Optional[str]) -> list:
+        keys = []
+        acptno = normalize_acptno(acptno)
+        if acptno:
+            keys.append(f"acptno:{acptno}")
+        if drive_id:
+            keys.append(f"drive:{drive_id}")
+        return keys
+
+    @_locked
+    def lookup(self, acptno: Optional[str] = None, drive_id: Optional[str] = None) -> Optional[str]:
+        """
+        접수번호 또는 Drive 파일 ID로 SHA-256 조회
+
+        Returns:
+            SHA-256 hex 문자열 또는 None
+        """
+        for key in self._alias_keys(acptno, drive_id):
+            row = self.conn.execute("SELECT digest FROM aliases WHERE key = ?", (key,)).fetchone()
+            if row:
+                return row[0]
+        return None
+
+    @_locked
+    def get(self, acptno: Optional[str] = None, drive_id: Optional[str] = None) -> Optional[bytes]:
+        """
+        캐시된 PDF 조회
+
+        Args:
+            acptno: 접수번호
+            drive_id: Google Drive 파일 ID
+
+        Returns:
+            PDF 바이트 또는 None (캐시 미스)
+        """
+        digest = self.lookup(acptno, drive_id)
+        data = self.read(digest) if digest else None
+        if data is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        # 다른 키로 찾은 경우에도 양쪽 인덱스를 채워둠
+        self.link(digest, acptno=acptno, drive_id=drive_id)
+        return data
+
+    @_locked
+    def get_file(self, acptno: Optional[str] = None, drive_id: Optional[str] = None) -> Optional[DownloadedPDF]:
+        """
+        캐시된 PDF를 파일로 조회 (내용을 메모리에 올리지 않고 청크 단위로 검증)
+
+        Args:
+            acptno: 접수번호
+            drive_id: Google Drive 파일 ID
+
+        Returns:
+            DownloadedPDF (owned=False, 캐시 원본 경로) 또는 None
+        """
+        digest = self.lookup(acptno, drive_id)
+        pdf = self._verify_file(digest) if digest else None
+        if pdf is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        with self.conn:
+            self.conn.execute("UPDATE blobs SET last_access = ? WHERE digest = ?", (time.time(), digest))
+        self.link(digest, acptno=acptno, drive_id=drive_id)
+        return pdf
+
+    def _verify_file(self, digest: str) -> Optional[DownloadedPDF]:
+        """캐시 파일을 청크 단위로 해시 검증 (손상/누락 시 파일과 인덱스 제거)"""
+        path = self._object_path(digest)
+        hasher = hashlib.sha256()
+        size = 0
+        try:
+            with open(path, 'rb') as f:
+                while chunk := f.read(CHUNK_SIZE):
+                    hasher.update(chunk)
+                    size += len(chunk)
+        except OSError:
+            self._forget(digest)
+            return None
+
+        if hasher.hexdigest() != digest:
+            log(f"  [WARN] PDF 캐시 손상, 삭제: {digest[:12]}")
+            self._forget(digest)
+            return None
+
+        return DownloadedPDF(path=path, sha256=digest, size=size, owned=False)
+
+    @_locked
+    def read(self, digest: str) -> Optional[bytes]:
+        """
+        SHA-256으로 PDF 읽기 (내용 검증 포함)
+
+        Returns:
+            PDF 바이트 또는 None
+        """
+        path = self._object_path(digest)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            self._forget(digest)
+            return None
+
+        if hashlib.sha256(data).hexdigest() != digest:
+            log(f"  [WARN] PDF 캐시 손상, 삭제: {digest[:12]}")
+            self._forget(digest)
+            return None
+
+        with self.conn:
+            self.conn.execute("UPDATE blobs SET last_access = ? WHERE digest = ?", (time.time(), digest))
+        return data
+
+    @_locked
+    def put(self, pdf_bytes: bytes, acptno: Optional[str] = None, drive_id: Optional[str] = None) -> str:
+        """
+        PDF 저장 (같은 내용이 이미 있으면 인덱스만 추가)
+
+        Args:
+            pdf_bytes: PDF 바이트
+            acptno: 접수번호
+            drive_id: Google Drive 파일 ID
+
+        Returns:
+            SHA-256 hex 문자열
+        """
+        digest = hashlib.sha256(pdf_bytes).hexdigest()
+        path = self._object_path(digest)
+
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(pdf_bytes)
+            os.replace(temp_path, path)
+
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO blobs (digest, size, last_access) VALUES (?, ?, ?)",
+                (digest, len(pdf_bytes), time.time())
+            )
+        self.link(digest, acptno=acptno, drive_id=drive_id)
+        self.evict()
+        return digest
+
+    @_locked
+    def put_file(self, pdf: DownloadedPDF, acptno: Optional[str] = None, drive_id: Optional[str] = None) -> str:
+        """
+        다운로드된 PDF 파일 저장 (이미 계산된 SHA-256 사용, 가능하면 하드링크)
+
+        Args:
+            pdf: 다운로드된 PDF
+            acptno: 접수번호
+            drive_id: Google Drive 파일 ID
+
+        Returns:
+            SHA-256 hex 문자열
+        """
+        path = self._object_path(pdf.sha256)
+
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            try:
+                os.link(pdf.path, temp_path)
+            except OSError:
+                shutil.copyfile(pdf.path, temp_path)
+            os.replace(temp_path, path)
+
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO blobs (digest, size, last_access) VALUES (?, ?, ?)",
+                (pdf.sha256, pdf.size, time.time())
+            )
+        self.link(pdf.sha256, acptno=acptno, drive_id=drive_id)
+        self.evict()
+        return pdf.sha256
+
+    @_locked
+    def link(self, digest: str, acptno: Optional[str] = None, drive_id: Optional[str] = None):
+        """
+        기존 PDF에 접수번호/Drive 파일 ID 인덱스 추가
+
+        Args:
+            digest: SHA-256
+            acptno: 접수번호
+            drive_id: Google Drive 파일 ID
+        """
+        keys = self._alias_keys(acptno, drive_id)
+        if not keys:
+            return
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO aliases (key, digest) VALUES (?, ?)",
+                [(key, digest) for key in keys]
+            )
+
+    def _forget(self, digest: str):
+        """
+        객체 파일 삭제 후 인덱스에서 제거
+
+        손상된 파일이 남아 있으면 같은 PDF를 다시 받아도 put/put_file이 기존 파일을 보고
+        쓰기를 건너뛰어 손상된 파일이 다시 인덱싱되므로, 파일부터 지움
+        """
+        try:
+            os.remove(self._object_path(digest))
+        except OSError:
+            pass
+        with self.conn:
+            self.conn.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+            self.conn.execute("DELETE FROM aliases WHERE digest = ?", (digest,))
+
+    @_locked
+    def total_size(self) -> int:
+        """캐시된 PDF 전체 크기 (bytes)"""
+        return self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+
+    @_locked
+    def evict(self) -> int:
+        """
+        크기 상한을 넘으면 최근 사용 시각이 오래된 PDF부터 삭제
+
+        Returns:
+            삭제된 PDF 수
+        """
+        total = self.total_size()
+        if total <= self.max_bytes:
+            return 0
+
+        removed = 0
+        cur = self.conn.execute("SELECT digest, size FROM blobs ORDER BY last_access")
+        for digest, size in cur.fetchall():
+            if total <= self.max_bytes:
+                break
+            self._forget(digest)
+            total -= size
+            removed += 1
+
+        if removed:
+            log(f"  PDF 캐시 정리: {removed}건 삭제 (현재 {total / 1024 / 1024:.1f}MB)")
+        return removed
+
+    def summary(self) -> str:
+        """적중률 요약 문자열"""
+        return f"적중 {self.hits}건, 미스 {self.misses}건, 크기 {self.total_size() / 1024 / 1024:.1f}MB"
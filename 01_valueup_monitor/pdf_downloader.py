@@ -0,0 +1,278 @@
+"""
+PDF 스트리밍 다운로드 모듈
+응답 본문을 청크 단위로 파일에 바로 쓰면서 %PDF 헤더 검증, SHA-256, 크기를 함께 계산
+
+- 전체 PDF를 메모리에 올리지 않음 (결과는 파일 경로 + 해시 + 크기)
+- 세션은 호출 측(크롤러)의 keep-alive 세션을 재사용
+- 헤더가 %PDF가 아니면 (HTML 오류 페이지 등) 첫 청크에서 바로 중단
+
+사용법:
+    downloader = PDFDownloader()
+    pdf = await downloader.fetch(session, url)
+    if pdf:
+        pdf.save_to('downloads/a.pdf')
+
+환경변수:
+- VALUEUP_DOWNLOAD_DIR: 다운로드 임시 저장 디렉토리 (기본: 시스템 임시 디렉토리/valueup_pdf)
+"""
+
+import asyncio
+import hashlib
+import os
+import shutil
+import tempfile
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional
+
+CHUNK_SIZE = 64 * 1024
+MIN_PDF_SIZE = 1000  # 이보다 작으면 오류 응답으로 판단
+PDF_MAGIC = b'%PDF'
+
+
+def log(message: str):
+    """타임스탬프와 함께 로그 출력"""
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    print(f"[{timestamp}] {message}", flush=True)
+
+
+@dataclass
+class DownloadedPDF:
+    """디스크에 저장된 PDF (경로 + 내용 해시 + 크기)"""
+    path: str
+    sha256: str
+    size: int
+    owned: bool = True  # True면 임시 파일 (save_to에서 이동), False면 캐시 등 원본 (복사)
+    source: str = ''    # PDF 출처 ('attachment': 기업 제출 원본, 'body': KIND 본문, 캐시 등 모르면 빈 값)
+
+    def read_bytes(self) -> bytes:
+        """PDF 전체 읽기 (바이트가 꼭 필요한 경우에만 사용)"""
+        with open(self.path, 'rb') as f:
+            return f.read()
+
+    def save_to(self, dest_path: str):
+        """
+        지정 경로로 저장 (임시 파일은 이동, 원본 파일은 복사)
+
+        Args:
+            dest_path: 저장할 경로
+        """
+        if self.owned:
+            shutil.move(self.path, dest_path)
+        else:
+            shutil.copyfile(self.path, dest_path)
+        self.path = dest_path
+        self.owned = False
+
+    def discard(self):
+        """임시 파일 삭제"""
+        if self.owned:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+
+class _StreamingWriter:
+    """청크를 받아 임시 파일에 쓰면서 헤더 검증 + SHA-256 + 크기 계산"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.part_path = f"{path}.part"
+        self.hasher = hashlib.sha256()
+        self.size = 0
+        self._head = b''
+        self._file = open(self.part_path, 'wb')
+
+    def write(self, chunk: bytes) -> bool:
+        """
+        청크 기록
+
+        Returns:
+            계속 진행 여부 (헤더가 %PDF가 아니면 False)
+        """
+        if len(self._head) < len(PDF_MAGIC):
+            self._head += chunk[:len(PDF_MAGIC) - len(self._head)]
+            if len(self._head) >= len(PDF_MAGIC) and self._head != PDF_MAGIC:
+                return False
+
+        self._file.write(chunk)
+        self.hasher.update(chunk)
+        self.size += len(chunk)
+        return True
+
+    def finish(self) -> Optional[DownloadedPDF]:
+        """기록 완료 (유효하지 않으면 삭제 후 None)"""
+        self._file.close()
+        if self._head != PDF_MAGIC:
+            log(f"    유효하지 않은 PDF 형식 (헤더: {self._head!r})")
+            self.abort()
+            return None
+        if self.size < MIN_PDF_SIZE:
+            log(f"    PDF가 너무 작음: {self.size} bytes")
+            self.abort()
+            return None
+
+        os.replace(self.part_path, self.path)
+        return DownloadedPDF(path=self.path, sha256=self.hasher.hexdigest(), size=self.size)
+
+    def abort(self):
+        """기록 중단 및 임시 파일 삭제"""
+        if not self._file.closed:
+            self._file.close()
+        try:
+            os.remove(self.part_path)
+        except OSError:
+            pass
+
+
+class PDFDownloader:
+    """스트리밍 PDF 다운로더 (임시 디렉토리에 저장)"""
+
+    def __init__(self, spool_dir: Optional[str] = None):
+        """
+        초기화
+
+        Args:
+            spool_dir: 임시 저장 디렉토리 (기본: VALUEUP_DOWNLOAD_DIR 또는 시스템 임시 디렉토리)
+        """
+        self.spool_dir = (spool_dir or os.environ.get('VALUEUP_DOWNLOAD_DIR')
+                          or os.path.join(tempfile.gettempdir(), 'valueup_pdf'))
+        os.makedirs(self.spool_dir, exist_ok=True)
+
+        # 실행 통계
+        self.count = 0
+        self.total_bytes = 0
+
+    def new_path(self) -> str:
+        """임시 저장 경로 생성"""
+        return os.path.join(self.spool_dir, f"{uuid.uuid4().hex}.pdf")
+
+    def _done(self, pdf: Optional[DownloadedPDF]) -> Optional[DownloadedPDF]:
+        if pdf:
+            self.count += 1
+            self.total_bytes += pdf.size
+        return pdf
+
+    async def fetch(
+        self,
+        session,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 60
+    ) -> Optional[DownloadedPDF]:
+        """
+        aiohttp 세션으로 PDF 스트리밍 다운로드
+
+        Args:
+            session: aiohttp.ClientSession (keep-alive 재사용)
+            url: PDF URL
+            headers: 추가 요청 헤더
+            timeout: 전체 타임아웃 (초)
+
+        Returns:
+            DownloadedPDF 또는 None
+        """
+        import aiohttp
+
+        writer = _StreamingWriter(self.new_path())
+        try:
+            async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                if response.status != 200:
+                    log(f"    PDF 다운로드 실패: HTTP {response.status}")
+                    writer.abort()
+                    return None
+
+                async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                    if not writer.write(chunk):
+                        break
+        except BaseException:
+            writer.abort()
+            raise
+
+        return self._done(writer.finish())
+
+    def fetch_blocking(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 60
+    ) -> Optional[DownloadedPDF]:
+        """
+        requests로 PDF 스트리밍 다운로드 (aiohttp가 없을 때, asyncio.to_thread로 호출)
+
+        Args:
+            url: PDF URL
+            headers: 요청 헤더
+            timeout: 타임아웃 (초)
+
+        Returns:
+            DownloadedPDF 또는 None
+        """
+        import requests
+
+        writer = _StreamingWriter(self.new_path())
+        try:
+            with requests.get(url, headers=headers, timeout=timeout, stream=True) as response:
+                if response.status_code != 200:
+                    log(f"    PDF 다운로드 실패: HTTP {response.status_code}")
+                    writer.abort()
+                    return None
+
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    if not writer.write(chunk):
+                        break
+        except BaseException:
+            writer.abort()
+            raise
+
+        return self._done(writer.finish())
+
+    def adopt(self, path: str) -> Optional[DownloadedPDF]:
+        """
+        이미 저장된 파일(브라우저 다운로드 등)을 그 자리에서 검증하고 해시 계산
+
+        Args:
+            path: 파일 경로 (유효하지 않으면 삭제)
+
+        Returns:
+            DownloadedPDF 또는 None
+        """
+        hasher = hashlib.sha256()
+        size = 0
+        with open(path, 'rb') as f:
+            head = f.read(len(PDF_MAGIC))
+            f.seek(0)
+            if head == PDF_MAGIC:
+                while chunk := f.read(CHUNK_SIZE):
+                    hasher.update(chunk)
+                    size += len(chunk)
+
+        if head != PDF_MAGIC or size < MIN_PDF_SIZE:
+            log(f"    다운로드 결과 유효하지 않음 (헤더: {head!r}, {size} bytes)")
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+
+        return self._done(DownloadedPDF(path=path, sha256=hasher.hexdigest(), size=size))
+
+    async def save_download(self, download) -> Optional[DownloadedPDF]:
+        """
+        Playwright Download를 임시 디렉토리에 저장 후 검증
+
+        Args:
+            download: playwright Download 객체
+
+        Returns:
+            DownloadedPDF 또는 None
+        """
+        path = self.new_path()
+        await download.save_as(path)
+        return await asyncio.to_thread(self.adopt, path)
+
+    def summary(self) -> str:
+        """다운로드 통계 요약 문자열"""
+        return f"{self.count}건, {self.total_bytes / 1024 / 1024:.1f}MB"
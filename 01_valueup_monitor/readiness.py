@@ -0,0 +1,236 @@
+"""
+페이지 준비 상태 대기 모듈
+고정 sleep 대신 구체적인 신호(목록 행 변경, iframe 이동/로드, 요소 등장)를 기다리고
+실제로 걸린 시간을 기록
+
+사용법:
+    ready = Readiness()
+
+    old = await ready.first_row_text(page)
+    await button.click()
+    await ready.rows_changed(page, old, 'search')
+
+    async with ready.iframe_navigation(page, 'attachment'):
+        await select.select_option(value=...)
+
+    log(ready.summary())
+
+환경변수:
+- VALUEUP_READY_TIMEOUT_MS: 대기 신호별 최대 대기 시간 (기본: 10000)
+"""
+
+import asyncio
+import os
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
+
+# 목록 첫 행 (페이지 변경 감지 기준)
+FIRST_ROW_SELECTOR = 'table.list tbody tr'
+
+# 목록이 갱신될 때까지 MutationObserver로 대기 (timeout 시 false)
+# - oldText가 null이면 행이 있기만 하면 완료 (새 문서로 이동한 직후)
+# - anyMutation이면 첫 행이 같더라도 테이블 내용이 다시 그려지면 완료 (검색 결과가 같은 경우)
+ROWS_CHANGED_JS = """([selector, oldText, timeout, anyMutation]) => new Promise(resolve => {
+    const current = () => {
+        const row = document.querySelector(selector);
+        return row ? row.innerText : '';
+    };
+    const changed = () => {
+        const text = current();
+        return text !== '' && (oldText === null || text !== oldText);
+    };
+    if (changed()) {
+        resolve(true);
+        return;
+    }
+    const observer = new MutationObserver(records => {
+        const redrawn = anyMutation && current() !== '' && records.some(
+            r => r.target.closest && r.target.closest('table')
+        );
+        if (redrawn || changed()) {
+            observer.disconnect();
+            clearTimeout(timer);
+            resolve(true);
+        }
+    });
+    const timer = setTimeout(() => {
+        observer.disconnect();
+        resolve(false);
+    }, timeout);
+    observer.observe(document.body, { childList: true, subtree: true, characterData: true });
+})"""
+
+
+class Readiness:
+    """신호 기반 대기 + 대기 시간 통계"""
+
+    def __init__(self, timeout_ms: Optional[int] = None):
+        """
+        초기화
+
+        Args:
+            timeout_ms: 기본 최대 대기 시간 (None이면 VALUEUP_READY_TIMEOUT_MS, 기본 10000)
+        """
+        if timeout_ms is None:
+            timeout_ms = int(os.environ.get('VALUEUP_READY_TIMEOUT_MS', '10000'))
+        self.timeout_ms = timeout_ms
+
+        # 대기 이름별 소요 시간 (초) / 타임아웃 수
+        self.durations: Dict[str, List[float]] = defaultdict(list)
+        self.timeouts: Dict[str, int] = defaultdict(int)
+
+    def _record(self, name: str, started: float, ok: bool) -> bool:
+        self.durations[name].append(time.monotonic() - started)
+        if not ok:
+            self.timeouts[name] += 1
+        return ok
+
+    async def first_row_text(self, page) -> str:
+        """목록 첫 행 텍스트 (변경 감지 기준값)"""
+        try:
+            first_row = page.locator(FIRST_ROW_SELECTOR).first
+            if await first_row.count() > 0:
+                return await first_row.inner_text()
+        except Exception:
+            pass
+        return ""
+
+    async def rows_changed(
+        self,
+        page,
+        old_text: str,
+        name: str,
+        timeout_ms: Optional[int] = None,
+        any_mutation: bool = False
+    ) -> bool:
+        """
+        목록이 갱신될 때까지 대기 (AJAX 갱신, form submit 이동 모두 처리)
+
+        Args:
+            page: Playwright Page
+            old_text: 변경 전 첫 행 텍스트
+            name: 통계용 대기 이름
+            timeout_ms: 최대 대기 시간
+            any_mutation: 첫 행이 같아도 테이블이 다시 그려지면 완료로 판정 (검색 버튼 등)
+
+        Returns:
+            변경 감지 여부
+        """
+        timeout_ms = timeout_ms or self.timeout_ms
+        started = time.monotonic()
+        deadline = started + timeout_ms / 1000
+
+        while True:
+            remaining_ms = int((deadline - time.monotonic()) * 1000)
+            if remaining_ms <= 0:
+                return self._record(name, started, False)
+            try:
+                changed = await page.evaluate(
+                    ROWS_CHANGED_JS, [FIRST_ROW_SELECTOR, old_text, remaining_ms, any_mutation]
+                )
+                return self._record(name, started, bool(changed))
+            except Exception:
+                # form submit 등으로 문서가 바뀌면 실행 컨텍스트가 사라짐 → 새 문서 로드 후 다시 관찰
+                try:
+                    await page.wait_for_load_state('domcontentloaded', timeout=max(1, remaining_ms))
+                except Exception:
+                    return self._record(name, started, False)
+                if any_mutation:
+                    old_text = None  # 새 문서에 행이 있으면 갱신 완료
+
+    async def selector(self, page, selector: str, name: str, timeout_ms: Optional[int] = None) -> bool:
+        """
+        요소가 DOM에 붙을 때까지 대기
+
+        Args:
+            page: Playwright Page (또는 Frame)
+            selector: CSS 셀렉터
+            name: 통계용 대기 이름
+            timeout_ms: 최대 대기 시간
+
+        Returns:
+            요소 등장 여부
+        """
+        started = time.monotonic()
+        try:
+            await page.wait_for_selector(selector, state='attached', timeout=timeout_ms or self.timeout_ms)
+            return self._record(name, started, True)
+        except Exception:
+            return self._record(name, started, False)
+
+    async def iframe_loaded(self, page, selector: str, name: str, timeout_ms: Optional[int] = None) -> bool:
+        """
+        iframe 요소가 붙고 내부 문서 로드가 끝날 때까지 대기
+
+        Args:
+            page: Playwright Page
+            selector: iframe 셀렉터
+            name: 통계용 대기 이름
+            timeout_ms: 최대 대기 시간
+
+        Returns:
+            로드 완료 여부
+        """
+        timeout_ms = timeout_ms or self.timeout_ms
+        started = time.monotonic()
+        try:
+            element = await page.wait_for_selector(selector, state='attached', timeout=timeout_ms)
+            frame = await element.content_frame() if element else None
+            if frame is None:
+                return self._record(name, started, False)
+            remaining_ms = max(1, timeout_ms - int((time.monotonic() - started) * 1000))
+            await frame.wait_for_load_state('load', timeout=remaining_ms)
+            return self._record(name, started, True)
+        except Exception:
+            return self._record(name, started, False)
+
+    @asynccontextmanager
+    async def iframe_navigation(self, page, name: str, timeout_ms: Optional[int] = None):
+        """
+        블록 안의 동작으로 하위 frame이 새 문서로 이동하고 DOM이 준비될 때까지 대기
+
+        대기는 동작 전에 등록하므로 응답이 빨라도 신호를 놓치지 않음.
+        타임아웃이면 현재 상태로 진행.
+
+        Args:
+            page: Playwright Page
+            name: 통계용 대기 이름
+            timeout_ms: 최대 대기 시간
+        """
+        timeout_ms = timeout_ms or self.timeout_ms
+        started = time.monotonic()
+        navigated = asyncio.ensure_future(page.wait_for_event(
+            'framenavigated',
+            predicate=lambda frame: frame.parent_frame is not None,
+            timeout=timeout_ms
+        ))
+        try:
+            yield
+        except BaseException:
+            navigated.cancel()
+            raise
+
+        try:
+            frame = await navigated
+            remaining_ms = max(1, timeout_ms - int((time.monotonic() - started) * 1000))
+            await frame.wait_for_load_state('domcontentloaded', timeout=remaining_ms)
+            self._record(name, started, True)
+        except Exception:
+            self._record(name, started, False)
+        finally:
+            if not navigated.done():
+                navigated.cancel()
+
+    def summary(self) -> str:
+        """대기 이름별 평균/최대 소요 시간 요약 문자열"""
+        if not self.durations:
+            return "-"
+        parts = []
+        for name, values in sorted(self.durations.items()):
+            part = f"{name} {len(values)}회 평균 {sum(values) / len(values):.1f}초/최대 {max(values):.1f}초"
+            if self.timeouts[name]:
+                part += f" (타임아웃 {self.timeouts[name]}회)"
+            parts.append(part)
+        return ', '.join(parts)
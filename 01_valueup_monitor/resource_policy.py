@@ -0,0 +1,141 @@
+"""
+브라우저 리소스 차단 정책
+파서가 읽지 않는 리소스(이미지, 폰트, 미디어, 외부 호스트의 비콘/이미지 등)를 페이지 역할별로 차단
+
+페이지 역할:
+- listing: 공시 목록 페이지 (is_visible 판정에 CSS가 필요하므로 스타일시트는 허용)
+- viewer:  공시 뷰어 페이지 (드롭다운/다운로드 폼만 사용)
+- iframe:  뷰어 안의 첨부문서 iframe (링크만 읽음)
+
+사용법:
+    policy = ResourcePolicy()
+    await policy.attach(page, 'viewer')   # iframe 요청은 자동으로 'iframe' 정책 적용
+    ...
+    log(policy.summary())
+
+환경변수:
+- VALUEUP_BLOCK_RESOURCES: 차단 사용 여부 (기본: true)
+- VALUEUP_BLOCK_LISTING / VALUEUP_BLOCK_VIEWER / VALUEUP_BLOCK_IFRAME:
+    역할별 차단 리소스 타입 (쉼표 구분, 예: "image,font,media")
+"""
+
+import os
+from collections import Counter
+from typing import Dict, Iterable, Optional, Set
+from urllib.parse import urlparse
+
+
+ROLE_LISTING = 'listing'
+ROLE_VIEWER = 'viewer'
+ROLE_IFRAME = 'iframe'
+
+# 역할별 기본 차단 리소스 타입 (Playwright request.resource_type)
+DEFAULT_BLOCKED_TYPES: Dict[str, Set[str]] = {
+    ROLE_LISTING: {'image', 'font', 'media'},
+    ROLE_VIEWER: {'image', 'font', 'media', 'stylesheet'},
+    ROLE_IFRAME: {'image', 'font', 'media', 'stylesheet'},
+}
+
+# KIND 외부 호스트의 이 타입 요청은 역할과 무관하게 차단 (광고 이미지, 비콘 등)
+# 스크립트는 KIND 페이지 동작(드롭다운/다운로드 폼)이 외부 라이브러리에 의존할 수 있으므로 차단하지 않음
+THIRD_PARTY_BLOCKED_TYPES = {'image', 'xhr', 'fetch', 'ping', 'beacon', 'font', 'stylesheet', 'media', 'other'}
+FIRST_PARTY_DOMAIN = 'krx.co.kr'
+
+
+def _parse_types(value: str) -> Set[str]:
+    return {t.strip().lower() for t in value.split(',') if t.strip()}
+
+
+def _is_first_party(host: str) -> bool:
+    """KIND 호스트 여부 (krx.co.kr 또는 그 하위 도메인만, notkrx.co.kr 같은 유사 호스트 제외)"""
+    return host == FIRST_PARTY_DOMAIN or host.endswith('.' + FIRST_PARTY_DOMAIN)
+
+
+class ResourcePolicy:
+    """페이지 역할별 리소스 차단 정책 + 차단 통계"""
+
+    def __init__(self, blocked_types: Optional[Dict[str, Iterable[str]]] = None, enabled: Optional[bool] = None):
+        """
+        초기화
+
+        Args:
+            blocked_types: 역할별 차단 리소스 타입 (None이면 환경변수 또는 기본값)
+            enabled: 차단 사용 여부 (None이면 VALUEUP_BLOCK_RESOURCES, 기본 true)
+        """
+        if enabled is None:
+            enabled = os.environ.get('VALUEUP_BLOCK_RESOURCES', 'true').lower() != 'false'
+        self.enabled = enabled
+
+        self.blocked_types: Dict[str, Set[str]] = {}
+        for role, defaults in DEFAULT_BLOCKED_TYPES.items():
+            if blocked_types and role in blocked_types:
+                self.blocked_types[role] = set(blocked_types[role])
+                continue
+            env_value = os.environ.get(f'VALUEUP_BLOCK_{role.upper()}')
+            self.blocked_types[role] = _parse_types(env_value) if env_value is not None else set(defaults)
+
+        # 실행 통계
+        self.blocked = Counter()   # (역할, 리소스 타입) → 차단 수
+        self.allowed = Counter()   # 역할 → 허용 수
+
+    def should_block(self, role: str, resource_type: str, url: str) -> bool:
+        """
+        요청 차단 여부 판정
+
+        Args:
+            role: 페이지 역할
+            resource_type: Playwright 리소스 타입
+            url: 요청 URL
+
+        Returns:
+            차단 여부
+        """
+        if not self.enabled:
+            return False
+
+        host = urlparse(url).hostname or ''
+        if host and not _is_first_party(host) and resource_type in THIRD_PARTY_BLOCKED_TYPES:
+            return True
+
+        return resource_type in self.blocked_types.get(role, ())
+
+    async def attach(self, page, role: str):
+        """
+        페이지에 차단 정책 등록 (하위 frame의 요청은 'iframe' 역할로 판정)
+
+        Args:
+            page: Playwright Page
+            role: 메인 frame의 역할 (listing / viewer)
+        """
+        if not self.enabled:
+            return
+
+        async def handle(route, request):
+            frame = request.frame
+            request_role = ROLE_IFRAME if frame is not None and frame.parent_frame is not None else role
+            resource_type = request.resource_type
+
+            if self.should_block(request_role, resource_type, request.url):
+                self.blocked[(request_role, resource_type)] += 1
+                await route.abort('blockedbyclient')
+            else:
+                self.allowed[request_role] += 1
+                await route.continue_()
+
+        await page.route('**/*', handle)
+
+    def summary(self) -> str:
+        """차단 통계 요약 문자열"""
+        if not self.enabled:
+            return "비활성화"
+
+        total_blocked = sum(self.blocked.values())
+        by_role = Counter()
+        by_type = Counter()
+        for (role, resource_type), count in self.blocked.items():
+            by_role[role] += count
+            by_type[resource_type] += count
+        role_detail = ', '.join(f"{role} {count}건" for role, count in sorted(by_role.items()))
+        type_detail = ', '.join(f"{resource_type} {count}" for resource_type, count in by_type.most_common())
+        return (f"차단 {total_blocked}건 ({role_detail or '-'} / 타입별: {type_detail or '-'}), "
+                f"허용 {sum(self.allowed.values())}건")
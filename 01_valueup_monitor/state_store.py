@@ -0,0 +1,431 @@
+"""
+로컬 상태 저장소 (SQLite)
+Google Sheets 시트 내용을 접수번호 기준으로 로컬에 미러링하여
+매 실행마다 시트 전체를 다시 읽지 않도록 함
+
+동기화 방식:
+- 마지막으로 동기화한 행 수(row_count)와 마지막 행의 접수번호(tail_key) 기록
+- 증분 동기화: 헤더 + 마지막 행 이후 구간만 1회 batch_get으로 조회
+- 헤더 변경 / 마지막 행 불일치(행 삭제·정렬) / 주기 경과 시 전체 재동기화
+- 자체 쓰기(링크, 분석상태, 예상토큰수)는 write-through로 즉시 반영
+
+사용법:
+    store = DisclosureStateStore()
+    store.sync_worksheet(worksheet)
+    existing = store.acptno_set(worksheet.title)
+"""
+
+import json
+import os
+import sqlite3
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+# 저장소 기본 위치: 저장소 루트의 .valueup_state/ (GitHub Actions 캐시 대상)
+STATE_DIR = os.environ.get(
+    'VALUEUP_STATE_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.valueup_state')
+)
+
+
+def log(message: str):
+    """타임스탬프와 함께 로그 출력"""
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    print(f"[{timestamp}] {message}", flush=True)
+
+
+def normalize_acptno(value) -> str:
+    """접수번호 정규화 - 숫자/텍스트 모두 문자열로 변환"""
+    if value is None or value == '':
+        return ''
+    if isinstance(value, (int, float)):
+        return str(int(value))
+    return str(value).strip().lstrip("'")
+
+
+def _column_letter(col: int) -> str:
+    """1-based 열 번호 → A1 표기 열 문자"""
+    letters = ''
+    while col > 0:
+        col, remainder = divmod(col - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+class DisclosureStateStore:
+    """접수번호 기준 시트 상태 미러 (SQLite)"""
+
+    KEY_HEADER = '접수번호'
+
+    # 인덱스 컬럼으로 따로 저장하는 헤더 (조회 조건용)
+    INDEXED_FIELDS = {
+        '구글드라이브링크': 'gdrive_link',
+        '분석상태': 'analysis_status',
+        '예상토큰수': 'estimated_tokens',
+        '공시일자': 'disclosure_date',
+    }
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS rows (
+            sheet TEXT NOT NULL,
+            acptno TEXT NOT NULL,
+            row_num INTEGER NOT NULL,
+            record TEXT NOT NULL,
+            gdrive_link TEXT DEFAULT '',
+            analysis_status TEXT DEFAULT '',
+            estimated_tokens TEXT DEFAULT '',
+            disclosure_date TEXT DEFAULT '',
+            PRIMARY KEY (sheet, acptno)
+        );
+        CREATE INDEX IF NOT EXISTS idx_rows_row_num ON rows (sheet, row_num);
+        CREATE INDEX IF NOT EXISTS idx_rows_date ON rows (sheet, disclosure_date);
+        CREATE TABLE IF NOT EXISTS sheets (
+            sheet TEXT PRIMARY KEY,
+            headers TEXT NOT NULL,
+            row_count INTEGER NOT NULL,
+            tail_key TEXT DEFAULT '',
+            last_sync REAL DEFAULT 0,
+            last_full_sync REAL DEFAULT 0
+        );
+        CREATE TABLE IF NOT EXISTS watermarks (
+            scope TEXT PRIMARY KEY,
+            acptno TEXT NOT NULL,
+            disclosed_at TEXT DEFAULT '',
+            updated REAL NOT NULL
+        );
+    """
+
+    def __init__(self, path: Optional[str] = None, full_sync_hours: Optional[float] = None):
+        """
+        초기화
+
+        Args:
+            path: SQLite 파일 경로 (기본: VALUEUP_STATE_DB 또는 .valueup_state/state.sqlite3)
+            full_sync_hours: 전체 재동기화 주기 (기본: VALUEUP_STATE_FULL_SYNC_HOURS 또는 24시간)
+        """
+        self.path = path or os.environ.get('VALUEUP_STATE_DB') or os.path.join(STATE_DIR, 'state.sqlite3')
+        if full_sync_hours is None:
+            full_sync_hours = float(os.environ.get('VALUEUP_STATE_FULL_SYNC_HOURS', '24'))
+        self.full_sync_seconds = full_sync_hours * 3600
+
+        if self.path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(self.SCHEMA)
+        self.conn.commit()
+
+    def close(self):
+        """연결 종료"""
+        self.conn.close()
+
+    # ------------------------------------------------------------------
+    # 동기화
+    # ------------------------------------------------------------------
+
+    def _sheet_meta(self, sheet: str) -> Optional[sqlite3.Row]:
+        return self.conn.execute("SELECT * FROM sheets WHERE sheet = ?", (sheet,)).fetchone()
+
+    def sync_worksheet(self, worksheet, force_full: bool = False) -> int:
+        """
+        시트와 로컬 상태 동기화 (가능하면 증분)
+
+        Args:
+            worksheet: gspread 워크시트
+            force_full: True면 전체 재동기화
+
+        Returns:
+            새로 반영된 행 수 (실패 시 -1)
+        """
+        sheet = worksheet.title
+        meta = self._sheet_meta(sheet)
+
+        full = force_full or meta is None or meta['row_count'] <= 1
+        if not full and time.time() - meta['last_full_sync'] > self.full_sync_seconds:
+            full = True
+
+        # 증분: 마지막 동기화 행부터 (tail 검증용으로 마지막 행 포함), 행 범위는 열린 구간
+        start_row = 1 if full else meta['row_count']
+        last_col = _column_letter(max(1, worksheet.col_count))
+
+        try:
+            header_range, body_range = worksheet.batch_get([
+                '1:1', f'A{start_row}:{last_col}'
+            ])
+        except Exception as e:
+            log(f"  [WARN] 상태 동기화 실패 ({sheet}): {e}")
+            return -1
+
+        headers = [str(h).strip() for h in (header_range[0] if header_range else [])]
+        body = [list(r) for r in body_range]
+
+        if not full:
+            tail_row = body[0] if body else []
+            if json.loads(meta['headers']) != headers or self._row_key(headers, tail_row) != meta['tail_key']:
+                log(f"  상태 저장소: {sheet} 시트 구조 변경 감지 → 전체 재동기화")
+                return self.sync_worksheet(worksheet, force_full=True)
+            body = body[1:]
+            start_row += 1
+        else:
+            # 전체 동기화 시 body에는 헤더 행이 포함됨
+            body = body[1:]
+            start_row = 2
+
+        now = time.time()
+        with self.conn:
+            if full:
+                self.conn.execute("DELETE FROM rows WHERE sheet = ?", (sheet,))
+
+            last_row = start_row - 1
+            tail_key = '' if full else meta['tail_key']
+            added = 0
+            for offset, values in enumerate(body):
+                row_num = start_row + offset
+                if not any(str(v).strip() for v in values):
+                    continue
+                last_row = row_num
+                tail_key = self._row_key(headers, values)
+                if not tail_key:
+                    continue
+                record = {h: (values[i] if i < len(values) else '') for i, h in enumerate(headers)}
+                self._upsert(sheet, row_num, record, tail_key)
+                added += 1
+
+            self.conn.execute(
+                """
+                INSERT INTO sheets (sheet, headers, row_count, tail_key, last_sync, last_full_sync)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(sheet) DO UPDATE SET
+                    headers = excluded.headers,
+                    row_count = excluded.row_count,
+                    tail_key = excluded.tail_key,
+                    last_sync = excluded.last_sync,
+                    last_full_sync = excluded.last_full_sync
+                """,
+                (sheet, json.dumps(headers, ensure_ascii=False), last_row, tail_key,
+                 now, now if full else meta['last_full_sync'])
+            )
+
+        mode = '전체' if full else '증분'
+        log(f"  상태 저장소 동기화 ({sheet}, {mode}): {added}행 반영")
+        return added
+
+    def refresh_columns(self, worksheet, fields: Iterable[str]) -> int:
+        """
+        기존 행에서 나중에 바뀌는 열만 다시 읽어 반영
+
+        증분 동기화는 새로 추가된 행만 읽으므로, 다른 워크플로가 기존 행에 채운
+        링크나 분석상태는 전체 동기화 전까지 반영되지 않음. 지정한 열만 한 번에 읽어 보정.
+
+        Args:
+            worksheet: gspread 워크시트 (sync_worksheet 이후)
+            fields: 다시 읽을 헤더 목록
+
+        Returns:
+            값이 바뀐 행 수 (실패 시 -1)
+        """
+        sheet = worksheet.title
+        meta = self._sheet_meta(sheet)
+        if meta is None:
+            return -1
+
+        headers = json.loads(meta['headers'])
+        columns = [(field, headers.index(field)) for field in fields if field in headers]
+        last_row = meta['row_count']
+        if not columns or last_row < 2:
+            return 0
+
+        ranges = [f"{_column_letter(idx + 1)}2:{_column_letter(idx + 1)}{last_row}" for _, idx in columns]
+        try:
+            values = worksheet.batch_get(ranges)
+        except Exception as e:
+            log(f"  [WARN] 상태 열 재조회 실패 ({sheet}): {e}")
+            return -1
+
+        # {행 번호: {헤더: 값}} (빈 셀은 응답에서 생략되므로 빈 문자열로 채움)
+        fresh: Dict[int, Dict[str, Any]] = {}
+        for (field, _), column in zip(columns, values):
+            column = list(column)
+            for row_num in range(2, last_row + 1):
+                offset = row_num - 2
+                cell = column[offset] if offset < len(column) else []
+                fresh.setdefault(row_num, {})[field] = cell[0] if cell else ''
+
+        changed = 0
+        with self.conn:
+            rows = self.conn.execute("SELECT acptno, row_num, record FROM rows WHERE sheet = ?", (sheet,))
+            for row in rows.fetchall():
+                record = json.loads(row['record'])
+                update = fresh.get(row['row_num'], {})
+                if all(str(record.get(field, '')) == str(value) for field, value in update.items()):
+                    continue
+                record.update(update)
+                self._upsert(sheet, row['row_num'], record, row['acptno'])
+                changed += 1
+
+        if changed:
+            log(f"  상태 저장소 열 재조회 ({sheet}): {changed}행 갱신")
+        return changed
+
+    def _row_key(self, headers: List[str], values: List[Any]) -> str:
+        """행의 접수번호 (헤더 위치 기준)"""
+        if self.KEY_HEADER not in headers:
+            return ''
+        idx = headers.index(self.KEY_HEADER)
+        return normalize_acptno(values[idx]) if idx < len(values) else ''
+
+    def _upsert(self, sheet: str, row_num: int, record: Dict[str, Any], acptno: str):
+        indexed = {col: str(record.get(field, '')).strip() for field, col in self.INDEXED_FIELDS.items()}
+        self.conn.execute(
+            """
+            INSERT OR REPLACE INTO rows
+                (sheet, acptno, row_num, record, gdrive_link, analysis_status, estimated_tokens, disclosure_date)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (sheet, acptno, row_num, json.dumps(record, ensure_ascii=False),
+             indexed['gdrive_link'], indexed['analysis_status'].lower(),
+             indexed['estimated_tokens'], indexed['disclosure_date'][:10])
+        )
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def acptno_set(self, sheet: str) -> set:
+        """시트에 기록된 접수번호 집합"""
+        cur = self.conn.execute("SELECT acptno FROM rows WHERE sheet = ?", (sheet,))
+        return {row['acptno'] for row in cur}
+
+    def row_numbers(self, sheet: str) -> Dict[str, int]:
+        """{접수번호: 행번호} 매핑"""
+        cur = self.conn.execute("SELECT acptno, row_num FROM rows WHERE sheet = ?", (sheet,))
+        return {row['acptno']: row['row_num'] for row in cur}
+
+    def records(
+        self,
+        sheet: str,
+        without_gdrive_link: bool = False,
+        exclude_status: Iterable[str] = (),
+        since_date: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        조건에 맞는 행 레코드 조회 (행 번호 순)
+
+        Args:
+            sheet: 시트 이름
+            without_gdrive_link: True면 Google Drive 링크가 없는 행만
+            exclude_status: 제외할 분석상태 목록 (소문자)
+            since_date: 'YYYY-MM-DD' 이후 공시만 (날짜 없는 행은 포함)
+
+        Returns:
+            get_all_records()와 같은 형태의 딕셔너리 리스트
+        """
+        query = "SELECT record FROM rows WHERE sheet = ?"
+        params: List[Any] = [sheet]
+        if without_gdrive_link:
+            query += " AND gdrive_link NOT LIKE 'https://drive.google.com/%'"
+        statuses = list(exclude_status)
+        if statuses:
+            query += f" AND analysis_status NOT IN ({','.join('?' * len(statuses))})"
+            params.extend(statuses)
+        if since_date:
+            query += " AND (disclosure_date = '' OR disclosure_date >= ?)"
+            params.append(since_date)
+        query += " ORDER BY row_num"
+        return [json.loads(row['record']) for row in self.conn.execute(query, params)]
+
+    def count(self, sheet: str) -> int:
+        """시트에 기록된 행 수"""
+        return self.conn.execute("SELECT COUNT(*) FROM rows WHERE sheet = ?", (sheet,)).fetchone()[0]
+
+    def headers(self, sheet: str) -> List[str]:
+        """마지막으로 동기화한 헤더 행"""
+        meta = self._sheet_meta(sheet)
+        return json.loads(meta['headers']) if meta else []
+
+    def last_row(self, sheet: str) -> int:
+        """마지막으로 동기화한 데이터 행 번호 (헤더 포함, 미동기화 시 0)"""
+        meta = self._sheet_meta(sheet)
+        return meta['row_count'] if meta else 0
+
+    # ------------------------------------------------------------------
+    # 크롤링 워터마크
+    # ------------------------------------------------------------------
+
+    def get_watermark(self, scope: str) -> Optional[Dict[str, str]]:
+        """
+        조회 범위별 마지막으로 기록 완료한 최신 공시
+
+        Args:
+            scope: 조회 범위 키 (예: 'days:7', 'period:1개월')
+
+        Returns:
+            {'acptno': ..., 'disclosed_at': ...} 또는 None
+        """
+        row = self.conn.execute(
+            "SELECT acptno, disclosed_at FROM watermarks WHERE scope = ?", (scope,)
+        ).fetchone()
+        return {'acptno': row['acptno'], 'disclosed_at': row['disclosed_at']} if row else None
+
+    def set_watermark(self, scope: str, acptno: str, disclosed_at: str = ''):
+        """
+        워터마크 갱신 (기존보다 새로운 접수번호일 때만)
+
+        Args:
+            scope: 조회 범위 키
+            acptno: 최신 접수번호
+            disclosed_at: 공시일시
+        """
+        acptno = normalize_acptno(acptno)
+        current = self.get_watermark(scope)
+        if current and int(current['acptno']) >= int(acptno):
+            return
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO watermarks (scope, acptno, disclosed_at, updated) VALUES (?, ?, ?, ?)",
+                (scope, acptno, disclosed_at, time.time())
+            )
+
+    # ------------------------------------------------------------------
+    # write-through
+    # ------------------------------------------------------------------
+
+    def update_fields(self, sheet: str, acptno: str, fields: Dict[str, Any]) -> bool:
+        """
+        시트에 쓴 값을 로컬 상태에도 반영
+
+        Args:
+            sheet: 시트 이름
+            acptno: 접수번호
+            fields: {헤더: 값}
+
+        Returns:
+            반영 여부 (로컬에 없는 행이면 False)
+        """
+        acptno = normalize_acptno(acptno)
+        row = self.conn.execute(
+            "SELECT row_num, record FROM rows WHERE sheet = ? AND acptno = ?", (sheet, acptno)
+        ).fetchone()
+        if row is None:
+            return False
+
+        record = json.loads(row['record'])
+        record.update(fields)
+        with self.conn:
+            self._upsert(sheet, row['row_num'], record, acptno)
+        return True
+
+    def update_many(self, sheet: str, updates: Dict[str, Dict[str, Any]]) -> int:
+        """
+        여러 행 write-through
+
+        Args:
+            sheet: 시트 이름
+            updates: {접수번호: {헤더: 값}}
+
+        Returns:
+            반영된 행 수
+        """
+        return sum(1 for acptno, fields in updates.items() if self.update_fields(sheet, acptno, fields))
+
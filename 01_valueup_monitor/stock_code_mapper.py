@@ -2,6 +2,13 @@
 KRX 종목코드 조회 모듈
 회사명으로 종목코드(6자리)를 조회
 
+- 전종목 목록은 1회 일괄 조회 (KRX MDCSTAT01901, 실패 시 pykrx 일괄 조회)
+- 조회 결과는 거래일 단위 스냅샷 파일로 저장 → 같은 거래일의 다음 실행은 파일만 읽음
+- 상장폐지/사명변경 종목도 스냅샷 이력으로 이전 이름 조회 가능
+- 로드 시 정규화 이름 인덱스 + 2-gram 역색인을 한 번 만들어 두고,
+  정확히 일치하지 않으면 Dice 유사도로 순위를 매겨 단일 최고점 후보만 채택
+  (동점이면 모호한 이름으로 보고 None, 예: "삼성")
+
 사용법:
     from stock_code_mapper import StockCodeMapper
     
@@ -9,9 +16,22 @@ KRX 종목코드 조회 모듈
     code = mapper.get_code("삼성전자")  # "005930"
 """
 
+import math
+import re
 import requests
-from typing import Optional, Dict
-from datetime import datetime
+from collections import defaultdict
+from typing import Optional, Dict, List, Set
+from datetime import datetime, timedelta
+
+from stock_snapshot import StockSnapshot, latest_trading_date
+
+
+# 회사명 정규화: 법인 표기 + 공백/특수문자 제거
+_CORP_SUFFIX_PATTERN = re.compile(r'\(주\)|㈜|주식회사')
+_NORMALIZE_PATTERN = re.compile(r'[\s\(\)\[\]\.·\-]')
+
+# 유사도 매칭 최소 점수 (Dice 계수)
+FUZZY_MIN_SCORE = 0.6
 
 
 def log(message: str):
@@ -20,134 +40,238 @@ def log(message: str):
     print(f"[{timestamp}] {message}", flush=True)
 
 
+def _ngrams(text: str) -> Set[str]:
+    """2-gram 집합 (한 글자면 글자 자체)"""
+    if len(text) < 2:
+        return {text} if text else set()
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
 class StockCodeMapper:
     """회사명 → 종목코드 매핑"""
     
     # KRX 상장종목 조회 API
     KRX_API_URL = "http://data.krx.co.kr/comm/bldAttendant/getJsonData.cmd"
     
-    def __init__(self):
-        """초기화 - KRX에서 전체 종목 목록 로드"""
+    def __init__(self, snapshot: Optional[StockSnapshot] = None):
+        """
+        초기화 - 종목 목록은 첫 조회 시 로드
+        
+        Args:
+            snapshot: 상장종목 스냅샷 (기본: .valueup_state/stock_snapshot.json)
+        """
         self._cache: Dict[str, str] = {}  # 회사명 → 종목코드
         self._cache_by_code: Dict[str, str] = {}  # 종목코드 → 회사명
         self._loaded = False
+        
+        # 조회 인덱스 (로드 시 1회 구축)
+        self._by_normalized: Dict[str, str] = {}  # 정규화 이름 → 종목코드
+        self._gram_index: Dict[str, List[str]] = {}  # 2-gram → 정규화 이름 리스트
+        self._gram_sets: Dict[str, Set[str]] = {}  # 정규화 이름 → 2-gram 집합
+        self._listed_codes: Set[str] = set()  # 현재 상장 종목코드
+        self._resolved: Dict[str, Optional[str]] = {}  # 조회 결과 메모
+        self.snapshot = snapshot or StockSnapshot()
     
     def _load_stock_list(self) -> bool:
-        """KRX에서 상장종목 목록 로드"""
+        """상장종목 목록 로드 (스냅샷 우선, 거래일이 바뀌었으면 일괄 조회 후 저장)"""
         if self._loaded:
             return True
         
-        # 방법 1: pykrx 라이브러리 시도
-        if self._load_via_pykrx():
+        trading_date = latest_trading_date()
+        previous = self.snapshot.load()
+        
+        if previous and self.snapshot.is_fresh(previous, trading_date):
+            self._apply_snapshot(previous)
+            log(f"  종목 스냅샷 사용: {len(previous['listed'])}개 종목 ({previous['trading_date']} 기준)")
+            return True
+        
+        # 방법 1: KRX API 일괄 조회 (1회 호출)
+        source = 'krx'
+        listed = self._fetch_via_krx_api()
+        
+        # 방법 2: pykrx 일괄 조회
+        if not listed:
+            source = 'pykrx'
+            listed = self._fetch_via_pykrx(trading_date)
+        
+        if listed:
+            data = self.snapshot.save(listed, trading_date, source, previous=previous)
+            self._apply_snapshot(data)
+            log(f"  {source}로 {len(listed)}개 종목 로드 (스냅샷 저장: {trading_date} 기준)")
             return True
         
-        # 방법 2: KRX API 직접 호출
-        if self._load_via_krx_api():
+        # 조회 실패 시 오래된 스냅샷이라도 사용
+        if previous:
+            self._apply_snapshot(previous)
+            log(f"  종목 목록 조회 실패 - 이전 스냅샷 사용 ({previous.get('trading_date')} 기준)")
             return True
         
         log("  종목 목록 로드 실패 - 모든 방법 실패")
         return False
     
-    def _load_via_pykrx(self) -> bool:
-        """pykrx 라이브러리로 종목 목록 로드"""
-        try:
-            from pykrx import stock
-            
-            # 오늘 날짜 기준
-            today = datetime.now().strftime("%Y%m%d")
-            
-            # KOSPI
-            kospi_tickers = stock.get_market_ticker_list(today, market="KOSPI")
-            for ticker in kospi_tickers:
-                name = stock.get_market_ticker_name(ticker)
-                if name:
-                    self._cache[name] = ticker
-                    self._cache[self._normalize_name(name)] = ticker
-                    self._cache_by_code[ticker] = name
-            
-            # KOSDAQ
-            kosdaq_tickers = stock.get_market_ticker_list(today, market="KOSDAQ")
-            for ticker in kosdaq_tickers:
-                name = stock.get_market_ticker_name(ticker)
-                if name:
-                    self._cache[name] = ticker
-                    self._cache[self._normalize_name(name)] = ticker
-                    self._cache_by_code[ticker] = name
+    def _apply_snapshot(self, data: Dict):
+        """스냅샷을 조회용 캐시로 변환 (이전 이름 먼저, 현재 상장 종목이 우선하도록 나중에)"""
+        for code, names in (data.get('history') or {}).items():
+            for name in reversed(names):
+                self._cache[name] = code
+                self._cache[self._normalize_name(name)] = code
+            if names:
+                self._cache_by_code[code] = names[0]
+        
+        for code, name in data['listed'].items():
+            self._cache[name] = code
+            self._cache[self._normalize_name(name)] = code
+            self._cache_by_code[code] = name
+        
+        self._listed_codes = set(data['listed'])
+        self._build_index()
+        self._loaded = True
+    
+    def _build_index(self):
+        """정규화 이름 인덱스 + 2-gram 역색인 구축"""
+        self._by_normalized = {}
+        for name, code in self._cache.items():
+            normalized = self._normalize_name(name)
+            if normalized:
+                self._by_normalized[normalized] = code
+        
+        gram_index = defaultdict(list)
+        self._gram_sets = {}
+        for normalized in sorted(self._by_normalized):
+            grams = _ngrams(normalized)
+            self._gram_sets[normalized] = grams
+            for gram in grams:
+                gram_index[gram].append(normalized)
+        self._gram_index = dict(gram_index)
+        self._resolved = {}
+    
+    def _fuzzy_match(self, normalized: str) -> Optional[str]:
+        """
+        2-gram Dice 유사도로 가장 가까운 종목코드 조회
+        
+        최고점 후보가 하나일 때만 채택 (같은 점수의 다른 종목이 있으면 모호하므로 None).
+        점수가 같은 동일 종목 후보 사이에서는 현재 상장 종목 → 이름 길이 차이 순.
+        
+        Args:
+            normalized: 정규화된 회사명
             
-            if self._cache_by_code:
-                self._loaded = True
-                log(f"  pykrx로 {len(self._cache_by_code)}개 종목 로드")
-                return True
-            return False
+        Returns:
+            종목코드 또는 None
+        """
+        grams = _ngrams(normalized)
+        if not grams:
+            return None
+        
+        # 최소 점수를 넘으려면 공유해야 하는 2-gram 수 → 드문 2-gram 앞부분만 후보 생성에 사용
+        # (흔한 2-gram만 겹치는 후보는 점수 미달이므로 보지 않음)
+        min_shared = math.ceil(FUZZY_MIN_SCORE * len(grams) / (2 - FUZZY_MIN_SCORE))
+        by_rarity = sorted(grams, key=lambda gram: (len(self._gram_index.get(gram, ())), gram))
+        candidates = set()
+        for gram in by_rarity[:len(grams) - min_shared + 1]:
+            candidates.update(self._gram_index.get(gram, ()))
+        if not candidates:
+            return None
+        
+        scored = sorted(
+            (
+                -2 * len(grams & self._gram_sets[candidate]) / (len(grams) + len(self._gram_sets[candidate])),
+                self._by_normalized[candidate] not in self._listed_codes,
+                abs(len(candidate) - len(normalized)),
+                candidate,
+            )
+            for candidate in candidates
+        )
+        
+        best_score, _, _, best_name = scored[0]
+        if -best_score < FUZZY_MIN_SCORE:
+            return None
+        
+        best_code = self._by_normalized[best_name]
+        for score, _, _, name in scored[1:]:
+            if score != best_score:
+                break
+            if self._by_normalized[name] != best_code:
+                return None  # 같은 점수의 다른 종목 → 모호
+        return best_code
+    
+    def _fetch_via_pykrx(self, trading_date: str) -> Dict[str, str]:
+        """
+        pykrx로 전종목 일괄 조회 (종목명 포함 조회 1회, 휴장일이면 직전 영업일로 재시도)
+        
+        Args:
+            trading_date: 기준 거래일 (YYYYMMDD)
             
+        Returns:
+            {종목코드: 종목명} (실패 시 빈 딕셔너리)
+        """
+        try:
+            from pykrx import stock
         except ImportError:
-            log("  pykrx 미설치, KRX API로 시도")
-            return False
-        except Exception as e:
-            log(f"  pykrx 오류: {e}")
-            return False
+            log("  pykrx 미설치")
+            return {}
+        
+        day = datetime.strptime(trading_date, "%Y%m%d")
+        for _ in range(7):
+            date_str = day.strftime("%Y%m%d")
+            try:
+                df = stock.get_market_price_change(date_str, date_str, market="ALL")
+                if df is not None and not df.empty and '종목명' in df.columns:
+                    return {str(code).zfill(6): name for code, name in df['종목명'].items() if name}
+            except Exception as e:
+                log(f"  pykrx 오류: {e}")
+                return {}
+            day -= timedelta(days=1)
+        return {}
     
-    def _load_via_krx_api(self) -> bool:
-        """KRX API로 종목 목록 로드"""
+    def _fetch_via_krx_api(self) -> Dict[str, str]:
+        """
+        KRX API로 전종목 기본정보 일괄 조회 (MDCSTAT01901, 전체 시장 1회 호출)
+        
+        Returns:
+            {종목코드: 종목명} (실패 시 빈 딕셔너리)
+        """
+        payload = {
+            "bld": "dbms/MDC/STAT/standard/MDCSTAT01901",
+            "locale": "ko_KR",
+            "mktId": "ALL",
+            "share": "1",
+            "csvxls_is498": "false",
+        }
+        
+        headers = {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+            "Referer": "http://data.krx.co.kr/contents/MDC/MDI/mdiLoader/index.cmd",
+        }
+        
         try:
-            markets = [
-                ("STK", "KOSPI"),
-                ("KSQ", "KOSDAQ"),
-            ]
+            response = requests.post(
+                self.KRX_API_URL,
+                data=payload,
+                headers=headers,
+                timeout=30
+            )
             
-            for mkt_code, mkt_name in markets:
-                payload = {
-                    "bld": "dbms/MDC/STAT/standard/MDCSTAT01901",
-                    "locale": "ko_KR",
-                    "mktId": mkt_code,
-                    "share": "1",
-                    "csvxls_is498": "false",
-                }
-                
-                headers = {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                    "Referer": "http://data.krx.co.kr/contents/MDC/MDI/mdiLoader/index.cmd",
-                }
-                
-                response = requests.post(
-                    self.KRX_API_URL,
-                    data=payload,
-                    headers=headers,
-                    timeout=30
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    items = data.get("OutBlock_1", [])
-                    
-                    for item in items:
-                        종목코드 = item.get("ISU_SRT_CD", "")
-                        회사명 = item.get("ISU_ABBRV", "")
-                        
-                        if 종목코드 and 회사명:
-                            normalized_name = self._normalize_name(회사명)
-                            self._cache[normalized_name] = 종목코드
-                            self._cache[회사명] = 종목코드
-                            self._cache_by_code[종목코드] = 회사명
-                    
-                    log(f"  {mkt_name} 종목 {len(items)}개 로드")
+            if response.status_code != 200:
+                log(f"  KRX API 응답 오류: HTTP {response.status_code}")
+                return {}
             
-            if self._cache_by_code:
-                self._loaded = True
-                log(f"  KRX API로 총 {len(self._cache_by_code)}개 종목 캐시됨")
-                return True
-            return False
+            listed = {}
+            for item in response.json().get("OutBlock_1", []):
+                종목코드 = item.get("ISU_SRT_CD", "")
+                회사명 = item.get("ISU_ABBRV", "")
+                if 종목코드 and 회사명:
+                    listed[종목코드] = 회사명
+            return listed
             
         except Exception as e:
             log(f"  KRX API 오류: {e}")
-            return False
+            return {}
     
     def _normalize_name(self, name: str) -> str:
         """회사명 정규화 - 검색 정확도 향상"""
-        import re
-        # 공백, 특수문자 제거
-        normalized = re.sub(r'[\s\(\)\[\]\.·\-]', '', name)
-        return normalized.strip()
+        # 법인 표기, 공백, 특수문자 제거 + 영문 대문자 통일
+        normalized = _NORMALIZE_PATTERN.sub('', _CORP_SUFFIX_PATTERN.sub('', name))
+        return normalized.strip().upper()
     
     def get_code(self, company_name: str) -> Optional[str]:
         """
@@ -165,33 +289,25 @@ class StockCodeMapper:
         if not company_name:
             return None
         
-        code = None
+        if company_name in self._resolved:
+            return self._resolved[company_name]
         
         # 정확히 일치
-        if company_name in self._cache:
-            code = self._cache[company_name]
+        code = self._cache.get(company_name)
         
         # 정규화된 이름으로 검색
         if not code:
             normalized = self._normalize_name(company_name)
-            if normalized in self._cache:
-                code = self._cache[normalized]
+            code = self._by_normalized.get(normalized)
         
-        # 부분 일치 검색 (회사명이 포함된 경우)
+        # 유사도 검색 (2-gram 역색인)
         if not code:
-            for cached_name, cached_code in self._cache.items():
-                if normalized in self._normalize_name(cached_name):
-                    code = cached_code
-                    break
-                if self._normalize_name(cached_name) in normalized:
-                    code = cached_code
-                    break
+            code = self._fuzzy_match(normalized)
         
         # 6자리로 패딩 (예: 3490 → 003490)
-        if code:
-            return str(code).zfill(6)
-        
-        return None
+        result = str(code).zfill(6) if code else None
+        self._resolved[company_name] = result
+        return result
     
     def get_name(self, stock_code: str) -> Optional[str]:
         """
@@ -221,10 +337,8 @@ class StockCodeMapper:
         if not self._loaded:
             self._load_stock_list()
         
-        result = {}
-        for name in company_names:
-            result[name] = self.get_code(name)
-        return result
+        # 중복 이름은 한 번만 조회 (인덱스 + 결과 메모 공유)
+        return {name: self.get_code(name) for name in dict.fromkeys(company_names)}
 
 
 # 싱글톤 인스턴스 (재사용)
@@ -0,0 +1,144 @@
+"""
+상장종목 스냅샷 (디스크 캐시)
+KRX 전종목 목록을 거래일 단위로 파일에 저장하여 다음 실행부터는 파일만 읽도록 함
+
+- 키: 기준 거래일 (주말이면 직전 금요일) → 같은 거래일이면 다시 조회하지 않음
+- TTL: 거래일이 같더라도 이 시간이 지나면 다시 조회 (연휴 대비 상한)
+- 이력: 상장폐지/사명변경된 종목도 이전 이름으로 계속 조회되도록 종목코드별 이름 이력 유지
+- 조회 실패 시 오래된 스냅샷이라도 그대로 사용
+
+파일 형식 (JSON):
+    {
+      "trading_date": "20251226",
+      "fetched_at": 1766700000.0,
+      "source": "krx",
+      "listed": {"005930": "삼성전자", ...},         # 현재 상장 종목
+      "history": {"005930": ["삼성전자"], ...}        # 종목코드별 이름 이력 (최신순, 상장폐지 포함)
+    }
+
+환경변수:
+- VALUEUP_STOCK_SNAPSHOT: 스냅샷 파일 경로 (기본: .valueup_state/stock_snapshot.json)
+- VALUEUP_STOCK_SNAPSHOT_TTL_HOURS: 최대 사용 시간 (기본: 72)
+"""
+
+import json
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from state_store import STATE_DIR
+
+KST = timezone(timedelta(hours=9))
+
+
+def log(message: str):
+    """타임스탬프와 함께 로그 출력"""
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    print(f"[{timestamp}] {message}", flush=True)
+
+
+def latest_trading_date(now: Optional[datetime] = None) -> str:
+    """
+    기준 거래일 (KST, 주말이면 직전 금요일)
+
+    공휴일은 구분하지 않음 (공휴일에는 직전 스냅샷과 내용이 같으므로 1회 더 조회될 뿐).
+
+    Args:
+        now: 기준 시각 (기본: 현재)
+
+    Returns:
+        YYYYMMDD
+    """
+    day = (now or datetime.now(KST)).astimezone(KST).date()
+    while day.weekday() >= 5:
+        day -= timedelta(days=1)
+    return day.strftime("%Y%m%d")
+
+
+class StockSnapshot:
+    """거래일 키 기반 상장종목 스냅샷 파일"""
+
+    def __init__(self, path: Optional[str] = None, ttl_hours: Optional[float] = None):
+        """
+        초기화
+
+        Args:
+            path: 스냅샷 파일 경로 (기본: VALUEUP_STOCK_SNAPSHOT 또는 .valueup_state/stock_snapshot.json)
+            ttl_hours: 최대 사용 시간 (기본: VALUEUP_STOCK_SNAPSHOT_TTL_HOURS 또는 72)
+        """
+        self.path = path or os.environ.get('VALUEUP_STOCK_SNAPSHOT') or os.path.join(STATE_DIR, 'stock_snapshot.json')
+        if ttl_hours is None:
+            ttl_hours = float(os.environ.get('VALUEUP_STOCK_SNAPSHOT_TTL_HOURS', '72'))
+        self.ttl_seconds = ttl_hours * 3600
+
+    def load(self) -> Optional[Dict]:
+        """스냅샷 읽기 (없거나 손상되면 None)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or not data.get('listed'):
+            return None
+        return data
+
+    def is_fresh(self, data: Dict, trading_date: str) -> bool:
+        """
+        스냅샷을 그대로 써도 되는지 판정
+
+        Args:
+            data: load() 결과
+            trading_date: 현재 기준 거래일
+
+        Returns:
+            같은 거래일이고 TTL 이내면 True
+        """
+        age = time.time() - float(data.get('fetched_at', 0))
+        return data.get('trading_date') == trading_date and age < self.ttl_seconds
+
+    def save(
+        self,
+        listed: Dict[str, str],
+        trading_date: str,
+        source: str,
+        previous: Optional[Dict] = None
+    ) -> Dict:
+        """
+        새 상장종목 목록 저장 (이전 스냅샷의 이름 이력과 병합)
+
+        Args:
+            listed: {종목코드: 종목명}
+            trading_date: 기준 거래일
+            source: 조회 방식 (krx / pykrx)
+            previous: 이전 스냅샷 (이력 병합용)
+
+        Returns:
+            저장한 스냅샷
+        """
+        history: Dict[str, List[str]] = {
+            code: list(names) for code, names in ((previous or {}).get('history') or {}).items()
+        }
+        for code, name in listed.items():
+            names = history.setdefault(code, [])
+            if name in names:
+                names.remove(name)
+            names.insert(0, name)
+
+        data = {
+            'trading_date': trading_date,
+            'fetched_at': time.time(),
+            'source': source,
+            'listed': listed,
+            'history': history,
+        }
+
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            log(f"  [WARN] 종목 스냅샷 저장 실패: {e}")
+        return data
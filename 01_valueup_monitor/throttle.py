@@ -0,0 +1,103 @@
+"""
+요청 속도 제어 모듈
+KRX KIND 서버 부하를 고려한 호스트별 동시 접속 제한 + 토큰 버킷 페이싱
+
+사용법:
+    throttle = HostThrottle(max_per_host=3, requests_per_second=1.0)
+
+    async with throttle.slot(url):
+        await page.goto(url)
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """비동기 토큰 버킷 (초당 rate개 보충, 최대 capacity개 누적)"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        초기화
+
+        Args:
+            rate: 초당 보충 토큰 수 (0 이하면 제한 없음)
+            capacity: 최대 누적 토큰 수 (기본: max(1, rate))
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        """경과 시간만큼 토큰 보충"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """
+        토큰 획득 (부족하면 보충될 때까지 대기)
+
+        Args:
+            tokens: 필요한 토큰 수
+
+        Returns:
+            대기한 시간 (초)
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        waited = 0.0
+        # 대기 순서 보장을 위해 lock 안에서 대기
+        async with self._lock:
+            self._refill()
+            if self._tokens < tokens:
+                wait_time = (tokens - self._tokens) / self.rate
+                await asyncio.sleep(wait_time)
+                waited = wait_time
+                self._refill()
+            self._tokens -= tokens
+        return waited
+
+
+class HostThrottle:
+    """호스트별 동시 요청 수 제한 + 토큰 버킷 페이싱"""
+
+    def __init__(self, max_per_host: int = 3, requests_per_second: float = 1.0):
+        """
+        초기화
+
+        Args:
+            max_per_host: 호스트당 최대 동시 요청 수
+            requests_per_second: 호스트당 초당 요청 수 (0 이하면 페이싱 없음)
+        """
+        self.max_per_host = max(1, max_per_host)
+        self.requests_per_second = requests_per_second
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self.total_wait = 0.0  # 페이싱으로 대기한 누적 시간 (초)
+
+    def _host(self, url: str) -> str:
+        return urlparse(url).netloc or url
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """
+        요청 슬롯 획득 (호스트별 동시 접속 제한 + 페이싱)
+
+        Args:
+            url: 요청 URL (호스트 단위로 제한)
+        """
+        host = self._host(url)
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self.max_per_host)
+            self._buckets[host] = TokenBucket(self.requests_per_second)
+
+        async with self._semaphores[host]:
+            self.total_wait += await self._buckets[host].acquire()
+            yield